@@ -0,0 +1,43 @@
+import random
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import ui_package
+from ui_package import encode_file_content, decode_file_content
+
+# Sizes of the synthetic assets, in MiB (preact.js, images and fonts are
+# a few MiB each).
+asset_sizes = [1, 4, 16]
+
+def encode_file_content_per_byte(content):
+    # The encoder used before encode_file_content, kept as the baseline.
+    return " ".join(  [str(byte) for byte in bytearray(content)] )
+
+@pytest.fixture(scope="module", params=asset_sizes, ids=[f"{size}MiB" for size in asset_sizes])
+def asset(request):
+    return random.Random(request.param).randbytes(request.param * 1024 * 1024)
+
+def test_encode_file_content(benchmark, asset):
+    text = benchmark.pedantic(encode_file_content, args=(asset,), rounds=3, iterations=1)
+    assert text == encode_file_content_per_byte(asset)
+
+def test_encode_file_content_per_byte(benchmark, asset):
+    benchmark.pedantic(encode_file_content_per_byte, args=(asset,), rounds=3, iterations=1)
+
+@pytest.mark.parametrize("content", [b"", b"\x00", bytes(range(256)) * 3], ids=["empty", "zero", "every byte"])
+def test_encode_file_content_small(content):
+    assert encode_file_content(content) == encode_file_content_per_byte(content)
+
+@pytest.fixture(params=["numpy", "lookup"])
+def decoder(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(ui_package, "numpy", None)
+    return decode_file_content
+
+def test_decode_file_content(benchmark, asset, decoder):
+    text = encode_file_content(asset).encode("ascii")
+    content = benchmark.pedantic(decoder, args=(text,), rounds=3, iterations=1)
+    assert content == asset
@@ -0,0 +1,11 @@
+"""
+Benchmarks for the UI package builder. Needs pytest and pytest-benchmark:
+
+    python -m pytest Build/benchmarks
+"""
+
+import os
+import sys
+
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, os.path.join(benchmarks_path, ".."))
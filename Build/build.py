@@ -5,18 +5,102 @@ OVL Path Processor - Process .ovlpaths file and run ovl_tool_cmd.py for each ent
 
 import os
 import sys
+import json
+import hashlib
 import subprocess
 import argparse
 import ui_package as pkg
 from pathlib import Path
 
-def process_uipackages(manifest_dir : Path, ovl_path_line):
+# A manifest of every UI package's input files is kept here (relative to
+# Manifest.xml, outside every OVL folder), so unchanged packages are not
+# rebuilt.
+uipackage_cache_folder = ".uipackage_cache"
+uipackage_cache_version = 1
+hash_chunk_size = 1024 * 1024
+
+def get_file_hash(path):
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(hash_chunk_size):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def get_file_signature(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def get_uipackage_manifest(pkgfile : pkg.PPUIPkgFile, previous):
+    """
+    Describe the input files of a UI package, in packaging order.
+
+    Args:
+        pkgfile: The package, with its files imported but not written
+        previous: The manifest of the last build, or None
+
+    Returns:
+        The manifest. Hashes are reused from `previous` for files whose
+        size and mtime are unchanged.
+    """
+    previous_files = {entry[0]: entry for entry in previous["files"]} if previous else {}
+
+    files = []
+    for fileInfo in pkgfile.infolist():
+        size, mtime = get_file_signature(fileInfo.source)
+        entry = previous_files.get(fileInfo.name)
+        if entry is not None and entry[1:3] == [size, mtime]:
+            files.append(entry)
+        else:
+            files.append([fileInfo.name, size, mtime, get_file_hash(fileInfo.source)])
+
+    return {
+        "version": uipackage_cache_version,
+        # a new packager may write different output for the same files
+        "packager": get_file_hash(pkg.__file__),
+        "basic_path": pkgfile.basic,
+        "files": files
+    }
+
+def is_uipackage_unchanged(manifest, previous, uipackage_output : Path):
+    """
+    Check whether a UI package would be built exactly as it was last time,
+    and its output is still the file that was written then.
+    """
+    if previous is None or not uipackage_output.exists():
+        return False
+
+    def get_content(m):
+        return (
+            m.get("version"),
+            m.get("packager"),
+            m.get("basic_path"),
+            [(entry[0], entry[1], entry[3]) for entry in m.get("files", [])]
+        )
+
+    return get_content(manifest) == get_content(previous) and get_file_signature(uipackage_output) == previous.get("output")
+
+def read_uipackage_manifest(path : Path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_uipackage_manifest(path : Path, manifest):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+
+def process_uipackages(manifest_dir : Path, ovl_path_line, force=False):
     """
     Check for .uipackage file in the OVL directory and process UI packages.
+    Packages whose input files are unchanged since the last build (and
+    whose output is untouched) are skipped, unless `force` is set.
     
     Args:
         manifest_dir: Path to the directory containing Manifest.xml
         ovl_path_line: The path line from .ovlpaths (e.g., "./Main/Test")
+        force: If True, every UI package is rebuilt
     
     Returns:
         List of tuples containing (basis_path, uipackage_folder_path)
@@ -60,15 +144,31 @@ def process_uipackages(manifest_dir : Path, ovl_path_line):
 
         uipackage_output = ovl_dir / f"{uipackage_folder.name}.ppuipkg"
         basic_path = Path.relative_to(ovl_dir, ovldata_folder)
-        
-        with pkg.PPUIPkgFile(str(basic_path).replace("\\", "/"), str(uipackage_output)) as pkgfile:
-            pkgfile.importall(str(uipackage_folder))
-            pass
+        cache_path = manifest_dir / uipackage_cache_folder / f"{uipackage_output.relative_to(manifest_dir).as_posix().replace('/', '_')}.json"
+
+        # Importing only lists the files; nothing is read until the package is written.
+        pkgfile = pkg.PPUIPkgFile(str(basic_path).replace("\\", "/"), str(uipackage_output))
+        pkgfile.importall(str(uipackage_folder))
+
+        previous = None if force else read_uipackage_manifest(cache_path)
+        manifest = get_uipackage_manifest(pkgfile, previous)
+
+        if is_uipackage_unchanged(manifest, previous, uipackage_output):
+            print(f"     UI Package: {uipackage_output.name} is up to date. Skipping...")
+            # Keep refreshed mtimes, so touched files are not hashed again.
+            if manifest["files"] != previous["files"]:
+                manifest["output"] = previous["output"]
+                write_uipackage_manifest(cache_path, manifest)
+            continue
+
+        pkgfile.close()
+        manifest["output"] = get_file_signature(uipackage_output)
+        write_uipackage_manifest(cache_path, manifest)
     
     print(f"  Finished building UI packages...")
 
 
-def process_ovlpaths(cobra_tools_path, manifest_path):
+def process_ovlpaths(cobra_tools_path, manifest_path, force=False):
     """
     Process the .ovlpaths file relative to the Manifest.xml location
     and run ovl_tool_cmd.py for each path entry.
@@ -76,6 +176,7 @@ def process_ovlpaths(cobra_tools_path, manifest_path):
     Args:
         cobra_tools_path: Path to cobra tools
         manifest_path: Path to the Manifest.xml file
+        force: If True, UI packages are rebuilt even if unchanged
     """
     manifest_dir = Path(manifest_path).parent.resolve()
     
@@ -127,7 +228,7 @@ def process_ovlpaths(cobra_tools_path, manifest_path):
         print(f"  Input:  {input_path}")
         print(f"  Output: {output_path}")
 
-        process_uipackages(manifest_dir, line)
+        process_uipackages(manifest_dir, line, force)
 
         print(f"  Packaging OVL...")
         
@@ -198,6 +299,11 @@ def main():
         action="store_true",
         help="If present, Planet Coaster 2 will launch"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="If present, every UI package is rebuilt, even if its files are unchanged"
+    )
     
     args = parser.parse_args()
 
@@ -211,7 +317,7 @@ def main():
         print(f"Error: Manifest file not found: {manifest_path}", file=sys.stderr)
         sys.exit(1)
     
-    success = process_ovlpaths(cobra_tools_path, manifest_path)
+    success = process_ovlpaths(cobra_tools_path, manifest_path, args.force)
     if success:
         if args.launch:
             subprocess.run(['start', f"steam://rungameid/{2688950}"], shell=True, check=True)
@@ -0,0 +1,11 @@
+"""
+Tests for the UI package builder. Needs pytest:
+
+    python -m pytest Build/tests
+"""
+
+import os
+import sys
+
+tests_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, os.path.join(tests_path, ".."))
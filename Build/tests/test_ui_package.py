@@ -0,0 +1,112 @@
+import os
+import random
+import pytest
+
+import ui_package
+from ui_package import PPUIPkgFile, read_chunk_size
+
+basic_path = "Mod_ForgeUtils/Main"
+
+# Files of the synthetic UI folder, by path relative to it.
+ui_files = {
+    "index.html": b"<html><body>\"ForgeUtils\" & <co></body></html>\n",
+    "empty.txt": b"",
+    "every_byte.bin": bytes(range(256)) * 5,
+    "js/preact.js": random.Random(0).randbytes(read_chunk_size + 12345),
+    "img/icons/zero.png": b"\x00",
+}
+
+@pytest.fixture(params=["numpy", "lookup"])
+def decoder(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(ui_package, "numpy", None)
+    return request.param
+
+@pytest.fixture
+def ui_folder(tmp_path):
+    folder = tmp_path / "ui"
+    for name, content in ui_files.items():
+        path = folder / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    return folder
+
+@pytest.fixture
+def package_path(tmp_path, ui_folder):
+    path = tmp_path / "Main.ppuipkg"
+    pkgfile = PPUIPkgFile(basic_path, str(path))
+    pkgfile.importall(str(ui_folder))
+    pkgfile.close()
+    return path
+
+def _read_folder(folder):
+    files = {}
+    for root, _, names in os.walk(folder):
+        for name in names:
+            path = os.path.join(root, name)
+            with open(path, "rb") as f:
+                files[os.path.relpath(path, folder).replace("\\", "/")] = f.read()
+    return files
+
+def test_round_trip(package_path, tmp_path, decoder):
+    pkgfile = PPUIPkgFile.load(str(package_path))
+
+    assert pkgfile.basic == basic_path
+    assert sorted(pkgfile.namelist()) == sorted(ui_files)
+    for name, content in ui_files.items():
+        info = pkgfile.getinfo(name)
+        assert info.file_size == len(content)
+        assert info.content == content
+
+    out_folder = tmp_path / "extracted"
+    pkgfile.extractall(str(out_folder))
+    assert _read_folder(out_folder) == ui_files
+
+@pytest.mark.parametrize("size", [1, 2, 7, 1000])
+def test_iter_chunks_cuts_between_tokens(package_path, decoder, size):
+    # Small chunks of text end mid-token, and some hold no whole token.
+    pkgfile = PPUIPkgFile.load(str(package_path))
+    for name in ["index.html", "empty.txt", "every_byte.bin", "img/icons/zero.png"]:
+        chunks = list(pkgfile.getinfo(name).iter_chunks(size))
+        assert b"".join(chunks) == ui_files[name]
+        assert all(chunks)
+
+def test_extract_one_file(package_path, tmp_path, decoder):
+    pkgfile = PPUIPkgFile.load(str(package_path))
+    pkgfile.extract("js/preact.js", str(tmp_path / "one"))
+    assert _read_folder(tmp_path / "one") == {"js/preact.js": ui_files["js/preact.js"]}
+
+def test_load_does_not_rewrite_the_package(package_path):
+    written = package_path.read_bytes()
+    with PPUIPkgFile.load(str(package_path)):
+        pass
+    assert package_path.read_bytes() == written
+
+def test_rewritten_package_is_identical(package_path, tmp_path, decoder):
+    # A loaded package written again streams its content from the original.
+    copy_path = tmp_path / "Copy.ppuipkg"
+    loaded = PPUIPkgFile.load(str(package_path))
+    with PPUIPkgFile(loaded.basic, str(copy_path)) as pkgfile:
+        pkgfile.files = loaded.infolist()
+    assert copy_path.read_bytes() == package_path.read_bytes()
+
+@pytest.mark.parametrize("text", [b"256", b"299", b"300", b"999", b"1000", b"1 2 256 3", b"12a"])
+def test_decode_rejects_values_that_are_not_bytes(decoder, text):
+    with pytest.raises(ValueError):
+        ui_package.decode_file_content(text)
+
+def test_decode_every_byte_value(decoder):
+    text = " ".join(str(byte) for byte in range(256)).encode("ascii")
+    assert ui_package.decode_file_content(text) == bytes(range(256))
+
+def test_getinfo_missing_name(package_path):
+    pkgfile = PPUIPkgFile.load(str(package_path))
+    with pytest.raises(KeyError):
+        pkgfile.getinfo("missing.js")
+
+def test_is_ppuipkgfile(package_path, ui_folder):
+    assert PPUIPkgFile.is_ppuipkgfile(str(package_path))
+    assert not PPUIPkgFile.is_ppuipkgfile(str(ui_folder / "index.html"))
+    assert not PPUIPkgFile.is_ppuipkgfile(str(ui_folder / "missing.ppuipkg"))
@@ -5,31 +5,185 @@ This file packages multiple
 import os, io
 import argparse
 import xml.etree.ElementTree as ET 
+from xml.parsers import expat
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# file_content holds every byte as decimal text, separated by spaces.
+# The text of all 256 byte values is built once, so encoding is a table
+# lookup per byte, joined a chunk at a time to bound the temporary lists.
+byte_strings = [str(byte) for byte in range(256)]
+encode_chunk_size = 64 * 1024
+
+# Packaged files are streamed from disk this many bytes at a time, so only
+# one chunk of a file (and its text) is ever in memory.
+read_chunk_size = 1024 * 1024
+
+# Parsing the text back maps each decimal token to its byte. With numpy
+# the digits are combined for all tokens at once instead.
+decimal_bytes = {text.encode('ascii'): byte for byte, text in enumerate(byte_strings)}
+digit_bytes = b"0123456789"
+
+def encode_file_content(content):
+    """ encode bytes as file_content text
+    :param content: the bytes to encode
+    :return: the decimal values of the bytes, separated by spaces
+    """
+    view = memoryview(content)
+    return " ".join([
+        " ".join(map(byte_strings.__getitem__, view[start:start + encode_chunk_size]))
+        for start in range(0, len(view), encode_chunk_size)
+    ])
+
+# bytes allowed in file_content text: digits and whitespace
+numpy_text_bytes = None
+if numpy is not None:
+    numpy_text_bytes = numpy.zeros(256, bool)
+    numpy_text_bytes[list(digit_bytes + b" \t\r\n")] = True
+
+def _decode_file_content_numpy(text):
+    chars = numpy.frombuffer(text, numpy.uint8)
+    if numpy.bincount(chars, minlength=256)[~numpy_text_bytes].any():
+        raise ValueError("file_content holds something other than decimal bytes")
+
+    # tokens start where a digit follows a separator, and end where a
+    # separator follows a digit (the text is padded with separators)
+    digits = numpy.zeros(len(chars) + 2, bool)
+    numpy.greater_equal(chars, ord('0'), out=digits[1:-1])
+    starts = numpy.flatnonzero(digits[1:] > digits[:-1])
+    ends = numpy.flatnonzero(digits[:-1] > digits[1:])
+    lengths = ends - starts
+    if (lengths > 3).any():
+        raise ValueError("file_content holds a value above 255")
+
+    # digits are widened first: numpy 1.x keeps uint8 - int16 scalar as
+    # uint8, which would wrap around above 255
+    def digit(offset):
+        return chars[numpy.maximum(ends - offset, 0)].astype(numpy.int16) - ord('0')
+
+    values = digit(1)
+    values += numpy.where(lengths >= 2, digit(2), 0) * 10
+    values += numpy.where(lengths >= 3, digit(3), 0) * 100
+    if (values > 255).any():
+        raise ValueError("file_content holds a value above 255")
+
+    return values.astype(numpy.uint8).tobytes()
+
+def decode_file_content(text):
+    """ decode file_content text back to bytes
+    :param text: the decimal values of the bytes, separated by whitespace
+    :return: the bytes
+    """
+    if isinstance(text, str):
+        text = text.encode('ascii')
+    if numpy is not None:
+        return _decode_file_content_numpy(text)
+    try:
+        return bytes(map(decimal_bytes.__getitem__, text.split()))
+    except KeyError as e:
+        raise ValueError(f"file_content holds {e.args[0]!r}, which is not a decimal byte")
+
+def _iter_decoded_chunks(package, start, end, size):
+    # Decodes file_content text in place in a package, cutting each chunk
+    # of text after its last whole token.
+    with open(package, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        carry = b""
+        while remaining > 0:
+            text = carry + f.read(min(size, remaining))
+            remaining -= len(text) - len(carry)
+            if remaining <= 0:
+                cut = len(text)
+            else:
+                cut = len(text)
+                while cut > 0 and text[cut - 1] in digit_bytes:
+                    cut -= 1
+            carry = text[cut:]
+            chunk = decode_file_content(text[:cut])
+            if chunk:
+                yield chunk
 
 
 class PPUIPkgFileInfo():
 
-    def __init__(self, path, content):
+    def __init__(self, path, content=None, source=None, file_size=None, package=None, content_range=None):
         self.name = path
-        self.content = content
+        self._content = content
+        # file on disk holding the content, only read when needed
+        self.source = source
+        # or the package holding it, as file_content text at content_range
+        self.package = package
+        self.content_range = content_range
+        if file_size is None:
+            file_size = len(content) if content is not None else os.path.getsize(source)
+        self.file_size = file_size
+
+    @property
+    def content(self):
+        if self._content is not None:
+            return self._content
+        if self.package is not None:
+            return b"".join(self.iter_chunks())
+        with open(self.source, 'rb') as f:
+            return f.read()
 
     def read(self, count=None):
         return self.content
 
+    def iter_chunks(self, size=read_chunk_size):
+        """ read the content a chunk at a time
+        :param size: the most bytes per chunk
+        :return: iterator over the chunks of the content
+        """
+        if self._content is not None:
+            view = memoryview(self._content)
+            for start in range(0, len(view), size):
+                yield view[start:start + size]
+            return
+        if self.package is not None:
+            # size bytes of text decode to at most size / 2 bytes
+            yield from _iter_decoded_chunks(self.package, *self.content_range, size)
+            return
+        with open(self.source, 'rb') as f:
+            while True:
+                chunk = f.read(size)
+                if not chunk:
+                    return
+                yield chunk
+
     def close(self):
         pass
 
     def __str__(self):
-        return f"<PPUIPkgFileInfo name='{self.name}' file_size={len(self.content)}>"
+        return f"<PPUIPkgFileInfo name='{self.name}' file_size={self.file_size}>"
 
 
 class PPUIPkgFile():
 
-    def __init__(self, basic, path):
+    def __init__(self, basic, path, mode='w'):
         self.basic = basic#'Mod_ProTrack/Main'
         self.files = []
         self.icons = []
         self.path  = path
+        # 'r' for packages opened with load, which close leaves untouched
+        self.mode = mode
+        self._index = None
+
+    @classmethod
+    def load(cls, path):
+        """ open an existing package for reading
+        Only the names, sizes and content offsets of the files are read;
+        contents are decoded from the package when read or extracted.
+        :param path: package file path
+        :return: the package
+        """
+        package = cls(None, path, mode='r')
+        package._read_index()
+        return package
 
     def __enter__(self):
         return self
@@ -44,21 +198,55 @@ class PPUIPkgFile():
     def namelist(self):
         return [o.name for o in self.files]
 
+    def _get_index(self):
+        # name to file info, first file wins like the list scan it replaces
+        if self._index is None:
+            self._index = {}
+            for fileInfo in self.files:
+                self._index.setdefault(fileInfo.name, fileInfo)
+        return self._index
+
     def getinfo(self, path):
-        return [o for o in self.files if o.name == path][0]
-        pass
+        """ get a file of the package by name
+        :param path: file name
+        :return: the file info, raises KeyError if there is none
+        """
+        return self._get_index()[path]
 
-    def is_ppuipkgfile(self, path):
-        pass
+    @staticmethod
+    def is_ppuipkgfile(path):
+        """ check whether a file is a ppuipkg
+        :param path: file path
+        :return: True if the file starts with a PPUIPKGRoot element
+        """
+        try:
+            with open(path, 'rb') as f:
+                start = f.read(1024).lstrip()
+        except OSError:
+            return False
+        if start.startswith(b'<?xml'):
+            start = start[start.find(b'?>') + 2:].lstrip()
+        return start.startswith(b'<PPUIPKGRoot')
 
     def printdir(self):
-        pass
+        """ print a table of the files in the package """
+        print(f"{'File Name':<60} {'Size':>12}")
+        for fileInfo in self.files:
+            print(f"{fileInfo.name:<60} {fileInfo.file_size:>12d}")
 
     def remove(self, member):
         self.files.remove(member)
+        self._index = None
 
     def extract(self, member, path=None):
-        self._write_file(os.path.join(path, '.', member.name), member.content)
+        """ extract a file, streaming its content to disk
+        :param member: file name or info
+        :param path: folder to extract to, the working directory if None
+        """
+        if isinstance(member, str):
+            member = self.getinfo(member)
+        path = path if path is not None else os.getcwd()
+        self._write_file(os.path.join(path, '.', member.name), member.iter_chunks())
 
     def extractall(self, path=None):
         for f in self.infolist():
@@ -67,7 +255,7 @@ class PPUIPkgFile():
     def _write_file(self, path, content, overwrite = True):
         """ write  content to a file
         :param path: file path
-        :param content: the content to write
+        :param content: the content to write, or an iterator over its chunks
         :return: content of the file
         """ 
         if overwrite == False and os.path.exists(path):
@@ -78,8 +266,10 @@ class PPUIPkgFile():
             pass
         with open(path, 'wb') as f:
             #print(f"Creating {path}")
-            content = f.write(content)
-            f.close
+            if isinstance(content, (bytes, bytearray, memoryview)):
+                content = [content]
+            for chunk in content:
+                f.write(chunk)
             return
 
     def open(self, path, mode='r'):
@@ -91,11 +281,12 @@ class PPUIPkgFile():
 
     def write(self, name, path):
         name = name.replace("\\","/")
-        content = open(os.path.join(path, name), 'rb').read()
-        self.files.append(PPUIPkgFileInfo(name, content))
+        self.files.append(PPUIPkgFileInfo(name, source=os.path.join(path, name)))
+        self._index = None
 
     def close(self):
-        self._write_files(self.path)
+        if self.mode == 'w':
+            self._write_files(self.path)
 
     def importall(self, path=None):
         ppkfiles = self._get_file_list(path)
@@ -108,27 +299,123 @@ class PPUIPkgFile():
         return files
 
     def _write_files(self, name, path=None):
-        root = ET.Element('PPUIPKGRoot', 
-          {
-            'file_count': str(len(self.files)), 
-            'icondata_count': '0', 
-            'game' : "Planet Coaster 2" 
-          }
-        )
-        basic_path = ET.SubElement(root, 'basic_path')
-        basic_path.text = self.basic
-
-        files = ET.SubElement(root, 'files')
+        """ stream the package to a file
+        The XML is written as it is produced, exactly as ET.tostring would
+        write the whole tree, so only one chunk of one file is in memory.
+        :param name: package file path
+        """
+        with open(name, 'wb') as f:
+            f.write(
+                f'<PPUIPKGRoot file_count="{len(self.files)}" icondata_count="0" game="Planet Coaster 2">'.encode('ascii')
+            )
+            basic_path = ET.Element('basic_path')
+            basic_path.text = self.basic
+            f.write(ET.tostring(basic_path))
 
-        for fileInfo in self.files:
-            file_size = len(fileInfo.content)
-            file = ET.SubElement(files, 'ppuipkgfile', {'file_size' : str(file_size)})
-            filename = ET.SubElement(file, 'file_name')
-            filename.text = fileInfo.name.replace("\\","/")
-            filedata = ET.SubElement(file, 'file_content')
-            filedata.text = " ".join(  [str(byte) for byte in bytearray(fileInfo.content)] )
-
-        types = ET.SubElement(root, 'types')
-        f = open(name, 'wb')
-        f.write( ET.tostring(root) )
-        f.close()
\ No newline at end of file
+            f.write(b'<files>')
+            for fileInfo in self.files:
+                self._write_file_element(f, fileInfo)
+            f.write(b'</files>')
+
+            f.write(b'<types /></PPUIPKGRoot>')
+
+    def _write_file_element(self, f, fileInfo):
+        """ stream one ppuipkgfile element
+        :param f: package file
+        :param fileInfo: the file to write
+        """
+        f.write(f'<ppuipkgfile file_size="{fileInfo.file_size}">'.encode('ascii'))
+        filename = ET.Element('file_name')
+        filename.text = fileInfo.name.replace("\\","/")
+        f.write(ET.tostring(filename))
+
+        empty = True
+        for chunk in fileInfo.iter_chunks():
+            if len(chunk) == 0:
+                continue
+            f.write(b'<file_content>' if empty else b' ')
+            f.write(encode_file_content(chunk).encode('ascii'))
+            empty = False
+        f.write(b'<file_content />' if empty else b'</file_content>')
+
+        f.write(b'</ppuipkgfile>')
+
+    def _read_index(self):
+        """ index the files of the package at self.path
+        expat reports the byte offset of every tag, so the file_content
+        text is never handed to Python while indexing.
+        """
+        parser = expat.ParserCreate()
+        files = []
+        text = []
+        current = {}
+
+        def collect_text(data):
+            text.append(data)
+
+        def start_element(tag, attributes):
+            if tag == 'ppuipkgfile':
+                current.clear()
+                current['file_size'] = attributes.get('file_size')
+            elif tag in ('basic_path', 'file_name'):
+                text.clear()
+                parser.CharacterDataHandler = collect_text
+            elif tag == 'file_content':
+                current['start'] = parser.CurrentByteIndex
+
+        def end_element(tag):
+            if tag == 'basic_path':
+                parser.CharacterDataHandler = None
+                self.basic = "".join(text) if text else None
+            elif tag == 'file_name':
+                parser.CharacterDataHandler = None
+                current['name'] = "".join(text)
+            elif tag == 'file_content':
+                current['end'] = parser.CurrentByteIndex
+            elif tag == 'ppuipkgfile':
+                files.append(dict(current))
+
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        with open(self.path, 'rb') as f:
+            parser.ParseFile(f)
+
+            for entry in files:
+                content_range = (0, 0)
+                if 'start' in entry:
+                    # the text starts after the start tag, and there is
+                    # none if the tag is self-closing
+                    f.seek(entry['start'])
+                    tag = f.read(256)
+                    tag = tag[:tag.find(b'>') + 1]
+                    if not tag.endswith(b'/>'):
+                        content_range = (entry['start'] + len(tag), entry['end'])
+
+                self.files.append(PPUIPkgFileInfo(
+                    entry.get('name', ''),
+                    file_size=int(entry['file_size']),
+                    package=self.path,
+                    content_range=content_range
+                ))
+        self._index = None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="List or extract the files of a .ppuipkg UI package"
+    )
+    parser.add_argument("package", help="Path to the .ppuipkg")
+    parser.add_argument("-x", "--extract", metavar="FOLDER", help="Extract every file to this folder instead of listing them")
+    args = parser.parse_args()
+
+    if not PPUIPkgFile.is_ppuipkgfile(args.package):
+        parser.error(f"Not a ppuipkg: {args.package}")
+
+    with PPUIPkgFile.load(args.package) as package:
+        if args.extract:
+            package.extractall(args.extract)
+        else:
+            package.printdir()
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,7 @@ local global = _G
 local setmetatable = global.setmetatable
 local db = require("forgeutils.internal.database.TrackedRides")
 local check = require("forgeutils.check")
+local constants = require("forgeutils.internal.database.constants.TrackedRides")
 local logger = require("forgeutils.logger").Get("ElementData", "INFO")
 
 --- @class forgeutils.builders.database.element.ElementData
@@ -16,6 +17,7 @@ ElementData.LastNoOrderingId = -10000000
 function ElementData.hasErrors(elementData)
     local issues = false
     issues = check.IsNil("elementData.type", elementData.type) or issues
+    check.WarnIfNotInSet("elementData.type", elementData.type, constants.ElementTypes_Set)
     issues = check.IsNil("elementData.cost", elementData.cost) or issues
     issues = check.IsNil("elementData.disabledText", elementData.disabledText) or issues
     return issues
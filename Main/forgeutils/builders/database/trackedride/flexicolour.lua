@@ -2,6 +2,7 @@ local global = _G
 local setmetatable = global.setmetatable
 local db = require("forgeutils.internal.database.TrackedRides")
 local check = require("forgeutils.check")
+local constants = require("forgeutils.internal.database.constants.TrackedRides")
 
 --- @class forgeutils.builders.database.trackedride.Flexicolour
 local Flexicolour = {}
@@ -12,6 +13,7 @@ Flexicolour.__index = Flexicolour
 function Flexicolour.hasErrors(flexicolour)
     local issues = false
     issues = check.IsNil("flexicolour.semanticTag", flexicolour.semanticTag) or issues
+    check.WarnIfNotInSet("flexicolour.semanticTag", flexicolour.semanticTag, constants.FlexiColourSemanticTags_Set)
     issues = check.IsNil("flexicolour.materialCustomizationProviderSlot", flexicolour.materialCustomizationProviderSlot) or
         issues
     return issues
@@ -360,6 +360,9 @@ function TrackedRideBuilder:hasErrors()
 
     issues = check.IsNil("simulationData", self.simulationData) or issues
     issues = check.IsNil("rideData", self.rideData) or issues
+    if self.rideData ~= nil then
+        check.WarnIfNotInSet("rideData.class", self.rideData.class, constants.Classes_Set)
+    end
     issues = check.IsNil("browserEntry", self.browserEntry) or issues
     issues = check.IsEmpty("trains", self.trains) or issues
     for _, param in ipairs(self.rideParams) do
@@ -48,4 +48,19 @@ function Check.IsEmpty(valueName, value)
     return res
 end
 
+--- Helper function to report a value that is not one of a known set.
+--- Sets are the generated `_Set` tables of the database constants. Only a
+--- warning is logged, as mods can add values the set doesn't know about.
+--- @param valueName string The value name. Used in print outs.
+--- @param value any The value to validate. Nil values are not reported.
+--- @param set table<any, boolean> The known values.
+--- @return boolean correct Whether the check was true.
+function Check.WarnIfNotInSet(valueName, value, set)
+    local res = value ~= nil and set[value] ~= true
+    if res then
+        logger:Warn("Value \"" .. global.tostring(value) .. "\" of \"" .. valueName .. "\" is not a known value.")
+    end
+    return res
+end
+
 return Check
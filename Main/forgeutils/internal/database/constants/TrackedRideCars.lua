@@ -19,6 +19,18 @@ TrackedRideCars.WhichCars_Front = "Front"
 TrackedRideCars.WhichCars_Middle = "Middle"
 TrackedRideCars.WhichCars_Rear = "Rear"
 
+TrackedRideCars.WhichCars_Set = {
+    ["Front"] = true,
+    ["Middle"] = true,
+    ["Rear"] = true,
+}
+TrackedRideCars.WhichCars_Values = {
+    "Front",
+    "Middle",
+    "Rear",
+}
+TrackedRideCars.WhichCars_Count = 3
+
 ---
 --- Constants for: LuaScoringModules
 ---
@@ -34,6 +46,32 @@ TrackedRideCars.LuaScoringModules_PoweredTrackedRideScoring = "PoweredTrackedRid
 TrackedRideCars.LuaScoringModules_SwimsuitFlumeScoring = "SwimsuitFlumeScoring"
 TrackedRideCars.LuaScoringModules_TransportRideScoring = "TransportRideScoring"
 
+TrackedRideCars.LuaScoringModules_Set = {
+    ["CascadeScoring"] = true,
+    ["CoasterScoring"] = true,
+    ["DefaultScoring"] = true,
+    ["HuntsmanTrackedRideScoring"] = true,
+    ["LogFlumeScoring"] = true,
+    ["NonInvertedCoasterScoring"] = true,
+    ["NonInvertedCoasterScoringSlow"] = true,
+    ["PoweredTrackedRideScoring"] = true,
+    ["SwimsuitFlumeScoring"] = true,
+    ["TransportRideScoring"] = true,
+}
+TrackedRideCars.LuaScoringModules_Values = {
+    "CascadeScoring",
+    "CoasterScoring",
+    "DefaultScoring",
+    "HuntsmanTrackedRideScoring",
+    "LogFlumeScoring",
+    "NonInvertedCoasterScoring",
+    "NonInvertedCoasterScoringSlow",
+    "PoweredTrackedRideScoring",
+    "SwimsuitFlumeScoring",
+    "TransportRideScoring",
+}
+TrackedRideCars.LuaScoringModules_Count = 10
+
 ---
 --- Constants for: AudioChainLiftPrefixes
 ---
@@ -58,6 +96,50 @@ TrackedRideCars.AudioChainLiftPrefixes_Vector_InvertedBoom = "Vector_InvertedBoo
 TrackedRideCars.AudioChainLiftPrefixes_Water = "Water"
 TrackedRideCars.AudioChainLiftPrefixes_Wood = "Wood"
 
+TrackedRideCars.AudioChainLiftPrefixes_Set = {
+    ["BigM_WaterCoaster"] = true,
+    ["FWL"] = true,
+    ["FWL_Return"] = true,
+    ["Hunts"] = true,
+    ["Hyb"] = true,
+    ["Knot_GhostTrain"] = true,
+    ["MS_StarLoop"] = true,
+    ["Mse"] = true,
+    ["Mtl"] = true,
+    ["MtlHvy"] = true,
+    ["MtlVer"] = true,
+    ["Outa_SitDown"] = true,
+    ["Outa_Wing"] = true,
+    ["Slide"] = true,
+    ["SlideConveyor"] = true,
+    ["Trident"] = true,
+    ["Vector_InvertedBoom"] = true,
+    ["Water"] = true,
+    ["Wood"] = true,
+}
+TrackedRideCars.AudioChainLiftPrefixes_Values = {
+    "BigM_WaterCoaster",
+    "FWL",
+    "FWL_Return",
+    "Hunts",
+    "Hyb",
+    "Knot_GhostTrain",
+    "MS_StarLoop",
+    "Mse",
+    "Mtl",
+    "MtlHvy",
+    "MtlVer",
+    "Outa_SitDown",
+    "Outa_Wing",
+    "Slide",
+    "SlideConveyor",
+    "Trident",
+    "Vector_InvertedBoom",
+    "Water",
+    "Wood",
+}
+TrackedRideCars.AudioChainLiftPrefixes_Count = 19
+
 ---
 --- Constants for: AudioBrakePrefixes
 ---
@@ -68,4 +150,20 @@ TrackedRideCars.AudioBrakePrefixes_SFri = "SFri"
 TrackedRideCars.AudioBrakePrefixes_SlideBrake = "SlideBrake"
 TrackedRideCars.AudioBrakePrefixes_WdFr = "WdFr"
 
+TrackedRideCars.AudioBrakePrefixes_Set = {
+    ["Fri"] = true,
+    ["Mag"] = true,
+    ["SFri"] = true,
+    ["SlideBrake"] = true,
+    ["WdFr"] = true,
+}
+TrackedRideCars.AudioBrakePrefixes_Values = {
+    "Fri",
+    "Mag",
+    "SFri",
+    "SlideBrake",
+    "WdFr",
+}
+TrackedRideCars.AudioBrakePrefixes_Count = 5
+
 return TrackedRideCars
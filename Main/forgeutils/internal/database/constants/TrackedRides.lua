@@ -19,6 +19,18 @@ TrackedRides.Classes_Family = "Family"
 TrackedRides.Classes_Junior = "Junior"
 TrackedRides.Classes_Thrill = "Thrill"
 
+TrackedRides.Classes_Set = {
+    ["Family"] = true,
+    ["Junior"] = true,
+    ["Thrill"] = true,
+}
+TrackedRides.Classes_Values = {
+    "Family",
+    "Junior",
+    "Thrill",
+}
+TrackedRides.Classes_Count = 3
+
 ---
 --- Constants for: BrowserTooltips
 ---
@@ -46,6 +58,56 @@ TrackedRides.BrowserTooltips_TrackFeature_PoweredVehicle = "TrackFeature_Powered
 TrackedRides.BrowserTooltips_TrackFeature_StockCoasterCar = "TrackFeature_StockCoasterCar"
 TrackedRides.BrowserTooltips_TrackFeature_VerticalChainLiftAndLinearSyncronousMotor = "TrackFeature_VerticalChainLiftAndLinearSyncronousMotor"
 
+TrackedRides.BrowserTooltips_Set = {
+    ["TrackFeature_CableAndChainLift"] = true,
+    ["TrackFeature_CableDriven"] = true,
+    ["TrackFeature_CableLift"] = true,
+    ["TrackFeature_CanInvert"] = true,
+    ["TrackFeature_CanPartiallyInvert"] = true,
+    ["TrackFeature_CannotInvert"] = true,
+    ["TrackFeature_ChainLift"] = true,
+    ["TrackFeature_ChainLiftAndLinearInductionMotor"] = true,
+    ["TrackFeature_ChainandDriveTyreLift"] = true,
+    ["TrackFeature_ConveyerBeltLift"] = true,
+    ["TrackFeature_ForAdultsAndTeensOnly"] = true,
+    ["TrackFeature_ForEveryone"] = true,
+    ["TrackFeature_FrictionWheelLift"] = true,
+    ["TrackFeature_HydraulicLaunch"] = true,
+    ["TrackFeature_Interactive"] = true,
+    ["TrackFeature_LinearInductionMotor"] = true,
+    ["TrackFeature_LinearSyncronousMotor"] = true,
+    ["TrackFeature_PoweredCar"] = true,
+    ["TrackFeature_PoweredTrain"] = true,
+    ["TrackFeature_PoweredVehicle"] = true,
+    ["TrackFeature_StockCoasterCar"] = true,
+    ["TrackFeature_VerticalChainLiftAndLinearSyncronousMotor"] = true,
+}
+TrackedRides.BrowserTooltips_Values = {
+    "TrackFeature_CableAndChainLift",
+    "TrackFeature_CableDriven",
+    "TrackFeature_CableLift",
+    "TrackFeature_CanInvert",
+    "TrackFeature_CanPartiallyInvert",
+    "TrackFeature_CannotInvert",
+    "TrackFeature_ChainLift",
+    "TrackFeature_ChainLiftAndLinearInductionMotor",
+    "TrackFeature_ChainandDriveTyreLift",
+    "TrackFeature_ConveyerBeltLift",
+    "TrackFeature_ForAdultsAndTeensOnly",
+    "TrackFeature_ForEveryone",
+    "TrackFeature_FrictionWheelLift",
+    "TrackFeature_HydraulicLaunch",
+    "TrackFeature_Interactive",
+    "TrackFeature_LinearInductionMotor",
+    "TrackFeature_LinearSyncronousMotor",
+    "TrackFeature_PoweredCar",
+    "TrackFeature_PoweredTrain",
+    "TrackFeature_PoweredVehicle",
+    "TrackFeature_StockCoasterCar",
+    "TrackFeature_VerticalChainLiftAndLinearSyncronousMotor",
+}
+TrackedRides.BrowserTooltips_Count = 22
+
 ---
 --- Constants for: ElementParams
 ---
@@ -177,6 +239,264 @@ TrackedRides.ElementParams_UseAlternateCabinIcons = "UseAlternateCabinIcons"
 TrackedRides.ElementParams_UseChairliftSpline = "UseChairliftSpline"
 TrackedRides.ElementParams_WaitToReturnDelay = "WaitToReturnDelay"
 
+TrackedRides.ElementParams_Set = {
+    ["AllowedOnWater"] = true,
+    ["AltBoosterAcceleration"] = true,
+    ["AltBoosterAccelereration"] = true,
+    ["AltBoosterMaxSpeed"] = true,
+    ["AnimatedTrackBoostEnabled"] = true,
+    ["AnimatedTrackEndToStartAnimationType"] = true,
+    ["AnimatedTrackInitialDelay"] = true,
+    ["AnimatedTrackLaunchDelay"] = true,
+    ["AnimatedTrackPostDepartureDelay"] = true,
+    ["AnimatedTrackPrimaryPassCount"] = true,
+    ["AnimatedTrackSecondaryPassCount"] = true,
+    ["AnimatedTrackStartToEndAnimationType"] = true,
+    ["BackwardsBoosterAcceleration"] = true,
+    ["BackwardsBoosterMaxSpeed"] = true,
+    ["BankOnlyIntoTurns"] = true,
+    ["BankPivotRange"] = true,
+    ["BankingRangeDegrees"] = true,
+    ["BoosterAcceleration"] = true,
+    ["BoosterMaxSpeed"] = true,
+    ["BrakeDeceleration"] = true,
+    ["BrakeMinSpeed"] = true,
+    ["CabinAngle"] = true,
+    ["CabinAngleSet"] = true,
+    ["CabinPitch02"] = true,
+    ["CabinPitch02Set"] = true,
+    ["CabinRoll"] = true,
+    ["CabinRollSet"] = true,
+    ["CabinYaw"] = true,
+    ["CabinYawSet"] = true,
+    ["CarArrowOffset"] = true,
+    ["CatchOnReturnProportion"] = true,
+    ["CatwalkReliesOnSupports"] = true,
+    ["ChainLiftDropLocation"] = true,
+    ["ChainLiftSpeed"] = true,
+    ["CoasterStationLoadOnly"] = true,
+    ["CoasterStationUnloadOnly"] = true,
+    ["CurveRangeDegrees"] = true,
+    ["DefaultStationLength"] = true,
+    ["DefaultTimeBetweenDepartures"] = true,
+    ["DoWaterSpatialCheck"] = true,
+    ["DropSupports"] = true,
+    ["DualDirectionBrakeLap"] = true,
+    ["DynamicCabinHeightMax"] = true,
+    ["DynamicCabinHeightMin"] = true,
+    ["ECSDirection"] = true,
+    ["ECSSpeed"] = true,
+    ["FloatingCarMotionBobScale"] = true,
+    ["FloatingCarMotionRockScale"] = true,
+    ["FlumeBankHardSwingAngleOverride"] = true,
+    ["FlumeBankMaxSpinAngleOverride"] = true,
+    ["FlumeBankMaxSpinAngleOverrideStartDistance"] = true,
+    ["FlumeBankMaxSwingAngle"] = true,
+    ["FlumeBankSafeAngleLeft"] = true,
+    ["FlumeBankSafeAngleRight"] = true,
+    ["FlumeCabinMaxSlide"] = true,
+    ["FlumeCabinTargetUAxisSlide"] = true,
+    ["FlumeCabinTargetUAxisSlideEntryDistance"] = true,
+    ["FlumeCabinTargetUAxisSlideExitDistance"] = true,
+    ["FlumeDeformDisable"] = true,
+    ["FlumeForceJettisonAltRailIndex"] = true,
+    ["FlumeForceJettisonAtProp"] = true,
+    ["FlumePlacementOffsetY"] = true,
+    ["FlumePlacementOffsetZ"] = true,
+    ["FlumeStationEntranceOnly"] = true,
+    ["FlumeStationExitOnly"] = true,
+    ["GridSize"] = true,
+    ["HasTrackPathRibbons"] = true,
+    ["HiddenInStationList"] = true,
+    ["HideTrackHandles"] = true,
+    ["HideTrackPlacementHandles"] = true,
+    ["HoldingSectionMaxTime"] = true,
+    ["HoldingSectionMinTime"] = true,
+    ["HoldingSectionReleaseAcceleration"] = true,
+    ["HoldingSectionReleaseSpeed"] = true,
+    ["HoldingSectionStopLocation"] = true,
+    ["HoldingSectionStopLocationAlignment"] = true,
+    ["HoldingSectionStopLocationAlignmentAlt"] = true,
+    ["HydraulicLaunchAcceleration"] = true,
+    ["HydraulicLaunchCatchCarLocation"] = true,
+    ["HydraulicLaunchDelay"] = true,
+    ["HydraulicLaunchLauchSpeed"] = true,
+    ["HydraulicLaunchReleaseExtraDistance"] = true,
+    ["HydraulicLaunchReleaseProportion"] = true,
+    ["HydraulicLaunchReturnSpeed"] = true,
+    ["LengthRangeMetres"] = true,
+    ["LockSpinning"] = true,
+    ["MatchCarRotationToStationEnds"] = true,
+    ["MaxFlumeExitHorizontalVelocity"] = true,
+    ["MaxSpinRate"] = true,
+    ["NonStopStationSpeed"] = true,
+    ["OptionalBlockMode"] = true,
+    ["OptionalCatwalk"] = true,
+    ["ParadeEndStation"] = true,
+    ["ParadeStartStation"] = true,
+    ["PhotoSectionPhotoLocation"] = true,
+    ["PoweredTrainTrackSectionDecelerationStrengthOverride"] = true,
+    ["PoweredTrainTrackSectionSpeedOverride"] = true,
+    ["ReverseLaunchOverride"] = true,
+    ["RunoutLaneHeight"] = true,
+    ["RunoutLaneLength"] = true,
+    ["RunoutLaneWidth"] = true,
+    ["ScaleRange"] = true,
+    ["SlopeRangeDegrees"] = true,
+    ["SplitCatchCarOffset"] = true,
+    ["StationEndCapSize"] = true,
+    ["StationEntranceSide"] = true,
+    ["StationEntrySpeed"] = true,
+    ["StationExitSide"] = true,
+    ["StationExitSpeed"] = true,
+    ["StationFrontlLocationOverride"] = true,
+    ["StationHasNoAirgates"] = true,
+    ["StationPitch"] = true,
+    ["StationStopLocation"] = true,
+    ["StationWallInset"] = true,
+    ["StopAndHoldWaitTime"] = true,
+    ["SwapToDefaultWhenSlopedDown"] = true,
+    ["TrackMeshIndex"] = true,
+    ["TrackPathHeightOffset"] = true,
+    ["TrackPathRibbonSlopeHeight"] = true,
+    ["TrackPathRibbonsWidth"] = true,
+    ["TrackPathWidth"] = true,
+    ["TrackWidth"] = true,
+    ["TunnelRadius"] = true,
+    ["UseAlternateCabinIcons"] = true,
+    ["UseChairliftSpline"] = true,
+    ["WaitToReturnDelay"] = true,
+}
+TrackedRides.ElementParams_Values = {
+    "AllowedOnWater",
+    "AltBoosterAcceleration",
+    "AltBoosterAccelereration",
+    "AltBoosterMaxSpeed",
+    "AnimatedTrackBoostEnabled",
+    "AnimatedTrackEndToStartAnimationType",
+    "AnimatedTrackInitialDelay",
+    "AnimatedTrackLaunchDelay",
+    "AnimatedTrackPostDepartureDelay",
+    "AnimatedTrackPrimaryPassCount",
+    "AnimatedTrackSecondaryPassCount",
+    "AnimatedTrackStartToEndAnimationType",
+    "BackwardsBoosterAcceleration",
+    "BackwardsBoosterMaxSpeed",
+    "BankOnlyIntoTurns",
+    "BankPivotRange",
+    "BankingRangeDegrees",
+    "BoosterAcceleration",
+    "BoosterMaxSpeed",
+    "BrakeDeceleration",
+    "BrakeMinSpeed",
+    "CabinAngle",
+    "CabinAngleSet",
+    "CabinPitch02",
+    "CabinPitch02Set",
+    "CabinRoll",
+    "CabinRollSet",
+    "CabinYaw",
+    "CabinYawSet",
+    "CarArrowOffset",
+    "CatchOnReturnProportion",
+    "CatwalkReliesOnSupports",
+    "ChainLiftDropLocation",
+    "ChainLiftSpeed",
+    "CoasterStationLoadOnly",
+    "CoasterStationUnloadOnly",
+    "CurveRangeDegrees",
+    "DefaultStationLength",
+    "DefaultTimeBetweenDepartures",
+    "DoWaterSpatialCheck",
+    "DropSupports",
+    "DualDirectionBrakeLap",
+    "DynamicCabinHeightMax",
+    "DynamicCabinHeightMin",
+    "ECSDirection",
+    "ECSSpeed",
+    "FloatingCarMotionBobScale",
+    "FloatingCarMotionRockScale",
+    "FlumeBankHardSwingAngleOverride",
+    "FlumeBankMaxSpinAngleOverride",
+    "FlumeBankMaxSpinAngleOverrideStartDistance",
+    "FlumeBankMaxSwingAngle",
+    "FlumeBankSafeAngleLeft",
+    "FlumeBankSafeAngleRight",
+    "FlumeCabinMaxSlide",
+    "FlumeCabinTargetUAxisSlide",
+    "FlumeCabinTargetUAxisSlideEntryDistance",
+    "FlumeCabinTargetUAxisSlideExitDistance",
+    "FlumeDeformDisable",
+    "FlumeForceJettisonAltRailIndex",
+    "FlumeForceJettisonAtProp",
+    "FlumePlacementOffsetY",
+    "FlumePlacementOffsetZ",
+    "FlumeStationEntranceOnly",
+    "FlumeStationExitOnly",
+    "GridSize",
+    "HasTrackPathRibbons",
+    "HiddenInStationList",
+    "HideTrackHandles",
+    "HideTrackPlacementHandles",
+    "HoldingSectionMaxTime",
+    "HoldingSectionMinTime",
+    "HoldingSectionReleaseAcceleration",
+    "HoldingSectionReleaseSpeed",
+    "HoldingSectionStopLocation",
+    "HoldingSectionStopLocationAlignment",
+    "HoldingSectionStopLocationAlignmentAlt",
+    "HydraulicLaunchAcceleration",
+    "HydraulicLaunchCatchCarLocation",
+    "HydraulicLaunchDelay",
+    "HydraulicLaunchLauchSpeed",
+    "HydraulicLaunchReleaseExtraDistance",
+    "HydraulicLaunchReleaseProportion",
+    "HydraulicLaunchReturnSpeed",
+    "LengthRangeMetres",
+    "LockSpinning",
+    "MatchCarRotationToStationEnds",
+    "MaxFlumeExitHorizontalVelocity",
+    "MaxSpinRate",
+    "NonStopStationSpeed",
+    "OptionalBlockMode",
+    "OptionalCatwalk",
+    "ParadeEndStation",
+    "ParadeStartStation",
+    "PhotoSectionPhotoLocation",
+    "PoweredTrainTrackSectionDecelerationStrengthOverride",
+    "PoweredTrainTrackSectionSpeedOverride",
+    "ReverseLaunchOverride",
+    "RunoutLaneHeight",
+    "RunoutLaneLength",
+    "RunoutLaneWidth",
+    "ScaleRange",
+    "SlopeRangeDegrees",
+    "SplitCatchCarOffset",
+    "StationEndCapSize",
+    "StationEntranceSide",
+    "StationEntrySpeed",
+    "StationExitSide",
+    "StationExitSpeed",
+    "StationFrontlLocationOverride",
+    "StationHasNoAirgates",
+    "StationPitch",
+    "StationStopLocation",
+    "StationWallInset",
+    "StopAndHoldWaitTime",
+    "SwapToDefaultWhenSlopedDown",
+    "TrackMeshIndex",
+    "TrackPathHeightOffset",
+    "TrackPathRibbonSlopeHeight",
+    "TrackPathRibbonsWidth",
+    "TrackPathWidth",
+    "TrackWidth",
+    "TunnelRadius",
+    "UseAlternateCabinIcons",
+    "UseChairliftSpline",
+    "WaitToReturnDelay",
+}
+TrackedRides.ElementParams_Count = 126
+
 ---
 --- Constants for: MetadataTags
 ---
@@ -354,6 +674,356 @@ TrackedRides.MetadataTags_Water_Model_RaftFlume = "Water_Model_RaftFlume"
 TrackedRides.MetadataTags_Water_Model_RiverRapids = "Water_Model_RiverRapids"
 TrackedRides.MetadataTags_Water_Model_WideLogFlume = "Water_Model_WideLogFlume"
 
+TrackedRides.MetadataTags_Set = {
+    ["Coaster"] = true,
+    ["Coaster_Manufacturer_Anton"] = true,
+    ["Coaster_Manufacturer_BigMsRides"] = true,
+    ["Coaster_Manufacturer_CityPeninsula"] = true,
+    ["Coaster_Manufacturer_DartKinetics"] = true,
+    ["Coaster_Manufacturer_DeepSeaContinental"] = true,
+    ["Coaster_Manufacturer_EddieFunMitchell"] = true,
+    ["Coaster_Manufacturer_FDEnterprises"] = true,
+    ["Coaster_Manufacturer_FDVision"] = true,
+    ["Coaster_Manufacturer_FFInternational"] = true,
+    ["Coaster_Manufacturer_FNThrillerIndustries"] = true,
+    ["Coaster_Manufacturer_Giovanni"] = true,
+    ["Coaster_Manufacturer_GrandCoastersWorldwide"] = true,
+    ["Coaster_Manufacturer_HighPeaks"] = true,
+    ["Coaster_Manufacturer_JerryStLauer"] = true,
+    ["Coaster_Manufacturer_KHNorter"] = true,
+    ["Coaster_Manufacturer_KingdomIsle"] = true,
+    ["Coaster_Manufacturer_Knotted"] = true,
+    ["Coaster_Manufacturer_MovementConstruction"] = true,
+    ["Coaster_Manufacturer_MurphyRides"] = true,
+    ["Coaster_Manufacturer_MurphySon"] = true,
+    ["Coaster_Manufacturer_Outamax"] = true,
+    ["Coaster_Manufacturer_PearlRides"] = true,
+    ["Coaster_Manufacturer_Powa"] = true,
+    ["Coaster_Manufacturer_PremiumRides"] = true,
+    ["Coaster_Manufacturer_SadieInteractiveAttractions"] = true,
+    ["Coaster_Manufacturer_SwiftTransport"] = true,
+    ["Coaster_Manufacturer_ValaisNidwalden"] = true,
+    ["Coaster_Manufacturer_Vector"] = true,
+    ["Coaster_Manufacturer_Velocity"] = true,
+    ["Coaster_Manufacturer_WhitelakeAmusement"] = true,
+    ["Coaster_Manufacturer_Zephyr"] = true,
+    ["Coaster_Model_AcceleratorCoaster"] = true,
+    ["Coaster_Model_AntiqueWater"] = true,
+    ["Coaster_Model_Boomerang"] = true,
+    ["Coaster_Model_Buzzard"] = true,
+    ["Coaster_Model_ChildCoaster"] = true,
+    ["Coaster_Model_ChildCoasterReturn"] = true,
+    ["Coaster_Model_CrazyMouse"] = true,
+    ["Coaster_Model_Dive"] = true,
+    ["Coaster_Model_Floorless"] = true,
+    ["Coaster_Model_GiantInvertedBoomerang"] = true,
+    ["Coaster_Model_Impulsion"] = true,
+    ["Coaster_Model_Inverted2Seat"] = true,
+    ["Coaster_Model_Inverted4Seat"] = true,
+    ["Coaster_Model_InvertedFlying"] = true,
+    ["Coaster_Model_InvertingSuspended"] = true,
+    ["Coaster_Model_Junior"] = true,
+    ["Coaster_Model_KidCoaster"] = true,
+    ["Coaster_Model_LIMLaunchFamily"] = true,
+    ["Coaster_Model_LaunchedBeyond"] = true,
+    ["Coaster_Model_LaunchedHydraulic"] = true,
+    ["Coaster_Model_LaunchedLSM"] = true,
+    ["Coaster_Model_LaunchedPneumatic"] = true,
+    ["Coaster_Model_Limitless"] = true,
+    ["Coaster_Model_Looping"] = true,
+    ["Coaster_Model_LoopingShuttle"] = true,
+    ["Coaster_Model_LoopingSun"] = true,
+    ["Coaster_Model_MineTrain"] = true,
+    ["Coaster_Model_MultiverseFriction"] = true,
+    ["Coaster_Model_MultiverseLSM"] = true,
+    ["Coaster_Model_NarrowDropCoaster"] = true,
+    ["Coaster_Model_NewGenInvertingSuspended"] = true,
+    ["Coaster_Model_RaidCoaster"] = true,
+    ["Coaster_Model_ReturnMKII"] = true,
+    ["Coaster_Model_Rotating"] = true,
+    ["Coaster_Model_SingleRail"] = true,
+    ["Coaster_Model_SitDown4Seat"] = true,
+    ["Coaster_Model_SitDown6Seat"] = true,
+    ["Coaster_Model_SitDownLap"] = true,
+    ["Coaster_Model_SitDownOver"] = true,
+    ["Coaster_Model_Spinning"] = true,
+    ["Coaster_Model_SpinningWildMouse"] = true,
+    ["Coaster_Model_SplashCoaster"] = true,
+    ["Coaster_Model_Splashdown"] = true,
+    ["Coaster_Model_Standup"] = true,
+    ["Coaster_Model_StarLoop"] = true,
+    ["Coaster_Model_SteelLaunched"] = true,
+    ["Coaster_Model_SwingingMineTrain"] = true,
+    ["Coaster_Model_Tilt"] = true,
+    ["Coaster_Model_UltraSpin"] = true,
+    ["Coaster_Model_Water"] = true,
+    ["Coaster_Model_Wave"] = true,
+    ["Coaster_Model_Wing"] = true,
+    ["Coaster_Model_WingChainLift"] = true,
+    ["Coaster_Model_Wooden"] = true,
+    ["Coaster_Model_WoodenHybridSteelRail"] = true,
+    ["Coaster_Model_WoodenHybridSteelTop"] = true,
+    ["Coaster_Model_WoodenSideFriction"] = true,
+    ["Coaster_Model_WoodenWildMouse"] = true,
+    ["Coaster_Model_XDimension"] = true,
+    ["Filter_AgeGroup_AllAges"] = true,
+    ["Filter_AgeGroup_TeenAdult"] = true,
+    ["Filter_Invert_CanInvert"] = true,
+    ["Filter_Invert_NonInvert"] = true,
+    ["Filter_Invert_PartInvert"] = true,
+    ["Filter_Invert_TrackInvert"] = true,
+    ["Filter_PDLC_1"] = true,
+    ["Filter_PDLC_2"] = true,
+    ["Filter_PDLC_None"] = true,
+    ["Filter_PDLC_ParadesArcades"] = true,
+    ["Filter_PDLC_Sorcery"] = true,
+    ["Filter_PDLC_ThrillSeekersRidePack"] = true,
+    ["Filter_PDLC_Toybox"] = true,
+    ["Filter_Propulsion_CableDriven"] = true,
+    ["Filter_Propulsion_CableLift"] = true,
+    ["Filter_Propulsion_ChainLift"] = true,
+    ["Filter_Propulsion_ConveyerBeltLift"] = true,
+    ["Filter_Propulsion_FrictionWheelLaunch"] = true,
+    ["Filter_Propulsion_FrictionWheelLift"] = true,
+    ["Filter_Propulsion_HydraulicLaunch"] = true,
+    ["Filter_Propulsion_LIM"] = true,
+    ["Filter_Propulsion_LSM"] = true,
+    ["Filter_Propulsion_PneumaticLaunch"] = true,
+    ["Filter_Propulsion_PoweredCar"] = true,
+    ["Filter_Propulsion_PoweredTrain"] = true,
+    ["Filter_Propulsion_PoweredVehicle"] = true,
+    ["Filter_Propulsion_ReverseStart"] = true,
+    ["Filter_Propulsion_ShuttleLaunch"] = true,
+    ["Filter_Propulsion_VerChainLift"] = true,
+    ["Menu_Coaster_AlternateLift"] = true,
+    ["Menu_Coaster_ChainLift"] = true,
+    ["Menu_Coaster_Launched"] = true,
+    ["Menu_Coaster_Special"] = true,
+    ["Menu_Coaster_Suspended"] = true,
+    ["Menu_Coaster_Water"] = true,
+    ["Menu_Coaster_Wing"] = true,
+    ["Menu_Coaster_Wooden"] = true,
+    ["Menu_Flume_FlumePlatform"] = true,
+    ["Menu_Flume_FlumeShared"] = true,
+    ["Menu_Flume_FlumeSingle"] = true,
+    ["Menu_Flume_WaterSlide"] = true,
+    ["Menu_Pool_Beaches"] = true,
+    ["Menu_Pool_LazyRivers"] = true,
+    ["Menu_Pool_SwimmingPools"] = true,
+    ["Menu_Pool_WavePools"] = true,
+    ["Menu_TrackedRide_Powered"] = true,
+    ["Menu_TrackedRide_Special"] = true,
+    ["Menu_TrackedRide_Water"] = true,
+    ["Powered"] = true,
+    ["Powered_Model_AntiquePoweredCars"] = true,
+    ["Powered_Model_FamilyTrain"] = true,
+    ["Powered_Model_GhostTrain"] = true,
+    ["Powered_Model_GoKart"] = true,
+    ["Powered_Model_PoweredAutomated"] = true,
+    ["Powered_Model_PoweredRotating"] = true,
+    ["Powered_Model_QuickDraw"] = true,
+    ["Powered_Model_SitDownPowered4Seat"] = true,
+    ["Tag_CustomisableCar"] = true,
+    ["Tag_InteractiveRide"] = true,
+    ["TrackedRide"] = true,
+    ["Transport"] = true,
+    ["Transport_Model_CableCar"] = true,
+    ["Transport_Model_Monorail"] = true,
+    ["Transport_Model_SingleDeckerBus"] = true,
+    ["Transport_Model_SteamBoat"] = true,
+    ["Transport_Model_SteamTrain"] = true,
+    ["Type_TrackedRide_Coaster"] = true,
+    ["Type_TrackedRide_Pools"] = true,
+    ["Type_TrackedRide_TrackedRide"] = true,
+    ["Type_TrackedRide_Transport"] = true,
+    ["Water"] = true,
+    ["Water_BodySlideWide"] = true,
+    ["Water_Model_BodyFlume"] = true,
+    ["Water_Model_BodySlide"] = true,
+    ["Water_Model_InnerTubeFlume"] = true,
+    ["Water_Model_InnerTubeFlumeDouble"] = true,
+    ["Water_Model_MatFlume"] = true,
+    ["Water_Model_NarrowLogFlume"] = true,
+    ["Water_Model_RaftFlume"] = true,
+    ["Water_Model_RiverRapids"] = true,
+    ["Water_Model_WideLogFlume"] = true,
+}
+TrackedRides.MetadataTags_Values = {
+    "Coaster",
+    "Coaster_Manufacturer_Anton",
+    "Coaster_Manufacturer_BigMsRides",
+    "Coaster_Manufacturer_CityPeninsula",
+    "Coaster_Manufacturer_DartKinetics",
+    "Coaster_Manufacturer_DeepSeaContinental",
+    "Coaster_Manufacturer_EddieFunMitchell",
+    "Coaster_Manufacturer_FDEnterprises",
+    "Coaster_Manufacturer_FDVision",
+    "Coaster_Manufacturer_FFInternational",
+    "Coaster_Manufacturer_FNThrillerIndustries",
+    "Coaster_Manufacturer_Giovanni",
+    "Coaster_Manufacturer_GrandCoastersWorldwide",
+    "Coaster_Manufacturer_HighPeaks",
+    "Coaster_Manufacturer_JerryStLauer",
+    "Coaster_Manufacturer_KHNorter",
+    "Coaster_Manufacturer_KingdomIsle",
+    "Coaster_Manufacturer_Knotted",
+    "Coaster_Manufacturer_MovementConstruction",
+    "Coaster_Manufacturer_MurphyRides",
+    "Coaster_Manufacturer_MurphySon",
+    "Coaster_Manufacturer_Outamax",
+    "Coaster_Manufacturer_PearlRides",
+    "Coaster_Manufacturer_Powa",
+    "Coaster_Manufacturer_PremiumRides",
+    "Coaster_Manufacturer_SadieInteractiveAttractions",
+    "Coaster_Manufacturer_SwiftTransport",
+    "Coaster_Manufacturer_ValaisNidwalden",
+    "Coaster_Manufacturer_Vector",
+    "Coaster_Manufacturer_Velocity",
+    "Coaster_Manufacturer_WhitelakeAmusement",
+    "Coaster_Manufacturer_Zephyr",
+    "Coaster_Model_AcceleratorCoaster",
+    "Coaster_Model_AntiqueWater",
+    "Coaster_Model_Boomerang",
+    "Coaster_Model_Buzzard",
+    "Coaster_Model_ChildCoaster",
+    "Coaster_Model_ChildCoasterReturn",
+    "Coaster_Model_CrazyMouse",
+    "Coaster_Model_Dive",
+    "Coaster_Model_Floorless",
+    "Coaster_Model_GiantInvertedBoomerang",
+    "Coaster_Model_Impulsion",
+    "Coaster_Model_Inverted2Seat",
+    "Coaster_Model_Inverted4Seat",
+    "Coaster_Model_InvertedFlying",
+    "Coaster_Model_InvertingSuspended",
+    "Coaster_Model_Junior",
+    "Coaster_Model_KidCoaster",
+    "Coaster_Model_LIMLaunchFamily",
+    "Coaster_Model_LaunchedBeyond",
+    "Coaster_Model_LaunchedHydraulic",
+    "Coaster_Model_LaunchedLSM",
+    "Coaster_Model_LaunchedPneumatic",
+    "Coaster_Model_Limitless",
+    "Coaster_Model_Looping",
+    "Coaster_Model_LoopingShuttle",
+    "Coaster_Model_LoopingSun",
+    "Coaster_Model_MineTrain",
+    "Coaster_Model_MultiverseFriction",
+    "Coaster_Model_MultiverseLSM",
+    "Coaster_Model_NarrowDropCoaster",
+    "Coaster_Model_NewGenInvertingSuspended",
+    "Coaster_Model_RaidCoaster",
+    "Coaster_Model_ReturnMKII",
+    "Coaster_Model_Rotating",
+    "Coaster_Model_SingleRail",
+    "Coaster_Model_SitDown4Seat",
+    "Coaster_Model_SitDown6Seat",
+    "Coaster_Model_SitDownLap",
+    "Coaster_Model_SitDownOver",
+    "Coaster_Model_Spinning",
+    "Coaster_Model_SpinningWildMouse",
+    "Coaster_Model_SplashCoaster",
+    "Coaster_Model_Splashdown",
+    "Coaster_Model_Standup",
+    "Coaster_Model_StarLoop",
+    "Coaster_Model_SteelLaunched",
+    "Coaster_Model_SwingingMineTrain",
+    "Coaster_Model_Tilt",
+    "Coaster_Model_UltraSpin",
+    "Coaster_Model_Water",
+    "Coaster_Model_Wave",
+    "Coaster_Model_Wing",
+    "Coaster_Model_WingChainLift",
+    "Coaster_Model_Wooden",
+    "Coaster_Model_WoodenHybridSteelRail",
+    "Coaster_Model_WoodenHybridSteelTop",
+    "Coaster_Model_WoodenSideFriction",
+    "Coaster_Model_WoodenWildMouse",
+    "Coaster_Model_XDimension",
+    "Filter_AgeGroup_AllAges",
+    "Filter_AgeGroup_TeenAdult",
+    "Filter_Invert_CanInvert",
+    "Filter_Invert_NonInvert",
+    "Filter_Invert_PartInvert",
+    "Filter_Invert_TrackInvert",
+    "Filter_PDLC_1",
+    "Filter_PDLC_2",
+    "Filter_PDLC_None",
+    "Filter_PDLC_ParadesArcades",
+    "Filter_PDLC_Sorcery",
+    "Filter_PDLC_ThrillSeekersRidePack",
+    "Filter_PDLC_Toybox",
+    "Filter_Propulsion_CableDriven",
+    "Filter_Propulsion_CableLift",
+    "Filter_Propulsion_ChainLift",
+    "Filter_Propulsion_ConveyerBeltLift",
+    "Filter_Propulsion_FrictionWheelLaunch",
+    "Filter_Propulsion_FrictionWheelLift",
+    "Filter_Propulsion_HydraulicLaunch",
+    "Filter_Propulsion_LIM",
+    "Filter_Propulsion_LSM",
+    "Filter_Propulsion_PneumaticLaunch",
+    "Filter_Propulsion_PoweredCar",
+    "Filter_Propulsion_PoweredTrain",
+    "Filter_Propulsion_PoweredVehicle",
+    "Filter_Propulsion_ReverseStart",
+    "Filter_Propulsion_ShuttleLaunch",
+    "Filter_Propulsion_VerChainLift",
+    "Menu_Coaster_AlternateLift",
+    "Menu_Coaster_ChainLift",
+    "Menu_Coaster_Launched",
+    "Menu_Coaster_Special",
+    "Menu_Coaster_Suspended",
+    "Menu_Coaster_Water",
+    "Menu_Coaster_Wing",
+    "Menu_Coaster_Wooden",
+    "Menu_Flume_FlumePlatform",
+    "Menu_Flume_FlumeShared",
+    "Menu_Flume_FlumeSingle",
+    "Menu_Flume_WaterSlide",
+    "Menu_Pool_Beaches",
+    "Menu_Pool_LazyRivers",
+    "Menu_Pool_SwimmingPools",
+    "Menu_Pool_WavePools",
+    "Menu_TrackedRide_Powered",
+    "Menu_TrackedRide_Special",
+    "Menu_TrackedRide_Water",
+    "Powered",
+    "Powered_Model_AntiquePoweredCars",
+    "Powered_Model_FamilyTrain",
+    "Powered_Model_GhostTrain",
+    "Powered_Model_GoKart",
+    "Powered_Model_PoweredAutomated",
+    "Powered_Model_PoweredRotating",
+    "Powered_Model_QuickDraw",
+    "Powered_Model_SitDownPowered4Seat",
+    "Tag_CustomisableCar",
+    "Tag_InteractiveRide",
+    "TrackedRide",
+    "Transport",
+    "Transport_Model_CableCar",
+    "Transport_Model_Monorail",
+    "Transport_Model_SingleDeckerBus",
+    "Transport_Model_SteamBoat",
+    "Transport_Model_SteamTrain",
+    "Type_TrackedRide_Coaster",
+    "Type_TrackedRide_Pools",
+    "Type_TrackedRide_TrackedRide",
+    "Type_TrackedRide_Transport",
+    "Water",
+    "Water_BodySlideWide",
+    "Water_Model_BodyFlume",
+    "Water_Model_BodySlide",
+    "Water_Model_InnerTubeFlume",
+    "Water_Model_InnerTubeFlumeDouble",
+    "Water_Model_MatFlume",
+    "Water_Model_NarrowLogFlume",
+    "Water_Model_RaftFlume",
+    "Water_Model_RiverRapids",
+    "Water_Model_WideLogFlume",
+}
+TrackedRides.MetadataTags_Count = 172
+
 ---
 --- Constants for: FlexiColourSemanticTags
 ---
@@ -368,6 +1038,30 @@ TrackedRides.FlexiColourSemanticTags_Track2 = "Track2"
 TrackedRides.FlexiColourSemanticTags_Track3 = "Track3"
 TrackedRides.FlexiColourSemanticTags_Track4 = "Track4"
 
+TrackedRides.FlexiColourSemanticTags_Set = {
+    ["Flume001"] = true,
+    ["Flume002"] = true,
+    ["Flume003"] = true,
+    ["Flume004"] = true,
+    ["Supports"] = true,
+    ["Track1"] = true,
+    ["Track2"] = true,
+    ["Track3"] = true,
+    ["Track4"] = true,
+}
+TrackedRides.FlexiColourSemanticTags_Values = {
+    "Flume001",
+    "Flume002",
+    "Flume003",
+    "Flume004",
+    "Supports",
+    "Track1",
+    "Track2",
+    "Track3",
+    "Track4",
+}
+TrackedRides.FlexiColourSemanticTags_Count = 9
+
 ---
 --- Constants for: ElementDisabledTexts
 ---
@@ -405,6 +1099,76 @@ TrackedRides.ElementDisabledTexts_TrackElementDisabled_GiantInvertedBoomerang_Ca
 TrackedRides.ElementDisabledTexts_TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceBehindReverseStart = "TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceBehindReverseStart"
 TrackedRides.ElementDisabledTexts_TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceBehindStation = "TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceBehindStation"
 
+TrackedRides.ElementDisabledTexts_Set = {
+    ["TrackElementDisabled_Boomerang_CanOnlyPlaceAfterBottom"] = true,
+    ["TrackElementDisabled_Boomerang_CanOnlyPlaceAfterMid"] = true,
+    ["TrackElementDisabled_Boomerang_CanOnlyPlaceAfterStart"] = true,
+    ["TrackElementDisabled_Boomerang_CanOnlyPlaceAfterStation"] = true,
+    ["TrackElementDisabled_Boomerang_CanOnlyPlaceBehindReverseBottom"] = true,
+    ["TrackElementDisabled_Boomerang_CanOnlyPlaceBehindReverseMid"] = true,
+    ["TrackElementDisabled_Boomerang_CanOnlyPlaceBehindReverseStart"] = true,
+    ["TrackElementDisabled_Boomerang_CanOnlyPlaceBehindStation"] = true,
+    ["TrackElementDisabled_BullWheel"] = true,
+    ["TrackElementDisabled_CanOnlyPlaceAfterChainLiftStart"] = true,
+    ["TrackElementDisabled_CanOnlyPlaceAfterChainLiftStartOrMidSection"] = true,
+    ["TrackElementDisabled_CanOnlyPlaceNextToStationOfSameType"] = true,
+    ["TrackElementDisabled_CannotPlace"] = true,
+    ["TrackElementDisabled_CannotPlaceBobsledHalfpipe"] = true,
+    ["TrackElementDisabled_CannotPlaceBobsledTransfer"] = true,
+    ["TrackElementDisabled_CannotPlaceOnBanked"] = true,
+    ["TrackElementDisabled_CannotPlaceOnBankedOrSloped"] = true,
+    ["TrackElementDisabled_CannotPlaceOnCurvedOrBanked"] = true,
+    ["TrackElementDisabled_CannotPlaceOnCurvedOrBankedOrOverlySloped"] = true,
+    ["TrackElementDisabled_CannotPlaceOnCurvedOrBankedOrSloped"] = true,
+    ["TrackElementDisabled_CannotPlaceOnCurvedOrBankedOrUpwardSloped"] = true,
+    ["TrackElementDisabled_DriveWheel"] = true,
+    ["TrackElementDisabled_FrictionWheelLiftAndDropReverse_CanOnlyPlaceBehindStation"] = true,
+    ["TrackElementDisabled_FrictionWheelLiftAndDrop_CanOnlyPlaceAfterStation"] = true,
+    ["TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceAfterBottom"] = true,
+    ["TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceAfterMid"] = true,
+    ["TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceAfterStart"] = true,
+    ["TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceAfterStation"] = true,
+    ["TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceBehindReverseBottom"] = true,
+    ["TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceBehindReverseMid"] = true,
+    ["TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceBehindReverseStart"] = true,
+    ["TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceBehindStation"] = true,
+}
+TrackedRides.ElementDisabledTexts_Values = {
+    "TrackElementDisabled_Boomerang_CanOnlyPlaceAfterBottom",
+    "TrackElementDisabled_Boomerang_CanOnlyPlaceAfterMid",
+    "TrackElementDisabled_Boomerang_CanOnlyPlaceAfterStart",
+    "TrackElementDisabled_Boomerang_CanOnlyPlaceAfterStation",
+    "TrackElementDisabled_Boomerang_CanOnlyPlaceBehindReverseBottom",
+    "TrackElementDisabled_Boomerang_CanOnlyPlaceBehindReverseMid",
+    "TrackElementDisabled_Boomerang_CanOnlyPlaceBehindReverseStart",
+    "TrackElementDisabled_Boomerang_CanOnlyPlaceBehindStation",
+    "TrackElementDisabled_BullWheel",
+    "TrackElementDisabled_CanOnlyPlaceAfterChainLiftStart",
+    "TrackElementDisabled_CanOnlyPlaceAfterChainLiftStartOrMidSection",
+    "TrackElementDisabled_CanOnlyPlaceNextToStationOfSameType",
+    "TrackElementDisabled_CannotPlace",
+    "TrackElementDisabled_CannotPlaceBobsledHalfpipe",
+    "TrackElementDisabled_CannotPlaceBobsledTransfer",
+    "TrackElementDisabled_CannotPlaceOnBanked",
+    "TrackElementDisabled_CannotPlaceOnBankedOrSloped",
+    "TrackElementDisabled_CannotPlaceOnCurvedOrBanked",
+    "TrackElementDisabled_CannotPlaceOnCurvedOrBankedOrOverlySloped",
+    "TrackElementDisabled_CannotPlaceOnCurvedOrBankedOrSloped",
+    "TrackElementDisabled_CannotPlaceOnCurvedOrBankedOrUpwardSloped",
+    "TrackElementDisabled_DriveWheel",
+    "TrackElementDisabled_FrictionWheelLiftAndDropReverse_CanOnlyPlaceBehindStation",
+    "TrackElementDisabled_FrictionWheelLiftAndDrop_CanOnlyPlaceAfterStation",
+    "TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceAfterBottom",
+    "TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceAfterMid",
+    "TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceAfterStart",
+    "TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceAfterStation",
+    "TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceBehindReverseBottom",
+    "TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceBehindReverseMid",
+    "TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceBehindReverseStart",
+    "TrackElementDisabled_GiantInvertedBoomerang_CanOnlyPlaceBehindStation",
+}
+TrackedRides.ElementDisabledTexts_Count = 32
+
 ---
 --- Constants for: ElementTypes
 ---
@@ -420,4 +1184,30 @@ TrackedRides.ElementTypes_Start = "Start"
 TrackedRides.ElementTypes_Station = "Station"
 TrackedRides.ElementTypes_Utilities = "Utilities"
 
+TrackedRides.ElementTypes_Set = {
+    ["End"] = true,
+    ["Flumes"] = true,
+    ["Loops"] = true,
+    ["NonInverted"] = true,
+    ["Rolls"] = true,
+    ["SharedFlumePlatform"] = true,
+    ["Specials"] = true,
+    ["Start"] = true,
+    ["Station"] = true,
+    ["Utilities"] = true,
+}
+TrackedRides.ElementTypes_Values = {
+    "End",
+    "Flumes",
+    "Loops",
+    "NonInverted",
+    "Rolls",
+    "SharedFlumePlatform",
+    "Specials",
+    "Start",
+    "Station",
+    "Utilities",
+}
+TrackedRides.ElementTypes_Count = 10
+
 return TrackedRides
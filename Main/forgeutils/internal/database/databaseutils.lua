@@ -4,6 +4,8 @@ local api = global.api
 local type = global.type
 local table = global.table
 local tostring = global.tostring
+local pcall = global.pcall
+local error = global.error
 local database = api.database
 local trainutils = require("forgeutils.prefabs.train")
 
@@ -12,6 +14,39 @@ local logger = require("forgeutils.logger").Get("DatabaseUtils")
 ---@class forgeutils.internal.database.DatabaseUtils
 local DatabaseUtils = {}
 
+--- Prepared statement instances cached per database while a write scope is open.
+---@type table<string, table<string, any>>
+local tWriteScopes = {}
+
+---@param databaseName string
+---@param queryName string
+---@param args any[]
+---@param num integer
+---@return any|nil cPSInstance
+local function GetStatementInstance(databaseName, queryName, args, num)
+    local tScope = tWriteScopes[databaseName]
+    if tScope == nil then
+        return database.GetPreparedStatementInstance(databaseName, queryName)
+    end
+
+    -- A reused instance keeps its earlier bindings, and nil arguments are
+    -- left unbound, so only reuse it if every parameter is bound again.
+    local bAllBound = true
+    for i = 1, num do
+        if args[i] == nil then
+            bAllBound = false
+            break
+        end
+    end
+
+    local cPSInstance = tScope[queryName]
+    if cPSInstance == nil or not bAllBound then
+        cPSInstance = database.GetPreparedStatementInstance(databaseName, queryName)
+        tScope[queryName] = cPSInstance
+    end
+    return cPSInstance
+end
+
 --- Exceutes any Prepared Statement query for database modifications.
 ---@param databaseName string The database to execute the query on.
 ---@param queryName string The SQL PCStatement to use to query.
@@ -21,49 +56,98 @@ local DatabaseUtils = {}
 function DatabaseUtils.ExecuteQuery(databaseName, queryName, args, numArgs)
     local num = numArgs ~= nil and numArgs or #args
 
-    logger:DebugQuery("Executing query on " .. databaseName .. ": " .. queryName)
-    logger:DebugQuery("Args:")
-    if num > 0 then
+    -- Log strings are only built if they will be printed.
+    local bLogQueries = logger:IsLevelEnabled("DEBUG_QUERY")
+    if bLogQueries then
+        logger:DebugQuery("Executing query on " .. databaseName .. ": " .. queryName)
+        logger:DebugQuery("Args:")
         for i = 1, num do
-            local v = args[i]
-            logger:DebugQuery(" - [" .. i .. "] = " .. tostring(v))
+            logger:DebugQuery(" - [" .. i .. "] = " .. tostring(args[i]))
         end
     end
 
+    -- Inside a write scope the database is already writable.
+    local bInScope = tWriteScopes[databaseName] ~= nil
+
     local result = nil
-    database.SetReadOnly(databaseName, false)
-    local cPSInstance = database.GetPreparedStatementInstance(databaseName, queryName)
+    if not bInScope then
+        database.SetReadOnly(databaseName, false)
+    end
+    local cPSInstance = GetStatementInstance(databaseName, queryName, args, num)
     if cPSInstance ~= nil then
-        logger:DebugQuery("[" .. queryName .. "] SQL Query start")
-        if num > 0 then
-            for i = 1, num do
-                local v = args[i]
-                logger:DebugQuery(" - [" .. i .. "] = " .. tostring(v))
-
-                -- Don't bind if nil, that allows us to have NULL
-                if v ~= nil then
-                    -- one more easy conversion. if a boolean, convert to an int.
-                    if type(v) == "boolean" then
-                        v = v and 1 or 0
-                    end
-
-                    database.BindParameter(cPSInstance, i, v)
+        if bLogQueries then
+            logger:DebugQuery("[" .. queryName .. "] SQL Query start")
+        end
+        for i = 1, num do
+            local v = args[i]
+
+            -- Don't bind if nil, that allows us to have NULL
+            if v ~= nil then
+                -- one more easy conversion. if a boolean, convert to an int.
+                if type(v) == "boolean" then
+                    v = v and 1 or 0
                 end
+
+                database.BindParameter(cPSInstance, i, v)
             end
         end
         database.BindComplete(cPSInstance)
         database.Step(cPSInstance)
 
         local tRows = database.GetAllResults(cPSInstance, false)
-        logger:DebugQuery("[" .. queryName .. "] SQL Query finished with result: " .. tostring(table))
+        if bLogQueries then
+            logger:DebugQuery("[" .. queryName .. "] SQL Query finished with result: " .. tostring(tRows))
+        end
         result = tRows or nil
     else
         logger:Error("[" .. queryName .. "] SQL Query failed")
     end
-    database.SetReadOnly(databaseName, true)
+    if not bInScope then
+        database.SetReadOnly(databaseName, true)
+    end
     return result
 end
 
+---@param databaseName string
+---@param bSuccess boolean
+---@return any ...
+local function CloseWriteScope(databaseName, bSuccess, ...)
+    tWriteScopes[databaseName] = nil
+    database.SetReadOnly(databaseName, true)
+    if not bSuccess then
+        error((...), 0)
+    end
+    return ...
+end
+
+--- Runs `fn` with the database writable for its whole duration. Every query
+--- made on the database inside it (including all generated Insert and Update
+--- bindings) skips toggling read-only, and prepared statement instances are
+--- looked up once per query name and reused.
+--- The database is made read-only again even if `fn` errors.
+--- Scopes on the same database can be nested.
+---```lua
+---DatabaseUtils.WithWriteScope("TrackedRides", function()
+---    db.ElementLists__Insert(id, "Spline")
+---    db.ElementLists__Insert(id, "Station")
+---end)
+---```
+---@param databaseName string The database to write to.
+---@param fn function The function making the queries.
+---@return any ... The results of `fn`.
+function DatabaseUtils.WithWriteScope(databaseName, fn)
+    if tWriteScopes[databaseName] ~= nil then
+        return fn()
+    end
+
+    if logger:IsLevelEnabled("DEBUG_QUERY") then
+        logger:DebugQuery("Opening write scope on " .. databaseName)
+    end
+    database.SetReadOnly(databaseName, false)
+    tWriteScopes[databaseName] = {}
+    return CloseWriteScope(databaseName, pcall(fn))
+end
+
 ---Binds a prepared statement to a database
 ---@param databaseName string
 ---@param pscollectionName string
@@ -72,10 +156,15 @@ function DatabaseUtils.BindPreparedStatement(databaseName, pscollectionName)
     logger:DebugQuery("BindPreparedStatements()")
     local bSuccess = false
 
-    database.SetReadOnly(databaseName, false)
+    local bInScope = tWriteScopes[databaseName] ~= nil
+    if not bInScope then
+        database.SetReadOnly(databaseName, false)
+    end
     logger:DebugQuery("Binding " .. pscollectionName .. ".pscollection to " .. databaseName)
     bSuccess = database.BindPreparedStatementCollection(databaseName, pscollectionName)
-    database.SetReadOnly(databaseName, true)
+    if not bInScope then
+        database.SetReadOnly(databaseName, true)
+    end
 
     if not bSuccess then
         logger:Warn("Warning: Prepared Statement " .. pscollectionName .. " can not be bound to table " .. databaseName)
@@ -48,18 +48,23 @@ function Logger.Get(name, levelOverride)
     return instance
 end
 
+---Returns whether this logger prints messages of this level.
+---Use it to skip building expensive log strings that would be discarded.
+---@param level levels The level to check.
+---@return boolean enabled
+function Logger:IsLevelEnabled(level)
+    if self.levelOverride ~= nil then
+        return Logger.LEVELS[level] >= Logger.LEVELS[self.levelOverride]
+    end
+    return Logger.LEVELS[level] >= Logger.LEVELS[Logger.GLOBAL_LEVEL]
+end
+
 ---@private
 ---@param level levels The level to print at.
 ---@param string string The string to print to the console.
 function Logger:PrintLevel(level, string)
-    if self.levelOverride ~= nil then
-        if Logger.LEVELS[level] < Logger.LEVELS[self.levelOverride] then
-            return
-        end
-    else
-        if Logger.LEVELS[level] < Logger.LEVELS[Logger.GLOBAL_LEVEL] then
-            return
-        end
+    if not self:IsLevelEnabled(level) then
+        return
     end
 
     api.debug.Trace("[" .. level .. "] " .. self.name .. ": " .. string)
@@ -0,0 +1,78 @@
+import os
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from bindings.connection import open_fdb
+from bindings.introspection import extract_database_schema
+from bindings.output_sink import OutputSink
+from bindings.table_generator import extract_table_data, generate_for_database, _generate_for_table
+from bindings.timing import PhaseTimer
+from constants.constants_generator import generate_constants_for_database
+from configuration import generate_db_constants
+
+def test_extract_table_data(run_phase, get_wide_fdb, column_count, row_count):
+    with open_fdb(get_wide_fdb(column_count, row_count)) as conn:
+        cursor = conn.cursor()
+
+        def extract():
+            schema = extract_database_schema(cursor)["Wide"]
+            return extract_table_data("Wide", cursor, schema=schema)
+
+        data = run_phase(extract)
+
+    assert len(data.parameters) == column_count
+
+def test_generate_for_table(run_phase, get_wide_fdb, column_count):
+    with open_fdb(get_wide_fdb(column_count, 1000)) as conn:
+        cursor = conn.cursor()
+        data = extract_table_data("Wide", cursor, schema=extract_database_schema(cursor)["Wide"])
+
+    statements, lua = run_phase(_generate_for_table, "Wide", "Wide", data, "Wide", rounds=10)
+
+    assert len(statements) > 0 and len(lua) > 0
+
+def test_generate_for_database(run_phase, benchmark, get_database_fdb, tmp_path, database_name, row_count):
+    database_path = get_database_fdb(database_name, row_count)
+    pscollection_dir = tmp_path / "init"
+    lua_dir = tmp_path / "lua"
+    pscollection_dir.mkdir()
+    lua_dir.mkdir()
+
+    timer = PhaseTimer()
+
+    def generate():
+        generate_for_database(
+            database_path,
+            database_name,
+            str(pscollection_dir),
+            str(lua_dir),
+            "forgeutils.internal.database",
+            timer=timer,
+            sink=OutputSink()
+        )
+
+    run_phase(generate)
+
+    # Summed over every round, including the tracemalloc one.
+    benchmark.extra_info["phase_seconds"] = timer.timings
+    assert os.path.exists(lua_dir / f"{database_name}.lua")
+
+def test_generate_constants_for_database(run_phase, get_database_fdb, tmp_path, database_name, row_count):
+    if database_name not in generate_db_constants:
+        pytest.skip(f"{database_name} has no constants")
+
+    database_path = get_database_fdb(database_name, row_count)
+
+    run_phase(
+        lambda: generate_constants_for_database(
+            database_path,
+            database_name,
+            generate_db_constants[database_name],
+            str(tmp_path),
+            "forgeutils.internal.database.constants",
+            OutputSink()
+        )
+    )
+
+    assert os.path.exists(tmp_path / f"{database_name}.lua")
@@ -0,0 +1,179 @@
+"""
+Benchmarks for the SQL binding generator, run against synthetic FDBs.
+Needs pytest and pytest-benchmark, but not the game:
+
+    python -m pytest SQLBindingGeneration/benchmarks
+
+Each benchmark reports its time (pytest-benchmark) and its peak traced
+memory (tracemalloc). `--bench-save-baseline` stores both per benchmark;
+later runs fail if either exceeds the baseline by more than
+`--bench-threshold`.
+"""
+
+import json
+import os
+import sys
+import tracemalloc
+import pytest
+
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, os.path.join(benchmarks_path, ".."))
+
+from synthetic_fdb import get_wide_table, read_database_schema, write_fdb
+
+# Row counts and column widths exercised at each --bench-scale.
+bench_scales = {
+    "small": {"rows": [1000], "widths": [5, 50]},
+    "medium": {"rows": [1000, 100000], "widths": [5, 50, 200]},
+    "large": {"rows": [1000, 100000, 1000000], "widths": [5, 50, 200]}
+}
+
+# Wide fixtures with more cells than this are skipped, so the largest
+# row count is only combined with narrower tables.
+max_wide_cells = 20000000
+
+bench_databases = [
+    "TrackedRides",
+    "TrackedRideCars",
+    "ModularScenery",
+    "Audio"
+]
+
+# Measurements of this run, by benchmark name.
+bench_results : dict[str, dict[str, float]] = {}
+
+def pytest_addoption(parser):
+    group = parser.getgroup("generator benchmarks")
+    group.addoption(
+        "--bench-scale",
+        choices=list(bench_scales.keys()),
+        default="small",
+        help="Row counts and column widths to benchmark. Defaults to small."
+    )
+    group.addoption(
+        "--bench-baseline",
+        default=os.path.join(benchmarks_path, "baseline.json"),
+        help="Baseline file to compare against (or save to)"
+    )
+    group.addoption(
+        "--bench-save-baseline",
+        action="store_true",
+        help="Store this run's measurements as the baseline instead of comparing"
+    )
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=0.25,
+        help="Allowed fractional regression over the baseline. Defaults to 0.25 (25%%)."
+    )
+
+def pytest_generate_tests(metafunc):
+    scale = bench_scales[metafunc.config.getoption("--bench-scale")]
+    if "row_count" in metafunc.fixturenames:
+        metafunc.parametrize("row_count", scale["rows"])
+    if "column_count" in metafunc.fixturenames:
+        metafunc.parametrize("column_count", scale["widths"])
+    if "database_name" in metafunc.fixturenames:
+        metafunc.parametrize("database_name", bench_databases)
+
+@pytest.fixture(scope="session")
+def fdb_folder(tmp_path_factory) -> str:
+    return str(tmp_path_factory.mktemp("fdb"))
+
+@pytest.fixture(scope="session")
+def get_database_fdb(fdb_folder):
+    """
+    Returns a function building (once) an FDB with a game database's schema.
+    """
+    def get(database_name : str, row_count : int) -> str:
+        path = os.path.join(fdb_folder, f"{database_name}_{row_count}.fdb")
+        if not os.path.exists(path):
+            write_fdb(path, read_database_schema(database_name), row_count)
+        return path
+    return get
+
+@pytest.fixture(scope="session")
+def get_wide_fdb(fdb_folder):
+    """
+    Returns a function building (once) an FDB with a single wide table.
+    """
+    def get(column_count : int, row_count : int) -> str:
+        if column_count * row_count > max_wide_cells:
+            pytest.skip(f"{column_count} columns x {row_count} rows is above the fixture size limit")
+
+        path = os.path.join(fdb_folder, f"Wide_{column_count}_{row_count}.fdb")
+        if not os.path.exists(path):
+            write_fdb(path, [get_wide_table(column_count)], row_count)
+        return path
+    return get
+
+def _get_peak_memory(function, *args) -> int:
+    tracemalloc.start()
+    try:
+        function(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def _check_baseline(config, name : str, measured : dict[str, float]) -> None:
+    if config.getoption("--bench-save-baseline"):
+        return
+
+    path = config.getoption("--bench-baseline")
+    if not os.path.exists(path):
+        return
+
+    with open(path, "r", encoding="utf-8") as file:
+        baseline = json.load(file).get(name)
+    if baseline is None:
+        return
+
+    threshold = config.getoption("--bench-threshold")
+    regressions = [
+        f"{key} {measured[key]:.6g} > {baseline[key]:.6g} (+{threshold:.0%})"
+        for key in measured.keys()
+        if key in baseline and measured[key] > baseline[key] * (1 + threshold)
+    ]
+    if regressions:
+        pytest.fail(f"{name} regressed against the baseline: {', '.join(regressions)}")
+
+@pytest.fixture
+def run_phase(benchmark, request):
+    """
+    Benchmarks a function, then runs it once more under tracemalloc for its
+    peak memory, and checks both against the baseline.
+    """
+    def run(function, *args, rounds : int = 3):
+        result = benchmark.pedantic(function, args=args, rounds=rounds, iterations=1)
+
+        peak_memory = _get_peak_memory(function, *args)
+        benchmark.extra_info["peak_memory_bytes"] = peak_memory
+
+        measured = {"peak_memory_bytes": peak_memory}
+        # No timings with --benchmark-disable.
+        if benchmark.stats is not None:
+            measured["median_seconds"] = benchmark.stats.stats.median
+        bench_results[request.node.name] = measured
+        _check_baseline(request.config, request.node.name, measured)
+        return result
+    return run
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not bench_results:
+        return
+
+    terminalreporter.section("peak memory (tracemalloc)")
+    for name, measured in sorted(bench_results.items()):
+        terminalreporter.write_line(f"{name:<70} {measured['peak_memory_bytes'] / (1024 * 1024):10.2f} MiB")
+
+    if config.getoption("--bench-save-baseline"):
+        path = config.getoption("--bench-baseline")
+        baseline = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file:
+                baseline = json.load(file)
+        baseline.update(bench_results)
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(baseline, file, indent=4, sort_keys=True)
+        terminalreporter.write_line(f"Saved baseline to {path}")
@@ -0,0 +1,22 @@
+-- Schema snapshot of the Audio game database for the benchmark fixtures.
+-- Kept fixed so benchmark results stay comparable across game patches.
+
+CREATE TABLE AmbienceCategories (Name TEXT NOT NULL, TextSymbol TEXT, Ordering TEXT, PRIMARY KEY (Name));
+CREATE TABLE AmbienceEventToCategoryMap (EventName TEXT NOT NULL, Category TEXT NOT NULL, PRIMARY KEY (EventName, Category));
+CREATE TABLE Categories (Name TEXT NOT NULL, TextSymbol TEXT, Ordering INTEGER, PRIMARY KEY (Name));
+CREATE TABLE CoasterMusicEventToCategoryMap (EventName TEXT NOT NULL, Category TEXT NOT NULL, PRIMARY KEY (EventName, Category));
+CREATE TABLE CoasterMusicEvents (EventName TEXT NOT NULL, ContentPack TEXT, PRIMARY KEY (EventName));
+CREATE TABLE ContentPacks (Name TEXT NOT NULL, EnumValue INTEGER NOT NULL, PRIMARY KEY (Name, EnumValue));
+CREATE TABLE DiegeticMusicEventToCategoryMap (EventName TEXT NOT NULL, Category TEXT NOT NULL, PRIMARY KEY (EventName, Category));
+CREATE TABLE DiegeticMusicEvents (EventName TEXT NOT NULL, ContentPack TEXT NOT NULL, Ordering INTEGER, PRIMARY KEY (EventName, ContentPack));
+CREATE TABLE EventToCategoryMap (EventName TEXT NOT NULL, Category TEXT NOT NULL, PRIMARY KEY (EventName, Category));
+CREATE TABLE FlatrideMusicEventToCategoryMap (EventName TEXT NOT NULL, Category TEXT NOT NULL, PRIMARY KEY (EventName, Category));
+CREATE TABLE FlatrideMusicEvents (EventName TEXT NOT NULL, ContentPack TEXT NOT NULL, PRIMARY KEY (EventName, ContentPack));
+CREATE TABLE GunSoundCategories (Name TEXT NOT NULL, TextSymbol TEXT NOT NULL, PRIMARY KEY (Name));
+CREATE TABLE GunSoundEventToCategoryMap (EventName TEXT NOT NULL, Category TEXT NOT NULL, PRIMARY KEY (EventName));
+CREATE TABLE GunSoundEvents (EventName TEXT NOT NULL, ContentPack TEXT NOT NULL, PRIMARY KEY (EventName));
+CREATE TABLE MusicCategories (Name TEXT NOT NULL, TextSymbol TEXT, Ordering INTEGER, PRIMARY KEY (Name));
+CREATE TABLE PlaceableAmbienceEvents (EventName TEXT NOT NULL, ContentPack TEXT NOT NULL, Ordering INTEGER, PRIMARY KEY (EventName, ContentPack));
+CREATE TABLE PlaceableTriggeredEvents (EventName TEXT NOT NULL, ContentPack TEXT NOT NULL, SupportsPitchShift INTEGER, Ordering INTEGER, PRIMARY KEY (EventName, ContentPack));
+CREATE TABLE SpeakerMusicEventToCategoryMap (EventName TEXT NOT NULL, Category TEXT NOT NULL, PRIMARY KEY (EventName, Category));
+CREATE TABLE SpeakerMusicEvents (EventName TEXT NOT NULL, ContentPack TEXT NOT NULL, PRIMARY KEY (EventName, ContentPack));
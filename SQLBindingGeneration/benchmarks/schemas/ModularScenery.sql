@@ -0,0 +1,41 @@
+-- Schema snapshot of the ModularScenery game database for the benchmark fixtures.
+-- Kept fixed so benchmark results stay comparable across game patches.
+
+CREATE TABLE Audio (SceneryPartName TEXT NOT NULL, PlacementSound TEXT, DeletionSound TEXT, MoveSound TEXT, GlassComposition REAL, MetalComposition REAL, PlasticComposition REAL, StoneComposition REAL, WoodComposition REAL, PRIMARY KEY (SceneryPartName));
+CREATE TABLE Blueprint_Tags (SceneryPart TEXT NOT NULL, Tag TEXT NOT NULL, PRIMARY KEY (SceneryPart, Tag));
+CREATE TABLE BrowserCategories (CategoryID INTEGER NOT NULL, CategoryTag TEXT NOT NULL, Label TEXT NOT NULL, Icon TEXT, ParentID INTEGER, Ordering INTEGER, AudioOpenSound TEXT, UGCWorkshopTag TEXT, Category TEXT, PRIMARY KEY (CategoryID, CategoryTag));
+CREATE TABLE BrowserFilters (FilterName TEXT NOT NULL, Includes TEXT NOT NULL, PRIMARY KEY (FilterName));
+CREATE TABLE ComplexTypes (Name TEXT NOT NULL, EnumValue INTEGER NOT NULL, PRIMARY KEY (Name, EnumValue));
+CREATE TABLE ContentPacks (Name TEXT NOT NULL, EnumValue INTEGER NOT NULL, PRIMARY KEY (Name, EnumValue));
+CREATE TABLE DevTransitionList (SceneryPartName TEXT NOT NULL, PRIMARY KEY (SceneryPartName));
+CREATE TABLE FacilityProps (SceneryPartName TEXT NOT NULL, ShopInventoryName TEXT, PRIMARY KEY (SceneryPartName));
+CREATE TABLE FireworkEffects (SceneryPartName TEXT NOT NULL, Radius INTEGER NOT NULL, Magnitude INTEGER NOT NULL, Duration REAL NOT NULL, PRIMARY KEY (SceneryPartName));
+CREATE TABLE GridProps (SceneryPartName TEXT NOT NULL, AlignmentStyle TEXT NOT NULL, CellXSize REAL NOT NULL, CellYSize REAL NOT NULL, CellZSize REAL NOT NULL, BoxXSize REAL NOT NULL, BoxYSize REAL NOT NULL, BoxZSize REAL NOT NULL, PRIMARY KEY (SceneryPartName, AlignmentStyle));
+CREATE TABLE LocalGridAlignmentStyle (Name TEXT NOT NULL, EnumValue INTEGER NOT NULL, PRIMARY KEY (Name, EnumValue));
+CREATE TABLE Metadata_Tags (SceneryPart TEXT NOT NULL, Tag TEXT NOT NULL, PRIMARY KEY (SceneryPart, Tag));
+CREATE TABLE ModularSceneryParts (SceneryPartName TEXT NOT NULL, DataPrefabName TEXT NOT NULL, ContentPack TEXT NOT NULL, PrefabName TEXT, UGCID TEXT, BoxXSize REAL, BoxYSize REAL, BoxZSize REAL, PRIMARY KEY (SceneryPartName, DataPrefabName, ContentPack));
+CREATE TABLE PartComplexMembers (SceneryPartName TEXT NOT NULL, MustBelongToComplexOfType TEXT NOT NULL, PRIMARY KEY (SceneryPartName, MustBelongToComplexOfType));
+CREATE TABLE PartControlPoints (SceneryPartName TEXT NOT NULL, ControlPointX REAL, ControlPointY REAL, ControlPointZ REAL, PRIMARY KEY (SceneryPartName));
+CREATE TABLE PartCustomFilterIDs (SceneryPartName TEXT NOT NULL, CustomFilterID TEXT NOT NULL, PRIMARY KEY (SceneryPartName));
+CREATE TABLE PartDataPrefabs (PrefabName TEXT NOT NULL, PRIMARY KEY (PrefabName));
+CREATE TABLE PathExtraProps (SceneryPartName TEXT NOT NULL, SnapType TEXT NOT NULL, BoxXSize REAL NOT NULL, BoxYSize REAL NOT NULL, BoxZSize REAL NOT NULL, PRIMARY KEY (SceneryPartName, SnapType));
+CREATE TABLE PathExtraSnapType (SnapTypeName TEXT NOT NULL, SnapTypeValue TEXT NOT NULL, PRIMARY KEY (SnapTypeName));
+CREATE TABLE PathProps (SceneryPartName TEXT NOT NULL, JoinPartResourceName TEXT NOT NULL, PRIMARY KEY (SceneryPartName));
+CREATE TABLE SceneryScaling (SceneryPartName TEXT NOT NULL, MinSize REAL NOT NULL, MaxSize REAL NOT NULL, PRIMARY KEY (SceneryPartName));
+CREATE TABLE Simulation (SceneryPartName TEXT NOT NULL, BuildCost INTEGER NOT NULL, HourlyRunningCost INTEGER, ResearchPack INTEGER, RequiresUnlockInSandbox INTEGER, PRIMARY KEY (SceneryPartName));
+CREATE TABLE SnapEdgePartData (SceneryPartName TEXT NOT NULL, Size INTEGER NOT NULL, PRIMARY KEY (SceneryPartName));
+CREATE TABLE TagGroups (TagGroup TEXT NOT NULL, Tag TEXT NOT NULL, Ordering INTEGER, PRIMARY KEY (TagGroup, Tag));
+CREATE TABLE TagGroupsDefinition (Name TEXT NOT NULL, TextSymbol TEXT NOT NULL, Ordering INTEGER, PRIMARY KEY (Name));
+CREATE TABLE TagGroupsToBrowserTabs (TabGroup TEXT NOT NULL, BrowserTab TEXT NOT NULL, Ordering INTEGER, PRIMARY KEY (TabGroup));
+CREATE TABLE TagSet (Tag TEXT NOT NULL, TextSymbol TEXT NOT NULL, IconPath TEXT, PRIMARY KEY (Tag));
+CREATE TABLE ThemeNames (ThemeName TEXT NOT NULL, Tag TEXT NOT NULL, ContentPack TEXT NOT NULL, LocTag TEXT NOT NULL, PRIMARY KEY (ThemeName, Tag, ContentPack));
+CREATE TABLE Theming (SceneryPartName TEXT NOT NULL, Weight INTEGER, Radius INTEGER, FalloffRadius INTEGER, PRIMARY KEY (SceneryPartName));
+CREATE TABLE TriggerTargetProps (SceneryPartName TEXT NOT NULL, CostPerTrigger INTEGER NOT NULL, TriggerRunTime REAL NOT NULL, PRIMARY KEY (SceneryPartName));
+CREATE TABLE UIData (SceneryPartName TEXT NOT NULL, LabelTextSymbol TEXT NOT NULL, DescriptionTextSymbol TEXT, Icon TEXT, ReleaseGroup INTEGER, PRIMARY KEY (SceneryPartName));
+CREATE TABLE UIPartOrdering (DataPrefabName TEXT NOT NULL, OrderingValue INTEGER, PRIMARY KEY (DataPrefabName));
+CREATE TABLE UtilityConnection (SceneryPartName TEXT NOT NULL, UtilityType TEXT NOT NULL, CostPerMeter REAL NOT NULL, PRIMARY KEY (SceneryPartName, UtilityType));
+CREATE TABLE UtilityConsumer (SceneryPartName TEXT NOT NULL, UtilityType TEXT NOT NULL, RequiredUtilityQuantity REAL NOT NULL, PRIMARY KEY (SceneryPartName, UtilityType));
+CREATE TABLE UtilityDistribution (SceneryPartName TEXT NOT NULL, UtilityType TEXT NOT NULL, RateOfTransfer REAL NOT NULL, RadiusOfEffect REAL NOT NULL, PRIMARY KEY (SceneryPartName, UtilityType));
+CREATE TABLE UtilityProduction (SceneryPartName TEXT NOT NULL, UtilityType TEXT NOT NULL, ProductionPerHour REAL NOT NULL, CostPerUtilityPerHour REAL NOT NULL, TotalBreakdownTimeMinutes REAL NOT NULL, ServiceCostPerPct INTEGER NOT NULL, EfficiencyRespite REAL NOT NULL, PRIMARY KEY (SceneryPartName, UtilityType));
+CREATE TABLE UtilityTypes (UtilityType TEXT NOT NULL, EnumValue INTEGER NOT NULL, PRIMARY KEY (UtilityType, EnumValue));
+CREATE TABLE WaterCleanliness (WaterConsumerType TEXT NOT NULL, WaterConsumerEnum TEXT NOT NULL, CleanlinessScalar REAL NOT NULL, VolumeMultiplier REAL NOT NULL, PRIMARY KEY (WaterConsumerType, WaterConsumerEnum));
@@ -0,0 +1,9 @@
+-- Schema snapshot of the TrackedRideCars game database for the benchmark fixtures.
+-- Kept fixed so benchmark results stay comparable across game patches.
+
+CREATE TABLE Cars (TrainID TEXT NOT NULL, CarID TEXT NOT NULL, Mass REAL NOT NULL, WhichCar TEXT, CarOrder INTEGER, Prefab TEXT, PlatformPrefab TEXT, IsPowered INTEGER, PRIMARY KEY (TrainID, CarID));
+CREATE TABLE CatchTrains (TrainID TEXT NOT NULL, ShouldWait INTEGER, CatchOnReturn INTEGER, MatchSpeed INTEGER, CatchOnFinalLap INTEGER, PRIMARY KEY (TrainID));
+CREATE TABLE RacingTrains (TrainID TEXT NOT NULL, PitOffset REAL, PitFront REAL, PitStep REAL, StartingOffset REAL, StartingFront REAL, StartingStep REAL, PRIMARY KEY (TrainID));
+CREATE TABLE Trains (TrainID TEXT NOT NULL, CanAddOffStation INTEGER NOT NULL, StaticFriction REAL, AirResistance REAL, DynamicFriction REAL, DynamicFriction_Alternate REAL, LuaScoringModule TEXT, BaseExcitement REAL, BaseFear REAL, BaseNausea REAL, AudioSpeedThreshold REAL, AudioAccnThreshold REAL, AudioWeightThreshold REAL, AudioLateralThreshold REAL, AudioUseFrontAxelForFlanges REAL, AudioIgnoreFrontCarForFlanges REAL, AudioIgnoreRearCarForFlanges REAL, AudioIgnoreMidCarsForFlanges REAL, AudioChainLiftPrefix TEXT, AudioBrakePrefix TEXT, DefaultRideMusic TEXT, UniqueEngineSound REAL, PlayMusicContinuously INTEGER, PlayMusicOnAllCarsSimultaneously INTEGER, AudioGuestsUseExcitement INTEGER, AudioGuestsUseFear INTEGER, AudioGuestsUseSpecialBehaviour INTEGER, UseTransportRideMusic INTEGER, TreatAsCoaster INTEGER, AudioMaxRange REAL, CatchTrainType TEXT, NumCatchCars INTEGER, ReverseCatchTrainType TEXT, NumReverseCatchCars INTEGER, SplitCatchTrainType TEXT, SplitNormalTrainDelay REAL, AudioPrefixOverride TEXT, UseMirrorCarRotation INTEGER, ForceCarAttachOffsetYToZero INTEGER, ForceCarAttachOffsetYToValue REAL, AudioCabinIsEnclosed INTEGER, IsWaterSlideTrain INTEGER, UseDefaultAudibilityRange INTEGER, PRIMARY KEY (TrainID));
+CREATE TABLE TransitionList (TrackedRideName TEXT NOT NULL, PRIMARY KEY (TrackedRideName));
+CREATE TABLE WhichCar (ID TEXT NOT NULL, PRIMARY KEY (ID));
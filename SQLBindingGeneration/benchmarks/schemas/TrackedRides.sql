@@ -0,0 +1,34 @@
+-- Schema snapshot of the TrackedRides game database for the benchmark fixtures.
+-- Kept fixed so benchmark results stay comparable across game patches.
+
+CREATE TABLE BlueprintTags (Ride TEXT NOT NULL, Tag TEXT NOT NULL, PRIMARY KEY (Ride, Tag));
+CREATE TABLE BrowserEntries (Ride TEXT NOT NULL, Label TEXT NOT NULL, Description TEXT NOT NULL, Icon TEXT, ReleaseGroup INTEGER, Manufacturer TEXT, PRIMARY KEY (Ride));
+CREATE TABLE BrowserMenus (Name TEXT NOT NULL, Parent TEXT NOT NULL, Ordering INTEGER NOT NULL, Label TEXT, Icon TEXT, IsCoaster INTEGER, AudioOpenSound TEXT, IsWaterSlide INTEGER, PRIMARY KEY (Name, Parent));
+CREATE TABLE BrowserTooltips (Ride TEXT NOT NULL, Tooltip TEXT NOT NULL, PRIMARY KEY (Ride));
+CREATE TABLE CinematicCameraWeights (Ride TEXT NOT NULL, Car INTEGER, CarFacing INTEGER, FixFollow INTEGER, FrontBumper INTEGER, GroundFollow INTEGER, Orbit INTEGER, Seat INTEGER, SeatFacing INTEGER, SlideFollow INTEGER, Wing INTEGER, PRIMARY KEY (Ride));
+CREATE TABLE Class (Type TEXT NOT NULL, PRIMARY KEY (Type));
+CREATE TABLE ContentPacks (Name TEXT NOT NULL, EnumValue TEXT NOT NULL, PRIMARY KEY (Name, EnumValue));
+CREATE TABLE DefaultFlexiColours (Ride TEXT NOT NULL, MaterialCustomisationProviderSlot INTEGER NOT NULL, Red INTEGER NOT NULL, Green INTEGER NOT NULL, Blue INTEGER NOT NULL, SemanticTag TEXT, PRIMARY KEY (Ride, MaterialCustomisationProviderSlot));
+CREATE TABLE ElementConversion (Ride TEXT NOT NULL, Element TEXT NOT NULL, ConvertToElement TEXT NOT NULL, PRIMARY KEY (Ride, Element));
+CREATE TABLE ElementData (Name TEXT NOT NULL, Ordering REAL NOT NULL, Type TEXT NOT NULL, Cost INTEGER NOT NULL, DisabledText TEXT NOT NULL, Label TEXT, Icon TEXT, RequiredPower REAL, LeadsInto TEXT, TrackWearMultiplier REAL, LeadsOutOf TEXT, CanGoUnderwater INTEGER, DescriptionText TEXT, Description2Text TEXT, Description3Text TEXT, PRIMARY KEY (Name, Ordering));
+CREATE TABLE ElementLists (Ride TEXT NOT NULL, Element TEXT NOT NULL, PRIMARY KEY (Ride, Element));
+CREATE TABLE ElementParamValueLabels (LabelSetName TEXT NOT NULL, ParamValue INTEGER NOT NULL, LocString TEXT NOT NULL, PRIMARY KEY (LabelSetName));
+CREATE TABLE ElementParams (Element TEXT NOT NULL, Param TEXT NOT NULL, Min REAL NOT NULL, Max REAL NOT NULL, Initial REAL NOT NULL, Step REAL NOT NULL, StepIsRelativeToMin INTEGER, LabelOverride TEXT, ValueLabelSetName TEXT, PRIMARY KEY (Element, Param));
+CREATE TABLE ElementTypes (Type TEXT NOT NULL, Ordering INTEGER NOT NULL, Icon TEXT, PRIMARY KEY (Type, Ordering));
+CREATE TABLE ElementUsesRideParams (Element TEXT NOT NULL, Param TEXT NOT NULL, PRIMARY KEY (Element, Param));
+CREATE TABLE FilterGroupDefinitions (Name TEXT NOT NULL, TextSymbol TEXT NOT NULL, Ordering INTEGER, PRIMARY KEY (Name));
+CREATE TABLE FilterGroups (TagName TEXT NOT NULL, GroupName TEXT NOT NULL, Ordering INTEGER, PRIMARY KEY (TagName));
+CREATE TABLE FlumePlatforms (Platform TEXT NOT NULL, Label TEXT NOT NULL, Description TEXT NOT NULL, Cost INTEGER NOT NULL, ContentPack TEXT NOT NULL, ResearchLevel INTEGER NOT NULL, Icon TEXT, SupportBasePrefab TEXT, Width REAL, Length REAL, PRIMARY KEY (Platform));
+CREATE TABLE MetadataTags (Tag TEXT NOT NULL, TextSymbol TEXT, PRIMARY KEY (Tag));
+CREATE TABLE RideData (Ride TEXT NOT NULL, ContentPack TEXT NOT NULL, TrackCost REAL NOT NULL, BreakdownTimeMultiplier REAL NOT NULL, MaxTrackHeightFeet REAL NOT NULL, SplineElement TEXT NOT NULL, StationElement TEXT NOT NULL, BlockSection INTEGER NOT NULL, Track TEXT, Name TEXT, Class TEXT, SpecificPowerMultiplier REAL, PlatformHeight REAL, HeightAbovePlatform REAL, TrackGapWidth REAL, TrackBlockWidth REAL, PlatformBlockWidth REAL, ChainElement TEXT, StationWidth REAL, AudioType TEXT, MaxSlopeDeltaDegrees REAL, MaxBankDeltaDegrees REAL, BuildBackwards INTEGER, HeightOffsetOnWater REAL, TrainTypeName TEXT, GroupTrainTypeName TEXT, CustomPlatformSpatial REAL, DefaultStationRailCount INTEGER, MaxStationCount INTEGER, LastTrackElement TEXT, ShuttleMode INTEGER, FlumePlacementOffset REAL, PRIMARY KEY (Ride, ContentPack));
+CREATE TABLE RideFlumePlatforms (Ride TEXT NOT NULL, Platform TEXT NOT NULL, PRIMARY KEY (Ride, Platform));
+CREATE TABLE RideMetadataTags (Ride TEXT NOT NULL, Tag TEXT NOT NULL, PRIMARY KEY (Ride, Tag));
+CREATE TABLE RideParams (Ride TEXT NOT NULL, Param TEXT NOT NULL, Min REAL NOT NULL, Max REAL NOT NULL, Initial REAL NOT NULL, Step REAL NOT NULL, StepIsRelativeToMin INTEGER, LabelOverride TEXT, ValueLabelSetName TEXT, AbsoluteMin REAL, AbsoluteMax REAL, PRIMARY KEY (Ride, Param));
+CREATE TABLE RideTrains (Ride TEXT NOT NULL, Train TEXT NOT NULL, Sort INTEGER NOT NULL, SceneryAttachmentGroup INTEGER, PRIMARY KEY (Ride, Train));
+CREATE TABLE RideTrains_Extra (Ride TEXT NOT NULL, Train TEXT NOT NULL, Sort INTEGER NOT NULL, SceneryAttachmentGroup INTEGER, PRIMARY KEY (Ride, Train));
+CREATE TABLE Simulation (Name TEXT NOT NULL, ExcitementRating REAL NOT NULL, IntensityRating REAL NOT NULL, NauseaRating REAL NOT NULL, Prestige INTEGER NOT NULL, TicketCost INTEGER NOT NULL, SupportsChildGuests INTEGER, MaximumGroupSize INTEGER, IsTransport INTEGER, ResearchPack INTEGER, IsBoomerang INTEGER, IsLoopedAsDefault INTEGER, RequiresEndLoops INTEGER, IsNonStop INTEGER, AllowsFreeEnds INTEGER, IsWaterSlide INTEGER, IsSwimsuit INTEGER, IsChildOnly INTEGER, ServiceInterval REAL, IsParade INTEGER, PRIMARY KEY (Name));
+CREATE TABLE TrackParamEnum (Name TEXT NOT NULL, Enum INTEGER NOT NULL, Sort INTEGER NOT NULL, Icon TEXT, Units TEXT, Multiplier REAL, Deadzone REAL, PRIMARY KEY (Name, Enum, Sort));
+CREATE TABLE Trains (Ride TEXT NOT NULL, Train TEXT NOT NULL, NumCars INTEGER NOT NULL, MinCars INTEGER NOT NULL, MaxCars INTEGER NOT NULL, IsDefaultTrainForRide INTEGER NOT NULL, Powered_MinSpeed REAL, Powered_MaxSpeed REAL, Powered_DefaultSpeed REAL, Powered_SpeedRangeMinDelta REAL, Powered_SpeedRangeMaxDelta REAL, AllowCrashTestDummies INTEGER, IsRacing INTEGER, NumPassesThroughStation INTEGER, MinNumPassesThroughStation INTEGER, MaxNumPassesThroughStation INTEGER, HardMaxTrains INTEGER, Powered_Behaviour INTEGER, Powered_CanChangeBehaviour INTEGER, PRIMARY KEY (Ride, Train));
+CREATE TABLE TransitionList (TrackedRideName TEXT NOT NULL, PRIMARY KEY (TrackedRideName));
+CREATE TABLE UtilityConsumer (RideName TEXT NOT NULL, UtilityType TEXT NOT NULL, RequiredUtilityQuantity REAL NOT NULL, PRIMARY KEY (RideName, UtilityType));
+CREATE TABLE UtilityTypes (UtilityType TEXT NOT NULL, EnumValue INTEGER NOT NULL, PRIMARY KEY (UtilityType, EnumValue));
@@ -0,0 +1,136 @@
+import os
+import sqlite3
+from dataclasses import dataclass, field
+
+# Schemas of the game databases, checked in as CREATE TABLE statements so
+# the fixtures don't change with the game (or the generated Init files).
+schema_folder = os.path.join(os.path.dirname(os.path.realpath(__file__)), "schemas")
+
+# Rows inserted per executemany call while building a fixture.
+insert_batch_size = 10000
+
+@dataclass
+class SyntheticColumn:
+    """Class to represent a column of a synthetic table"""
+    name: str
+    sql_type: str
+    primary_key: bool = False
+    not_null: bool = False
+    default: any = None
+
+@dataclass
+class SyntheticTable:
+    """Class to represent a synthetic table"""
+    name: str
+    columns: list[SyntheticColumn] = field(default_factory=list)
+
+    def get_column(self, name : str) -> SyntheticColumn | None:
+        return next((column for column in self.columns if column.name == name), None)
+
+    def get_create_statement(self) -> str:
+        columns = []
+        for column in self.columns:
+            column_sql = f"{column.name} {column.sql_type}"
+            if column.not_null:
+                column_sql += " NOT NULL"
+            if column.default is not None:
+                column_sql += f" DEFAULT {column.default}"
+            columns.append(column_sql)
+
+        primary_keys = [column.name for column in self.columns if column.primary_key]
+        if len(primary_keys) > 0:
+            columns.append(f"PRIMARY KEY ({', '.join(primary_keys)})")
+
+        return f"CREATE TABLE {self.name} ({', '.join(columns)});"
+
+def read_tables(create_sql : str) -> list[SyntheticTable]:
+    """
+    Builds the synthetic tables of a script of CREATE TABLE statements,
+    in the order they are created.
+    """
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.executescript(create_sql)
+        tables = []
+        for (table_name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY rowid;").fetchall():
+            tables.append(SyntheticTable(table_name, [
+                SyntheticColumn(name, sql_type, bool(primary_key), bool(not_null), default)
+                for _, name, sql_type, not_null, default, primary_key in conn.execute(f"PRAGMA table_info({table_name});").fetchall()
+            ]))
+        return tables
+    finally:
+        conn.close()
+
+def read_database_schema(database_name : str, folder : str = schema_folder) -> list[SyntheticTable]:
+    """
+    Reads the schema snapshot of one of the game databases.
+    """
+    with open(os.path.join(folder, f"{database_name}.sql"), "r", encoding="utf-8") as file:
+        return read_tables(file.read())
+
+def get_wide_table(column_count : int) -> SyntheticTable:
+    """
+    A table with a text key and `column_count - 1` columns cycling through
+    the column kinds found in the game databases.
+    """
+    table = SyntheticTable("Wide", [SyntheticColumn("Id", "TEXT", True, True)])
+    for index in range(1, column_count):
+        kind = index % 4
+        if kind == 0:
+            table.columns.append(SyntheticColumn(f"Col{index}", "TEXT", not_null=True))
+        elif kind == 1:
+            table.columns.append(SyntheticColumn(f"Col{index}", "INTEGER", not_null=True, default=0))
+        elif kind == 2:
+            table.columns.append(SyntheticColumn(f"Col{index}", "REAL"))
+        else:
+            table.columns.append(SyntheticColumn(f"Col{index}", "TEXT"))
+    return table
+
+def _get_value(column : SyntheticColumn, column_index : int, row : int) -> any:
+    # Key columns are unique per row; other columns repeat with a
+    # per-column cardinality, so common values are non-trivial.
+    if column.primary_key:
+        return f"{column.name}{row}" if column.sql_type == "TEXT" else row
+
+    cardinality = 3 + (column_index * 7) % 50
+    value = (row * (column_index + 1)) % cardinality
+    if column.sql_type == "INTEGER":
+        return value
+    if column.sql_type == "REAL":
+        return value / 4
+    return f"{column.name}_{value}"
+
+def _get_rows(table : SyntheticTable, row_count : int):
+    for row in range(row_count):
+        yield tuple(
+            _get_value(column, index, row)
+            for index, column in enumerate(table.columns)
+        )
+
+def write_fdb(path : str, tables : list[SyntheticTable], row_count : int) -> str:
+    """
+    Writes an FDB holding `tables`, each filled with `row_count` rows.
+    """
+    if os.path.exists(path):
+        os.remove(path)
+
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF;")
+        conn.execute("PRAGMA synchronous = OFF;")
+        for table in tables:
+            conn.execute(table.get_create_statement())
+
+            placeholders = ", ".join(["?"] * len(table.columns))
+            insert_sql = f"INSERT INTO {table.name} VALUES ({placeholders});"
+            rows = _get_rows(table, row_count)
+            while True:
+                batch = [row for _, row in zip(range(insert_batch_size), rows)]
+                if not batch:
+                    break
+                conn.executemany(insert_sql, batch)
+        conn.commit()
+    finally:
+        conn.close()
+
+    return path
@@ -0,0 +1,49 @@
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+# FDBs are only ever read, so they are memory mapped and given a large
+# page cache. Generation scans every table at least once.
+fdb_mmap_size = 1024 * 1024 * 1024
+fdb_cache_size_kib = 64 * 1024
+
+def get_fdb_uri(database_path : str) -> str:
+    # immutable=1 skips locking and change detection entirely, so the game
+    # (or another generator process) can have the file open at the same time.
+    return f"{Path(database_path).resolve().as_uri()}?mode=ro&immutable=1"
+
+def connect_fdb(database_path : str) -> sqlite3.Connection:
+    """
+    Opens an FDB read-only with the pragmas used for generation.
+    Prefer `open_fdb`, which also closes the connection.
+    """
+    conn = sqlite3.connect(get_fdb_uri(database_path), uri=True)
+    conn.execute(f"PRAGMA mmap_size = {fdb_mmap_size};")
+    conn.execute(f"PRAGMA cache_size = -{fdb_cache_size_kib};")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    return conn
+
+@contextmanager
+def open_fdb(database_path : str) -> Iterator[sqlite3.Connection]:
+    """
+    Opens an FDB read-only and closes it when the block exits.
+    """
+    conn = connect_fdb(database_path)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+@contextmanager
+def share_fdb(database_path : str, connection : sqlite3.Connection | None = None) -> Iterator[sqlite3.Connection]:
+    """
+    Uses an already open connection to an FDB if given (leaving it open),
+    otherwise opens the FDB like `open_fdb`.
+    """
+    if connection is not None:
+        yield connection
+        return
+
+    with open_fdb(database_path) as conn:
+        yield conn
@@ -0,0 +1,149 @@
+import hashlib
+import json
+import os
+import sqlite3
+
+# Bump when the cache layout changes.
+cache_version = 4
+
+# Rows hashed per fetch when a table's pages can't be read directly.
+checksum_batch_size = 1000
+
+def get_generator_fingerprint(*options : any) -> str:
+    """
+    Hashes the generator sources and generation options, so cached output
+    is invalidated whenever the code or settings producing it change.
+    """
+    hasher = hashlib.sha256(repr((cache_version, options)).encode("utf-8"))
+    bindings_dir = os.path.dirname(os.path.realpath(__file__))
+    for file_name in sorted(os.listdir(bindings_dir)):
+        if file_name.endswith(".py"):
+            with open(os.path.join(bindings_dir, file_name), "rb") as file:
+                hasher.update(file_name.encode("utf-8"))
+                hasher.update(file.read())
+    return hasher.hexdigest()
+
+def get_file_signature(path : str) -> list[int]:
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def _hash_table_pages(hasher, table_name : str, cursor : sqlite3.Cursor, database_path : str) -> bool:
+    # The pages of a table's b-tree (overflow pages included) are read
+    # straight from the file, without decoding a single row. Needs the
+    # dbstat table, which not every SQLite build has.
+    try:
+        cursor.execute("SELECT pageno FROM dbstat WHERE name = ? ORDER BY pageno;", (table_name,))
+    except sqlite3.OperationalError:
+        return False
+    pages = [row[0] for row in cursor.fetchall()]
+    page_size = cursor.execute("PRAGMA page_size;").fetchone()[0]
+
+    with open(database_path, "rb") as file:
+        for page in pages:
+            file.seek((page - 1) * page_size)
+            hasher.update(file.read(page_size))
+    return True
+
+def _hash_table_rows(hasher, table_name : str, cursor : sqlite3.Cursor) -> None:
+    cursor.execute(f"SELECT * FROM {table_name};")
+    while True:
+        rows = cursor.fetchmany(checksum_batch_size)
+        if not rows:
+            return
+        hasher.update(repr(rows).encode("utf-8"))
+
+def get_table_fingerprint(table_name : str, cursor : sqlite3.Cursor, database_path : str | None = None) -> str:
+    """
+    Hashes a table's schema (its SQL, columns, indexes, foreign keys) and
+    its data. The data is hashed from the table's pages in the file at
+    `database_path` if SQLite can list them, otherwise row by row.
+    """
+    hasher = hashlib.sha256()
+
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?;", (table_name,))
+    hasher.update(repr(cursor.fetchone()).encode("utf-8"))
+
+    cursor.execute(f"PRAGMA table_info({table_name});")
+    hasher.update(repr(cursor.fetchall()).encode("utf-8"))
+
+    cursor.execute(f"PRAGMA foreign_key_list({table_name});")
+    hasher.update(repr(cursor.fetchall()).encode("utf-8"))
+
+    cursor.execute(f"PRAGMA index_list({table_name});")
+    indexes = cursor.fetchall()
+    hasher.update(repr(indexes).encode("utf-8"))
+    for _, index_name, *_ in indexes:
+        cursor.execute(f"PRAGMA index_xinfo({index_name});")
+        hasher.update(repr(cursor.fetchall()).encode("utf-8"))
+
+    if database_path is None or not _hash_table_pages(hasher, table_name, cursor, database_path):
+        _hash_table_rows(hasher, table_name, cursor)
+
+    return hasher.hexdigest()
+
+class FingerprintCache:
+    """
+    On-disk cache of the generated Lua for each table of a database, keyed
+    by table fingerprints. Pscollections are not copied into the cache; the
+    hash of the written file is kept instead so it can be reused in place.
+
+    If the database file itself is unchanged since the cache was written,
+    the stored fingerprints are trusted and no table is rescanned.
+    """
+
+    def __init__(self, cache_dir : str, database_name : str, database_path : str, generator_fingerprint : str):
+        self.path = os.path.join(cache_dir, f"{database_name}.json")
+        self.database_path = database_path
+        self.file_signature = get_file_signature(database_path)
+        self.generator_fingerprint = generator_fingerprint
+        self.tables : dict[str, dict[str, str]] = {}
+        self.file_unchanged = False
+
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "r", encoding="utf-8") as file:
+            stored = json.load(file)
+
+        if stored.get("generator_fingerprint") != generator_fingerprint:
+            return
+
+        self.tables = stored.get("tables", {})
+        self.file_unchanged = stored.get("file_signature") == self.file_signature
+
+    def get_fingerprint(self, table_name : str, cursor : sqlite3.Cursor) -> str:
+        if self.file_unchanged and table_name in self.tables:
+            return self.tables[table_name]["fingerprint"]
+        return get_table_fingerprint(table_name, cursor, self.database_path)
+
+    def get(self, table_name : str, fingerprint : str) -> tuple[str, str] | None:
+        """
+        Returns the cached (pscollection hash, lua) output of a table, or
+        None if the table changed.
+        """
+        entry = self.tables.get(table_name)
+        if entry is None or entry["fingerprint"] != fingerprint:
+            return None
+        return (entry["pscollection_hash"], entry["lua"])
+
+    def set(self, table_name : str, fingerprint : str, pscollection_hash : str, lua : str) -> None:
+        self.tables[table_name] = {
+            "fingerprint": fingerprint,
+            "pscollection_hash": pscollection_hash,
+            "lua": lua
+        }
+
+    def save(self, table_names : list[str]) -> None:
+        """
+        Writes the cache, dropping tables that no longer exist.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "generator_fingerprint": self.generator_fingerprint,
+                    "file_signature": self.file_signature,
+                    "tables": {name: self.tables[name] for name in table_names if name in self.tables}
+                },
+                file
+            )
@@ -0,0 +1,125 @@
+import re
+import sqlite3
+from .tabletypes import TableData, TableParam
+
+# The whole schema is read with a handful of set-based queries joining
+# sqlite_master with the pragma table-valued functions, instead of a
+# PRAGMA round-trip per table (and per index).
+tables_query = "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';"
+
+table_sql_query = "SELECT name, sql FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';"
+
+columns_query = """
+SELECT m.name, p.name, p.type, p."notnull", p.dflt_value, p.pk
+FROM sqlite_master AS m
+JOIN pragma_table_info(m.name) AS p
+WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+ORDER BY m.name, p.cid;
+"""
+
+foreign_keys_query = """
+SELECT m.name, f.id, f."from"
+FROM sqlite_master AS m
+JOIN pragma_foreign_key_list(m.name) AS f
+WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+ORDER BY m.name, f.id, f.seq;
+"""
+
+# Partial unique indexes only cover some rows, so their columns can't
+# identify one.
+unique_index_columns_query = """
+SELECT m.name, i.name, c.name
+FROM sqlite_master AS m
+JOIN pragma_index_list(m.name) AS i
+JOIN pragma_index_info(i.name) AS c
+WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%' AND i."unique" AND NOT i.partial
+ORDER BY m.name, i.seq, c.seqno;
+"""
+
+collation_pattern = re.compile(r"\bCOLLATE\b", re.IGNORECASE)
+
+def get_table_names(cursor : sqlite3.Cursor) -> list[str]:
+    """
+    Returns the user tables of a database in sqlite_master order.
+    """
+    cursor.execute(tables_query)
+    return [row[0] for row in cursor.fetchall()]
+
+def _group_by_table(rows : list[tuple]) -> dict[str, list[tuple]]:
+    grouped : dict[str, list[tuple]] = {}
+    for table_name, *values in rows:
+        grouped.setdefault(table_name, []).append(tuple(values))
+    return grouped
+
+def _group_columns(rows : list[tuple]) -> list[list[str]]:
+    # (group key, column) rows, already ordered, to the columns of each group
+    grouped : dict[any, list[str]] = {}
+    for key, column in rows:
+        grouped.setdefault(key, []).append(column)
+    return list(grouped.values())
+
+def get_table_data(params : dict[str, TableParam], foreign_keys : list[list[str]], unique_indexes : list[list[str]], binary_collation : bool = True) -> TableData:
+    """
+    Sorts a table's columns into primary keys, required and optional parameters.
+    Columns of a foreign key or unique index all count as primary keys.
+    Unique indexes on an expression (a None column) have no lookup.
+    """
+    data = TableData(
+        unique_indexes=[columns for columns in unique_indexes if None not in columns],
+        foreign_keys=foreign_keys,
+        binary_collation=binary_collation
+    )
+    foreign_key_columns = {column for columns in foreign_keys for column in columns}
+    unique_columns = {column for columns in unique_indexes for column in columns}
+
+    for param_name, param_data in params.items():
+        data.parameters[param_name] = param_data
+
+        if param_data.primary_key or param_name in foreign_key_columns or param_name in unique_columns:
+            data.primary_keys[param_name] = param_data
+        elif not (param_data.default is not None or not param_data.not_null):
+            data.required_parameters[param_name] = param_data
+        else:
+            data.optional_parameters[param_name] = param_data
+
+    return data
+
+def extract_database_schema(cursor : sqlite3.Cursor, table_names : list[str] | None = None) -> dict[str, TableData]:
+    """
+    Reads the schema of every table (or just `table_names`) at once.
+    Returns TableData in sqlite_master order, without statistics.
+    """
+    if table_names is None:
+        table_names = get_table_names(cursor)
+
+    cursor.execute(table_sql_query)
+    table_sql = dict(cursor.fetchall())
+
+    cursor.execute(columns_query)
+    columns = _group_by_table(cursor.fetchall())
+
+    cursor.execute(foreign_keys_query)
+    foreign_keys = _group_by_table(cursor.fetchall())
+
+    cursor.execute(unique_index_columns_query)
+    unique_index_columns = _group_by_table(cursor.fetchall())
+
+    schema : dict[str, TableData] = {}
+    for table_name in table_names:
+        params : dict[str, TableParam] = {
+            col[0]: TableParam(
+                col[1],
+                bool(col[2]),
+                col[3],
+                bool(col[4])
+            )
+            for col in columns.get(table_name, [])
+        }
+        schema[table_name] = get_table_data(
+            params,
+            _group_columns(foreign_keys.get(table_name, [])),
+            _group_columns(unique_index_columns.get(table_name, [])),
+            collation_pattern.search(table_sql.get(table_name) or "") is None
+        )
+
+    return schema
@@ -1,29 +1,46 @@
-import sqlite3
+import argparse
+from .connection import open_fdb
 from .luagen import get_luadoc_comment
 from .tabletypes import TableParam
 from .table_generator import extract_table_data
-import tkinter as tk
-from tkinter import filedialog
+from .introspection import extract_database_schema
 
+def ask_database_path() -> str:
+    # tkinter is only needed (and only available) on desktop machines.
+    import tkinter as tk
+    from tkinter import filedialog
 
-tk.Tk().withdraw()
+    tk.Tk().withdraw()
+    return filedialog.askopenfilename()
 
-conn = sqlite3.connect(filedialog.askopenfilename())
-cursor = conn.cursor()
+def main():
+    parser = argparse.ArgumentParser(
+        description="Print the luadoc of every insert parameter used across a database"
+    )
+    parser.add_argument(
+        "fdb",
+        nargs="?",
+        help="Path to the FDB. If omitted, a file picker is shown."
+    )
+    args = parser.parse_args()
 
-cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
-tables = [row[0] for row in cursor.fetchall()]
+    params : dict[str, tuple[str, TableParam]] = {}
 
-params : dict[str, tuple[str, TableParam]] = {}
+    with open_fdb(args.fdb if args.fdb else ask_database_path()) as conn:
+        cursor = conn.cursor()
 
-for table in tables:
-    data = extract_table_data(table, cursor)
-    for key, param in data.get_insert_parameters().items():
-        if key not in params:
-            params[key] = table, param
+        schemas = extract_database_schema(cursor)
 
-print("\n".join([
-    get_luadoc_comment(f"{key}", param)
-    for key, (table, param) in params.items()
-]))
-    
\ No newline at end of file
+        for table, schema in schemas.items():
+            data = extract_table_data(table, cursor, schema=schema)
+            for key, param in data.get_insert_parameters().items():
+                if key not in params:
+                    params[key] = table, param
+
+    print("\n".join([
+        get_luadoc_comment(f"{key}", param)
+        for key, (table, param) in params.items()
+    ]))
+
+if __name__ == "__main__":
+    main()
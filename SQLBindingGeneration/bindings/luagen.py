@@ -1,10 +1,13 @@
-from .shared_gen import get_insert_name, get_update_name, get_select_name
+from io import StringIO
+from typing import TextIO
+from .shared_gen import get_select_by_name, get_getter_name, get_insert_name, get_insert_many_name, get_update_name, get_update_row_name, get_select_name
 from .tabletypes import TableData, TableParam
 
 sql_luafunc_template = """
 --- Note: Autogenerated.
 {0}
 function {1}.{2}({3})
+    {1}.EnsureBound("{7}")
     return DatabaseUtils.ExecuteQuery("{4}", "{5}", {{{3}}}, {6})
 end
 """
@@ -13,6 +16,7 @@ sql_select_luafunc_template = """
 --- Note: Autogenerated.
 {0}
 function {1}.{2}({3})
+    {1}.EnsureBound("{8}")
     local results = DatabaseUtils.ExecuteQuery("{4}", "{5}", {{{3}}}, {6})
     if results == nil then
         return nil
@@ -27,11 +31,93 @@ function {1}.{2}({3})
 end
 """
 
+sql_select_rows_luafunc_template = """
+--- Note: Autogenerated.
+{0}
+function {1}.{2}({3})
+    {1}.EnsureBound("{8}")
+    local results = DatabaseUtils.ExecuteQuery("{4}", "{5}", {{{3}}}, {6})
+    local rows = {{}}
+    if results == nil then
+        return rows
+    end
+    for i, result in ipairs(results) do
+        rows[i] = {{
+{7}
+        }}
+    end
+    return rows
+end
+"""
+
+sql_getter_luafunc_template = """
+--- Note: Autogenerated.
+{0}
+function {1}.{2}({3})
+    {1}.EnsureBound("{7}")
+    local results = DatabaseUtils.ExecuteQuery("{4}", "{5}", {{{3}}}, {6})
+    if results == nil or results[1] == nil then
+        return nil
+    end
+    return results[1][1]
+end
+"""
+
+sql_insert_many_luafunc_template = """
+--- Note: Autogenerated.
+{0}
+function {1}.{2}(rows)
+    {1}.EnsureBound("{11}")
+    DatabaseUtils.WithWriteScope("{3}", function()
+        local count = #rows
+        local first = 1
+        while count - first + 1 >= {5} do
+            local args = {{}}
+            for i = 0, {5} - 1 do
+                local row = rows[first + i]
+                local offset = i * {6}
+{7}
+            end
+            DatabaseUtils.ExecuteQuery("{3}", "{4}", args, {8})
+            first = first + {5}
+        end
+        for i = first, count do
+            local row = rows[i]
+            {1}.{9}({10})
+        end
+    end)
+end
+"""
+
+sql_insert_many_fallback_luafunc_template = """
+--- Note: Autogenerated.
+{0}
+function {1}.{2}(rows)
+    DatabaseUtils.WithWriteScope("{3}", function()
+        for _, row in ipairs(rows) do
+            {1}.{4}({5})
+        end
+    end)
+end
+"""
+
+sql_update_row_luafunc_template = """
+--- Note: Autogenerated.
+{0}
+function {1}.{2}(keys, changes)
+    {1}.EnsureBound("{7}")
+    return DatabaseUtils.ExecuteQuery("{3}", "{4}", {{{5}}}, {6})
+end
+"""
+
 sql_luafunc_indent2 = "        "
+sql_luafunc_indent3 = "            "
+sql_luafunc_indent4 = "                "
 
 sql_luafunccomment_template = "---@param {0} {1} {2}"
 
-db_manager_file = """---
+# The manager file is streamed as a header, each table's functions and a footer.
+db_manager_header = """---
 --- NOTE: THIS FILE IS AUTOGENERATED.
 --- PLEASE NOTE THAT THIS IS SUBJECT TO CHANGE
 --- BETWEEN EACH VERSION. IF BROKEN BY AN UPDATE,
@@ -51,43 +137,112 @@ local {0} = {{}}
 ---@private
 --- This method is called after data is merged
 {0}.InsertToDBs = function()
+    -- The databases are merged again, so every table has to be bound again.
+    {0}.tBoundPreparedStatements = {{}}
     {0}.BindPreparedStatements()
 end
 
+--- The pscollection holding each table's prepared statements.
 {0}.tPreparedStatements = {{
 {2}
 }}
 
+--- Tables whose prepared statements are bound in InsertToDBs. Every other
+--- table is bound on the first call to one of its functions. Add tables
+--- here (before InsertToDBs) to bind them eagerly.
+---@type string[]
+{0}.tPrewarmTables = {{
+{4}
+}}
+
+---@private
+--- The pscollections bound since the last InsertToDBs. Failed binds are
+--- not kept, so they are tried again on the next call.
+---@type table<string, boolean>
+{0}.tBoundPreparedStatements = {{}}
+
 ---@private
 function {0}.BindPreparedStatements()
     logger:DebugQuery("BindPreparedStatements()")
-    for _, filename in ipairs({0}.tPreparedStatements) do
-        DatabaseUtils.BindPreparedStatement(\"{3}\", filename)
+    for _, tableName in ipairs({0}.tPrewarmTables) do
+        {0}.EnsureBound(tableName)
     end
 end
 
-{4}
+--- Binds the prepared statements of a table, unless they already are.
+--- Generated functions call this themselves.
+---@param tableName string
+---@return boolean result
+function {0}.EnsureBound(tableName)
+    local filename = {0}.tPreparedStatements[tableName]
+    if {0}.tBoundPreparedStatements[filename] then
+        return true
+    end
+
+    local bBound = DatabaseUtils.BindPreparedStatement(\"{3}\", filename)
+    if bBound then
+        {0}.tBoundPreparedStatements[filename] = true
+    end
+    return bBound
+end
+
+--- Runs fn with the {3} database writable once for all of its queries.
+--- See DatabaseUtils.WithWriteScope.
+---@param fn function
+---@return any ...
+function {0}.WithWriteScope(fn)
+    return DatabaseUtils.WithWriteScope("{3}", fn)
+end
+
+"""
+
+db_manager_footer = """
 
 return {0}
 """
 
-def generate_lua_source_file(
+def write_lua_source_header(
+    out : TextIO,
     manager_name : str,
     manager_luapath : str, 
     database_name : str, 
-    pscollection_names : list[str],
-    extra_lua_functions : str = ""
-) -> str:
-    return db_manager_file.format(
+    pscollection_names : dict[str, str],
+    prewarm_tables : list[str] | None = None
+) -> None:
+    """
+    `pscollection_names` maps each table to the pscollection holding its
+    statements. Tables in `prewarm_tables` are bound eagerly.
+    """
+    out.write(db_manager_header.format(
         manager_name,
         manager_luapath,
         ", \n".join([
-            f"    \"{pscoll}\""
-            for pscoll in pscollection_names
+            f"    {table} = \"{pscoll}\""
+            for table, pscoll in pscollection_names.items()
         ]),
         database_name,
-        extra_lua_functions
-    )
+        ", \n".join([
+            f"    \"{table}\""
+            for table in (prewarm_tables if prewarm_tables is not None else [])
+        ])
+    ))
+
+def write_lua_source_footer(out : TextIO, manager_name : str) -> None:
+    out.write(db_manager_footer.format(manager_name))
+
+def generate_lua_source_file(
+    manager_name : str,
+    manager_luapath : str, 
+    database_name : str, 
+    pscollection_names : dict[str, str],
+    extra_lua_functions : str = "",
+    prewarm_tables : list[str] | None = None
+) -> str:
+    out = StringIO()
+    write_lua_source_header(out, manager_name, manager_luapath, database_name, pscollection_names, prewarm_tables)
+    out.write(extra_lua_functions)
+    write_lua_source_footer(out, manager_name)
+    return out.getvalue()
 
 def get_luadoc_desc(param_data : TableParam) -> str:
     res = ""
@@ -95,7 +250,10 @@ def get_luadoc_desc(param_data : TableParam) -> str:
         res += f"Default = {get_pretty_print_for_value(param_data.default)}. "
 
     if (len(param_data.most_common_values) > 0):
-        res += f"Common Values = {", ".join(param_data.most_common_values)}. "
+        if (param_data.most_common_values_error > 0):
+            res += f"Approximate Common Values (counts within {param_data.most_common_values_error} rows) = {", ".join(param_data.most_common_values)}. "
+        else:
+            res += f"Common Values = {", ".join(param_data.most_common_values)}. "
     return res
 
 def get_luadoc_comment(param_name : str, param_data : TableParam) -> str:
@@ -122,7 +280,7 @@ def map_sqltype_to_lua(sql_type: str) -> str:
         return "string"
     return sql_type
 
-def get_select_method(manager_name : str, database : str, table : str, table_data : TableData) -> str:
+def write_select_method(out : TextIO, manager_name : str, database : str, table : str, table_data : TableData) -> None:
     primary_keys = table_data.get_primary_keys()
 
     luadoc_comments = "\n".join(
@@ -152,7 +310,7 @@ def get_select_method(manager_name : str, database : str, table : str, table_dat
         ]
     )
 
-    return sql_select_luafunc_template.format(
+    out.write(sql_select_luafunc_template.format(
         luadoc_comments,
         manager_name,
         pscol_name,
@@ -160,10 +318,79 @@ def get_select_method(manager_name : str, database : str, table : str, table_dat
         database,
         pscol_name,
         param_count,
-        lua_table_map
+        lua_table_map,
+        table
+    ))
+
+def write_select_by_method(out : TextIO, manager_name : str, database : str, table : str, table_data : TableData, columns : tuple[str, ...], unique : bool) -> None:
+    lookup_keys = {name: table_data.parameters[name] for name in columns}
+
+    luadoc_comments = "\n".join(
+        [
+            f"--- Selects the {"row" if unique else "rows"} of table {table} by {", ".join(columns)}."
+        ]
+        +
+        [
+            get_luadoc_comment(param_name, param_data)
+            for param_name, param_data in lookup_keys.items()
+        ]
+        +
+        [
+            f"---@return table|nil data" if unique else f"---@return table[] rows"
+        ]
+    )
+    pscol_name = get_select_by_name(table, columns)
+    indent = sql_luafunc_indent2 if unique else sql_luafunc_indent3
+
+    lua_table_map = "\n".join(
+        [
+            f"{indent}{param_name} = result[{i + 1}] or nil,"
+            for i, param_name in enumerate(table_data.parameters.keys())
+        ]
+    )
+
+    out.write((sql_select_luafunc_template if unique else sql_select_rows_luafunc_template).format(
+        luadoc_comments,
+        manager_name,
+        pscol_name,
+        ", ".join(columns),
+        database,
+        pscol_name,
+        len(columns),
+        lua_table_map,
+        table
+    ))
+
+def write_getter_method(out : TextIO, manager_name : str, database : str, table : str, primary_keys : dict[str, TableParam], param_name : str, param_data : TableParam) -> None:
+    pscol_name = get_getter_name(table, param_name)
+
+    luadoc_comments = "\n".join(
+        [
+            f"--- Gets field \"{param_name}\" from {table}. {get_luadoc_desc(param_data)}"
+        ]
+        +
+        [
+            get_luadoc_comment(name, value)
+            for name, value in primary_keys.items()
+        ]
+        +
+        [
+            f"---@return {map_sqltype_to_lua(param_data.sql_type)}|nil {param_name}"
+        ]
     )
 
-def get_insert_method(manager_name : str, database : str, table : str, table_data : TableData) -> str:
+    out.write(sql_getter_luafunc_template.format(
+        luadoc_comments,
+        manager_name,
+        pscol_name,
+        ", ".join(primary_keys.keys()),
+        database,
+        pscol_name,
+        len(primary_keys),
+        table
+    ))
+
+def write_insert_method(out : TextIO, manager_name : str, database : str, table : str, table_data : TableData) -> None:
     required_parameters = table_data.get_insert_parameters()
 
     luadoc_comments = "\n".join(
@@ -184,17 +411,95 @@ def get_insert_method(manager_name : str, database : str, table : str, table_dat
     param_names = ", ".join(required_parameters.keys())
     pscol_name = get_insert_name(table)
 
-    return sql_luafunc_template.format(
+    out.write(sql_luafunc_template.format(
         luadoc_comments,
         manager_name,
         pscol_name,
         param_names,
         database,
         pscol_name,
-        param_count
+        param_count,
+        table
+    ))
+
+def write_insert_many_method(out : TextIO, manager_name : str, database : str, table : str, table_data : TableData, batch_size : int) -> None:
+    required_parameters = table_data.get_insert_parameters()
+
+    luadoc_comments = "\n".join(
+        [
+            f"--- Bulk inserter for table {table}. Each row is a table keyed by column name,",
+            f"--- see {get_insert_name(table)} for the columns. Rows are inserted in one write scope"
+            + (f", {batch_size} at a time." if batch_size > 1 else "."),
+            f"---@param rows table[]",
+            f"---@return nil"
+        ]
+    )
+    row_args = ", ".join([f"row.{param_name}" for param_name in required_parameters.keys()])
+
+    if batch_size <= 1:
+        out.write(sql_insert_many_fallback_luafunc_template.format(
+            luadoc_comments,
+            manager_name,
+            get_insert_many_name(table),
+            database,
+            get_insert_name(table),
+            row_args
+        ))
+        return
+
+    param_count = len(required_parameters)
+    arg_assignments = "\n".join(
+        [
+            f"{sql_luafunc_indent4}args[offset + {i + 1}] = row.{param_name}"
+            for i, param_name in enumerate(required_parameters.keys())
+        ]
+    )
+    pscol_name = get_insert_many_name(table)
+
+    out.write(sql_insert_many_luafunc_template.format(
+        luadoc_comments,
+        manager_name,
+        pscol_name,
+        database,
+        pscol_name,
+        batch_size,
+        param_count,
+        arg_assignments,
+        param_count * batch_size,
+        get_insert_name(table),
+        row_args,
+        table
+    ))
+
+def write_update_row_method(out : TextIO, manager_name : str, database : str, table : str, primary_keys : dict[str, TableParam], update_params : dict[str, TableParam]) -> None:
+    pscol_name = get_update_row_name(table)
+
+    luadoc_comments = "\n".join(
+        [
+            f"--- Updates any fields of a row in {table} in one query. Both tables are keyed by column name.",
+            f"--- Fields missing from (or nil in) `changes` are left unchanged, so this can't set a field to nil.",
+            f"---@param keys table Lookup keys: {", ".join(primary_keys.keys())}",
+            f"---@param changes table Fields to change: {", ".join(update_params.keys())}",
+            f"---@return nil"
+        ]
+    )
+    args = ", ".join(
+        [f"keys.{name}" for name in primary_keys.keys()]
+        + [f"changes.{name}" for name in update_params.keys()]
     )
 
-def get_update_method(manager_name : str, database : str, table : str, primary_keys : dict[str, TableParam], param_name : str, param_data : TableParam) -> str:
+    out.write(sql_update_row_luafunc_template.format(
+        luadoc_comments,
+        manager_name,
+        pscol_name,
+        database,
+        pscol_name,
+        args,
+        len(primary_keys) + len(update_params),
+        table
+    ))
+
+def write_update_method(out : TextIO, manager_name : str, database : str, table : str, primary_keys : dict[str, TableParam], param_name : str, param_data : TableParam) -> None:
     pscol_name = get_update_name(table, param_name)
 
 
@@ -218,12 +523,13 @@ def get_update_method(manager_name : str, database : str, table : str, primary_k
 
 
 
-    return sql_luafunc_template.format(
+    out.write(sql_luafunc_template.format(
         luadoc_comments,
         manager_name,
         pscol_name,
         f"{", ".join(primary_keys.keys())}, {param_name}",
         database,
         pscol_name,
-        len(primary_keys) + 1
-    )
\ No newline at end of file
+        len(primary_keys) + 1,
+        table
+    ))
\ No newline at end of file
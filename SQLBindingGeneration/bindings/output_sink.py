@@ -0,0 +1,130 @@
+import hashlib
+import io
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterator, TextIO
+
+def get_file_hash(path : str) -> str | None:
+    if not os.path.exists(path):
+        return None
+
+    hasher = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def _get_temp_path(path : str) -> str:
+    # Next to the destination, so the final rename stays on one filesystem.
+    # Unlike tempfile, the file is created with the usual permissions.
+    directory, file_name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, f".{file_name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+def _encode_as_text_file(content : str) -> bytes:
+    # Same encoding and newline translation as open(path, "w").
+    buffer = io.BytesIO()
+    wrapper = io.TextIOWrapper(buffer)
+    wrapper.write(content)
+    wrapper.flush()
+    data = buffer.getvalue()
+    wrapper.detach()
+    return data
+
+class OutputSink:
+    """
+    Writes generated files, only replacing those whose bytes actually
+    changed so unchanged outputs keep their modification times.
+
+    Files are written to a temporary file next to the destination and
+    renamed into place, so a file is never left half-written.
+    """
+
+    def __init__(self):
+        self.written : list[str] = []
+        self.unchanged : list[str] = []
+        self.orphaned : list[str] = []
+        self._lock = threading.Lock()
+
+    def record(self, path : str, changed : bool) -> None:
+        """
+        Records a file that was written (or found unchanged) elsewhere,
+        e.g. by a worker process.
+        """
+        with self._lock:
+            (self.written if changed else self.unchanged).append(os.path.abspath(path))
+
+    def was_written(self, path : str) -> bool:
+        with self._lock:
+            return os.path.abspath(path) in self.written
+
+    def _replace(self, path : str, data : bytes) -> None:
+        temp_path = _get_temp_path(path)
+        try:
+            with open(temp_path, "xb") as file:
+                file.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def write(self, path : str, content : str) -> bool:
+        """
+        Writes `content` to `path` unless the file already holds exactly
+        that content. Returns whether the file was written.
+        """
+        data = _encode_as_text_file(content)
+        changed = hashlib.sha256(data).hexdigest() != get_file_hash(path)
+        if changed:
+            self._replace(path, data)
+
+        self.record(path, changed)
+        return changed
+
+    @contextmanager
+    def open(self, path : str) -> Iterator[TextIO]:
+        """
+        Streams a file's content to a temporary file, which only replaces
+        `path` if it differs from what is already on disk.
+        """
+        temp_path = _get_temp_path(path)
+        try:
+            with open(temp_path, "x") as file:
+                yield file
+
+            changed = get_file_hash(temp_path) != get_file_hash(path)
+            if changed:
+                os.replace(temp_path, path)
+            else:
+                os.remove(temp_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self.record(path, changed)
+
+    def find_orphans(self, directory : str, prefix : str, suffix : str) -> list[str]:
+        """
+        Finds files in `directory` named `<prefix>*<suffix>` that were not
+        produced through this sink, e.g. pscollections of removed tables.
+        """
+        with self._lock:
+            produced = set(self.written + self.unchanged)
+
+        orphans = [
+            os.path.abspath(os.path.join(directory, file_name))
+            for file_name in sorted(os.listdir(directory))
+            if file_name.startswith(prefix) and file_name.endswith(suffix)
+            and os.path.abspath(os.path.join(directory, file_name)) not in produced
+        ]
+
+        with self._lock:
+            self.orphaned += [orphan for orphan in orphans if orphan not in self.orphaned]
+        return orphans
+
+    def get_report(self) -> str:
+        lines = [f"Files written: {len(self.written)}, unchanged: {len(self.unchanged)}, orphaned: {len(self.orphaned)}"]
+        lines += [f"  Orphaned: {orphan}" for orphan in self.orphaned]
+        return "\n".join(lines)
@@ -1,7 +1,18 @@
 
-import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import TextIO
 from .tabletypes import TableParam
 
+# One level of indentation, matching ET.indent.
+indent_level = "  "
+
+@dataclass
+class PreparedStatement:
+    """Class to represent a prepared statement inside a pscollection"""
+    statement_name: str
+    sql_query: str
+    args: list[TableParam]
+
 # arg_type 0 indicates an integer value
 # arg_type 2 indicates a float value
 # arg_type 3 indicates a string value.
@@ -13,51 +24,124 @@ def map_sqltype_to_pscollection_type(sql_type : str) -> str:
         return "2"
     return "3"
 
-def get_root_file(statements : list[ET.Element]) -> ET.Element:
-    root = ET.Element("PscollectionRoot", {"count": str(len(statements)), "game": "Planet Coaster 2"})
-    elem = ET.SubElement(root, "prepared_statements", {"pool_type": "4"})
+# Escaping matches xml.etree.ElementTree's serializer.
+def _escape_text(text : str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+def _escape_attrib(text : str) -> str:
+    return (
+        _escape_text(text)
+        .replace("\"", "&quot;")
+        .replace("\r", "&#13;")
+        .replace("\n", "&#10;")
+        .replace("\t", "&#09;")
+    )
 
+def _get_tag(tag : str, attributes : dict[str, str], empty : bool = False) -> str:
+    attributes_str = "".join([
+        f" {name}=\"{_escape_attrib(value)}\""
+        for name, value in attributes.items()
+    ])
+    return f"<{tag}{attributes_str} />" if empty else f"<{tag}{attributes_str}>"
+
+def _get_text_element(tag : str, text : str) -> str:
+    if not text:
+        return _get_tag(tag, {}, empty=True)
+    return f"<{tag}>{_escape_text(text)}</{tag}>"
+
+class PscollectionWriter:
+    """
+    Streams a pscollection to a text file one prepared statement at a time,
+    so no element tree is held in memory. Output is identical to building
+    the tree, running ET.indent on it and serialising it with
+    ET.tostring(..., encoding="unicode").
+    """
+
+    def __init__(self, out : TextIO, statement_count : int):
+        self.out = out
+        self.statement_count = statement_count
+        self.written_count = 0
+
+        attributes = {"pool_type": "4"}
+        out.write(_get_tag("PscollectionRoot", {"count": str(statement_count), "game": "Planet Coaster 2"}))
+        out.write("\n" + indent_level + _get_tag("prepared_statements", attributes, empty=statement_count == 0))
+
+    def write_statement(self, statement : PreparedStatement) -> None:
+        if self.written_count >= self.statement_count:
+            raise ValueError(f"Pscollection declared {self.statement_count} statements, but got more ({statement.statement_name}).")
+        self.written_count += 1
+
+        out = self.out
+        indent = "\n" + indent_level * 2
+        child_indent = indent + indent_level
+
+        out.write(indent + _get_tag("prepared_statement", {"arg_count": str(len(statement.args))}))
+
+        out.write(child_indent + _get_tag("args", {"pool_type": "4"}, empty=len(statement.args) == 0))
+        if len(statement.args) > 0:
+            for x in range(1, len(statement.args) + 1):
+                out.write(child_indent + indent_level + get_arg(statement.args[x - 1], x))
+            out.write(child_indent + "</args>")
+
+        out.write(child_indent + _get_text_element("statement_name", statement.statement_name))
+        out.write(child_indent + _get_text_element("sql_query", statement.sql_query))
+        out.write(indent + "</prepared_statement>")
+
+    def close(self) -> None:
+        if self.written_count != self.statement_count:
+            raise ValueError(f"Pscollection declared {self.statement_count} statements, but got {self.written_count}.")
+
+        if self.statement_count > 0:
+            self.out.write("\n" + indent_level + "</prepared_statements>")
+        self.out.write("\n</PscollectionRoot>")
+
+def write_root_file(out : TextIO, statements : list[PreparedStatement]) -> None:
+    writer = PscollectionWriter(out, len(statements))
     for statement in statements:
-        elem.append(statement)
+        writer.write_statement(statement)
+    writer.close()
 
-    return root
-
-def get_arg(arg : TableParam, index : int) -> ET.Element:
+def get_arg(arg : TableParam, index : int) -> str:
     arg_type = map_sqltype_to_pscollection_type(arg.sql_type)
-    return ET.Element("arg", {"arg_type": arg_type, "arg_index": str(index)})
+    return _get_tag("arg", {"arg_type": arg_type, "arg_index": str(index)}, empty=True)
+
+def get_prepared_statement(statement_name : str, sql_statement : str, args : list[TableParam]) -> PreparedStatement:
+    return PreparedStatement(statement_name, sql_statement, args)
 
-def get_prepared_statement(statement_name : str, sql_statement : str, args : list[TableParam]) -> ET.Element:
-    ps_statement = ET.Element(
-        "prepared_statement",
-        {"arg_count": str(len(args))}
-    )
 
-    args_elem = ET.SubElement(ps_statement, "args", {"pool_type": "4"})
-    for x in range(1, len(args) + 1):
-        args_elem.append(get_arg(args[x - 1], x))
+def get_select_statement(table: str, statement_name: str, primary_keys: dict[str, TableParam]) -> PreparedStatement:
+    where_clause_parts = []
+    params = []
+    for i, (pk_name, pk_param) in enumerate(primary_keys.items(), start=1):
+        where_clause_parts.append(f"{pk_name} = ?{i}")
+        params.append(pk_param)
 
-    ET.SubElement(ps_statement, "statement_name").text = statement_name
-    ET.SubElement(ps_statement, "sql_query").text = sql_statement
-    return ps_statement
+    where_clause = " AND ".join(where_clause_parts)
+    select_sql = f"SELECT * FROM {table} WHERE {where_clause};"
 
+    return get_prepared_statement(
+        statement_name,
+        select_sql,
+        params
+    )
 
-def get_select_statement(table: str, statement_name: str, primary_keys: dict[str, TableParam]) -> ET.Element:
+def get_getter_statement(table : str, statement_name : str, primary_keys : dict[str, TableParam], param_name : str) -> PreparedStatement:
     where_clause_parts = []
     params = []
     for i, (pk_name, pk_param) in enumerate(primary_keys.items(), start=1):
         where_clause_parts.append(f"{pk_name} = ?{i}")
         params.append(pk_param)
-    
+
     where_clause = " AND ".join(where_clause_parts)
-    select_sql = f"SELECT * FROM {table} WHERE {where_clause};"
-    
+    select_sql = f"SELECT {param_name} FROM {table} WHERE {where_clause} LIMIT 1;"
+
     return get_prepared_statement(
         statement_name,
         select_sql,
         params
     )
 
-def get_insert_statement(table : str, statement_name : str, params : dict[str, TableParam]) -> ET.Element:
+def get_insert_statement(table : str, statement_name : str, params : dict[str, TableParam]) -> PreparedStatement:
     args_str = ", ".join(
         [
             f"?{x}"
@@ -72,8 +156,48 @@ def get_insert_statement(table : str, statement_name : str, params : dict[str, T
         list(params.values())
     )
 
-def get_update_statement(table : str, statement_name : str, primary_keys : dict[str, TableParam], param_name : str, param_data : TableParam) -> ET.Element:
-    
+def get_insert_many_statement(table : str, statement_name : str, params : dict[str, TableParam], batch_size : int) -> PreparedStatement:
+    param_count = len(params)
+    rows_str = ", ".join(
+        [
+            "(" + ", ".join([f"?{row * param_count + x}" for x in range(1, param_count + 1)]) + ")"
+            for row in range(batch_size)
+        ]
+    )
+
+    params_str = ", ".join(params.keys())
+    return get_prepared_statement(
+        statement_name,
+        f"INSERT OR REPLACE INTO {table} ({params_str}) VALUES {rows_str};",
+        list(params.values()) * batch_size
+    )
+
+def get_update_row_statement(table : str, statement_name : str, primary_keys : dict[str, TableParam], update_params : dict[str, TableParam]) -> PreparedStatement:
+    where_clause_parts = []
+    params = []
+    for i, (pk_name, pk_param) in enumerate(primary_keys.items(), start=1):
+        where_clause_parts.append(f"{pk_name} = ?{i}")
+        params.append(pk_param)
+
+    where_clause = " AND ".join(where_clause_parts)
+
+    # NULL arguments leave their column unchanged
+    set_clause_parts = []
+    for i, (param_name, param_data) in enumerate(update_params.items(), start=len(primary_keys) + 1):
+        set_clause_parts.append(f"{param_name} = COALESCE(?{i}, {param_name})")
+        params.append(param_data)
+
+    set_clause = ", ".join(set_clause_parts)
+    update_sql = f"UPDATE {table} SET {set_clause} WHERE {where_clause};"
+
+    return get_prepared_statement(
+        statement_name,
+        update_sql,
+        params
+    )
+
+def get_update_statement(table : str, statement_name : str, primary_keys : dict[str, TableParam], param_name : str, param_data : TableParam) -> PreparedStatement:
+
     where_clause_parts = []
     params = []
     for i, (pk_name, pk_param) in enumerate(primary_keys.items(), start=1):
@@ -93,4 +217,4 @@ def get_update_statement(table : str, statement_name : str, primary_keys : dict[
         statement_name,
         update_sql,
         params
-    )
\ No newline at end of file
+    )
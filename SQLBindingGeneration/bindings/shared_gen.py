@@ -1,8 +1,32 @@
+# SQLite's default limit on bound parameters in a single statement.
+max_statement_parameters = 999
+
 def get_select_name(table : str) -> str:
     return f"{table}__Select"
 
+def get_select_by_name(table : str, columns : tuple[str, ...]) -> str:
+    return f"{table}__SelectBy{"_".join(columns)}"
+
+def get_getter_name(table : str, param_name : str) -> str:
+    return f"{table}__Get__{param_name}"
+
 def get_insert_name(table : str) -> str:
     return f"{table}__Insert"
 
 def get_update_name(table : str, param_name : str) -> str:
-    return f"{table}__Update__{param_name}"
\ No newline at end of file
+    return f"{table}__Update__{param_name}"
+
+def get_update_row_name(table : str) -> str:
+    return f"{table}__UpdateRow"
+
+def get_insert_many_name(table : str) -> str:
+    return f"{table}__InsertMany"
+
+def get_insert_many_batch_size(param_count : int, batch_size : int) -> int:
+    """
+    Rows inserted per multi-row insert, capped so the statement stays
+    within SQLite's parameter limit. 1 or less means no batched statement.
+    """
+    if param_count == 0:
+        return 0
+    return min(batch_size, max_statement_parameters // param_count)
@@ -0,0 +1,138 @@
+import heapq
+import sqlite3
+from collections import Counter
+
+# Rows are pulled in batches so a table is only ever scanned once,
+# without holding the whole table in memory.
+fetch_batch_size = 1000
+
+# Exact counts are only kept for columns with at most this many distinct
+# values. Columns with more (ids, names, floats) are counted by SQLite
+# instead, so memory doesn't grow with the size of the table.
+exact_distinct_limit = 1000
+
+def get_sqlite_sort_key(value : any) -> tuple:
+    """
+    Sort key matching SQLite's default (BINARY) ordering:
+    NULL < INTEGER/REAL < TEXT < BLOB.
+    """
+    if value is None:
+        return (0, 0)
+    if isinstance(value, (int, float)):
+        return (1, value)
+    if isinstance(value, str):
+        return (2, value.encode("utf-8"))
+    return (3, bytes(value))
+
+class MisraGriesCounter:
+    """
+    Bounded-memory approximation of a Counter (Misra-Gries summary).
+
+    At most `capacity` values are tracked. Every tracked count is an
+    underestimate of the true count by at most `error_bound`, which itself
+    never exceeds rows / (capacity + 1). Any value occurring more often than
+    that is guaranteed to be tracked.
+    """
+
+    def __init__(self, capacity : int):
+        if capacity < 1:
+            raise ValueError(f"Approximate statistics capacity must be at least 1, got {capacity}.")
+
+        self.capacity = capacity
+        self.counts : dict[any, int] = {}
+        self.error_bound = 0
+
+    def update(self, values : tuple) -> None:
+        # Batches are counted exactly (at most one fetch worth of values)
+        # and merged into the summary, trimming it back to capacity.
+        counts = self.counts
+        for value, count in Counter(values).items():
+            counts[value] = counts.get(value, 0) + count
+
+        if len(counts) <= self.capacity:
+            return
+
+        threshold = heapq.nlargest(self.capacity + 1, counts.values())[-1]
+        self.counts = {
+            value: count - threshold
+            for value, count in counts.items()
+            if count > threshold
+        }
+        self.error_bound += threshold
+
+    def items(self):
+        return self.counts.items()
+
+def get_most_common_values(counter : Counter | MisraGriesCounter, count : int) -> list[any]:
+    """
+    Returns the `count` most frequent values of a column, ordered the same
+    way as `GROUP BY col ORDER BY COUNT(*) DESC LIMIT count` (ties are
+    broken by ascending value, like SQLite's grouping order).
+    """
+    items = counter.items()
+    if len(counter.counts if isinstance(counter, MisraGriesCounter) else counter) > count:
+        # Only values tied with the count-th highest count can make the cut.
+        threshold = heapq.nlargest(count, (kvp[1] for kvp in items))[-1]
+        items = [kvp for kvp in items if kvp[1] >= threshold]
+
+    ordered = heapq.nsmallest(
+        count,
+        items,
+        key=lambda kvp: (-kvp[1], get_sqlite_sort_key(kvp[0]))
+    )
+    return [value for value, _ in ordered]
+
+def query_most_common_values(table_name : str, column_name : str, cursor : sqlite3.Cursor, count : int) -> list[any]:
+    """
+    Returns the `count` most frequent values of a column, as counted by SQLite.
+    """
+    cursor.execute(
+        f"SELECT {column_name}, COUNT(*) AS freq, ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (), 2) AS pct_of_total "
+        f"FROM {table_name} GROUP BY {column_name} ORDER BY freq DESC LIMIT {count};"
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+def get_distinct_values(counter : Counter | MisraGriesCounter) -> list[any] | None:
+    """
+    Returns every value of a column, ordered the same way as
+    `SELECT DISTINCT col ... ORDER BY col` (NULL included). Approximate
+    counters don't track every value, so None is returned for them.
+    """
+    if isinstance(counter, MisraGriesCounter):
+        return None
+    return sorted(counter.keys(), key=get_sqlite_sort_key)
+
+def collect_column_counters(
+        table_name : str,
+        cursor : sqlite3.Cursor,
+        approximate_capacity : int | None = None
+    ) -> dict[str, Counter | MisraGriesCounter | None]:
+    """
+    Counts the values of every column of a table in a single scan.
+    Counts are exact unless `approximate_capacity` is given, in which case
+    each column keeps at most that many counters. Exact counting stops for
+    columns with more than `exact_distinct_limit` distinct values, which
+    are returned as None.
+    """
+    cursor.execute(f"SELECT * FROM {table_name};")
+    column_names = [description[0] for description in cursor.description]
+    counters = [
+        Counter() if approximate_capacity is None else MisraGriesCounter(approximate_capacity)
+        for _ in column_names
+    ]
+
+    while True:
+        rows = cursor.fetchmany(fetch_batch_size)
+        if not rows:
+            break
+
+        for index, column in enumerate(zip(*rows)):
+            counter = counters[index]
+            if counter is None:
+                continue
+
+            counter.update(column)
+            if approximate_capacity is None and len(counter) > exact_distinct_limit:
+                counters[index] = None
+
+    return dict(zip(column_names, counters))
@@ -1,90 +1,121 @@
+import os
 import sqlite3
-from .tabletypes import TableData, TableParam
-from .shared_gen import get_insert_name, get_update_name, get_select_name
-from .luagen import get_pretty_print_for_value, get_update_method, get_insert_method, get_select_method, generate_lua_source_file
-from .pscolgen import get_root_file, get_insert_statement, get_update_statement, get_select_statement
-import xml.etree.ElementTree as ET
+from .tabletypes import TableData, TableOutput, GenerationOptions
+from .shared_gen import get_select_by_name, get_getter_name, get_insert_name, get_insert_many_name, get_insert_many_batch_size, get_update_name, get_update_row_name, get_select_name
+from .luagen import get_pretty_print_for_value, write_select_by_method, write_getter_method, write_update_method, write_insert_method, write_insert_many_method, write_update_row_method, write_select_method, write_lua_source_header, write_lua_source_footer
+from .pscolgen import PreparedStatement, write_root_file, get_getter_statement, get_insert_statement, get_insert_many_statement, get_update_row_statement, get_update_statement, get_select_statement
+from .statistics import collect_column_counters, get_most_common_values, get_distinct_values, query_most_common_values
+from .introspection import get_table_names, extract_database_schema
+from .fingerprint_cache import FingerprintCache, get_generator_fingerprint
+from .timing import PhaseTimer
+from .output_sink import OutputSink, get_file_hash
+from .connection import connect_fdb, share_fdb
+import multiprocessing.util
 import sys
+import threading
+from concurrent.futures import Executor, Future
+from io import StringIO
+from typing import TextIO
 
-def extract_table_data(table_name, cursor) -> TableData:
-    cursor.execute(f"PRAGMA table_info({table_name});")
-    columns = cursor.fetchall()
-    params : dict[str, TableParam] = {
-        col[1]: TableParam(
-            col[2],
-            bool(col[3]),
-            col[4],
-            bool(col[5])
-        )
-        for col in columns
-    }
-    
-    cursor.execute(f"PRAGMA foreign_key_list({table_name});")
-    foreign_keys = cursor.fetchall()
-    foreign_key_columns = {fk[3] for fk in foreign_keys}
-
-    cursor.execute(f"PRAGMA index_list({table_name});")
-    indexes = cursor.fetchall()
-    unique_columns = []
-    for _, index_name, unique, *_ in indexes:
-        if unique:
-            cursor.execute(f"PRAGMA index_info({index_name});")
-            index_cols = cursor.fetchall()
-            for col in index_cols:
-                unique_columns.append(col[2])
-    
-    data = TableData()
-
-    for param_name, param_data in params.items():
-
-        # Look at data distribution for this column.
-        cursor.execute(f"SELECT {param_name}, COUNT(*) AS freq, ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (), 2) AS pct_of_total FROM {table_name} GROUP BY {param_name} ORDER BY freq DESC LIMIT 5;")
-        results = cursor.fetchall()
-        param_data.most_common_values = [
-            get_pretty_print_for_value(val[0])
-            for val in results
-        ]
-
-        data.parameters[param_name] = param_data
-
-        if param_data.primary_key or param_name in foreign_key_columns or param_name in unique_columns:
-            data.primary_keys[param_name] = param_data
-        elif not (param_data.default is not None or not param_data.not_null):
-            data.required_parameters[param_name] = param_data
+def extract_table_data(
+        table_name,
+        cursor,
+        approximate_capacity : int | None = None,
+        timer : PhaseTimer | None = None,
+        schema : TableData | None = None,
+        distinct_columns : set[str] | None = None
+    ) -> TableData:
+    """
+    Adds column statistics to a table's schema. The schema is introspected
+    if not given; pass it from `extract_database_schema` when generating
+    many tables. The distinct values of `distinct_columns` (lowercase
+    names) are kept as well, when the statistics are exact and the table
+    has no collation.
+    """
+    timer = timer if timer is not None else PhaseTimer()
+
+    if schema is None:
+        with timer.phase("introspection"):
+            schema = extract_database_schema(cursor, [table_name])[table_name]
+
+    # Look at data distribution for every column in a single scan.
+    with timer.phase("statistics"):
+        if schema.binary_collation:
+            counters = collect_column_counters(table_name, cursor, approximate_capacity)
         else:
-            data.optional_parameters[param_name] = param_data
+            # Grouping follows a column's declared collation, which the
+            # counters don't; every column is counted by SQLite instead.
+            counters = dict.fromkeys(schema.parameters.keys())
+
+        for param_name, param_data in schema.parameters.items():
+            counter = counters[param_name]
+            if counter is None:
+                # Too many distinct values to count in memory, or a collation.
+                param_data.most_common_values = [
+                    get_pretty_print_for_value(val)
+                    for val in query_most_common_values(table_name, param_name, cursor, 5)
+                ]
+                param_data.most_common_values_error = 0
+                continue
+
+            param_data.most_common_values = [
+                get_pretty_print_for_value(val)
+                for val in get_most_common_values(counter, 5)
+            ]
+            param_data.most_common_values_error = getattr(counter, "error_bound", 0)
 
-    return data
+            if distinct_columns is not None and param_name.lower() in distinct_columns:
+                param_data.distinct_values = get_distinct_values(counter)
 
-def _generate_for_table(database_name : str, table_name : str, table_data : TableData, lua_manager : str = "TestManager") -> tuple[ET.Element, str] :
-    statements : list[ET.Element] = []
+    return schema
+
+def _generate_for_table(database_name : str, table_name : str, table_data : TableData, lua_manager : str = "TestManager", options : GenerationOptions | None = None) -> tuple[list[PreparedStatement], str] :
+    return (
+        generate_pscollection_for_table(table_name, table_data, options),
+        generate_lua_for_table(database_name, table_name, table_data, lua_manager, options)
+    )
+
+def generate_pscollection_for_table(table_name : str, table_data : TableData, options : GenerationOptions | None = None) -> list[PreparedStatement]:
+    options = options if options is not None else GenerationOptions()
+    statements : list[PreparedStatement] = []
 
     insert_params = table_data.get_insert_parameters()
     update_params = table_data.get_update_parameters()
     primary_keys = table_data.get_primary_keys()
 
-    lua = ""
-
     # generate select
-    statements.append(get_select_statement(table_name, get_select_name(table_name), primary_keys))
-    lua += get_select_method(
-        lua_manager,
-        database_name,
-        table_name,
-        table_data
-    )
+    if options.generate_row_selects:
+        statements.append(get_select_statement(table_name, get_select_name(table_name), primary_keys))
+
+    # generate lookups by unique index and foreign key
+    if options.generate_lookup_selects:
+        for columns in table_data.get_lookups().keys():
+            statements.append(
+                get_select_statement(
+                    table_name,
+                    get_select_by_name(table_name, columns),
+                    {name: table_data.parameters[name] for name in columns}
+                )
+            )
+
+    # generate getters
+    if options.generate_column_getters:
+        for param_name in update_params.keys():
+            statements.append(get_getter_statement(table_name, get_getter_name(table_name, param_name), primary_keys, param_name))
 
     # generate inserter
     statements.append(get_insert_statement(table_name, get_insert_name(table_name), insert_params))
-    lua += get_insert_method(
-        lua_manager,
-        database_name,
-        table_name,
-        table_data
-    )
 
+    # generate multi-row inserter
+    batch_size = get_insert_many_batch_size(len(insert_params), options.insert_many_batch_size)
+    if batch_size > 1:
+        statements.append(get_insert_many_statement(table_name, get_insert_many_name(table_name), insert_params, batch_size))
+
+    # generate row updater
     if len(update_params) > 0:
+        statements.append(get_update_row_statement(table_name, get_update_row_name(table_name), primary_keys, update_params))
 
+    if options.generate_column_updates:
         for param_name, param_data in update_params.items():
             statements.append(
                 get_update_statement(
@@ -95,7 +126,42 @@ def _generate_for_table(database_name : str, table_name : str, table_data : Tabl
                     param_data
                 )
             )
-            lua += get_update_method(
+
+    return statements
+
+def _write_lua_for_table(out : TextIO, database_name : str, table_name : str, table_data : TableData, lua_manager : str = "TestManager", options : GenerationOptions | None = None) -> None:
+    options = options if options is not None else GenerationOptions()
+    update_params = table_data.get_update_parameters()
+    primary_keys = table_data.get_primary_keys()
+
+    # generate select
+    if options.generate_row_selects:
+        write_select_method(
+            out,
+            lua_manager,
+            database_name,
+            table_name,
+            table_data
+        )
+
+    # generate lookups by unique index and foreign key
+    if options.generate_lookup_selects:
+        for columns, unique in table_data.get_lookups().items():
+            write_select_by_method(
+                out,
+                lua_manager,
+                database_name,
+                table_name,
+                table_data,
+                columns,
+                unique
+            )
+
+    # generate getters
+    if options.generate_column_getters:
+        for param_name, param_data in update_params.items():
+            write_getter_method(
+                out,
                 lua_manager,
                 database_name,
                 table_name,
@@ -104,46 +170,333 @@ def _generate_for_table(database_name : str, table_name : str, table_data : Tabl
                 param_data
             )
 
-    root = get_root_file(statements)
-    return (root, lua)
+    # generate inserter
+    write_insert_method(
+        out,
+        lua_manager,
+        database_name,
+        table_name,
+        table_data
+    )
+
+    # generate multi-row inserter
+    write_insert_many_method(
+        out,
+        lua_manager,
+        database_name,
+        table_name,
+        table_data,
+        get_insert_many_batch_size(len(table_data.get_insert_parameters()), options.insert_many_batch_size)
+    )
+
+    # generate row updater
+    if len(update_params) > 0:
+        write_update_row_method(
+            out,
+            lua_manager,
+            database_name,
+            table_name,
+            primary_keys,
+            update_params
+        )
+
+    if options.generate_column_updates:
+        for param_name, param_data in update_params.items():
+            write_update_method(
+                out,
+                lua_manager,
+                database_name,
+                table_name,
+                primary_keys,
+                param_name,
+                param_data
+            )
+
+def generate_lua_for_table(database_name : str, table_name : str, table_data : TableData, lua_manager : str = "TestManager", options : GenerationOptions | None = None) -> str:
+    out = StringIO()
+    _write_lua_for_table(out, database_name, table_name, table_data, lua_manager, options)
+    return out.getvalue()
+
+def _write_pscollection(sink : OutputSink, path : str, statements : list[PreparedStatement]) -> bool:
+    with sink.open(path) as file:
+        write_root_file(file, statements)
+    return sink.was_written(path)
+
+def _get_pscollection_hash(path : str | None) -> str | None:
+    # Consolidated pscollections are written for every run, so there is no
+    # per-table file to check.
+    return get_file_hash(path) if path is not None else None
+
+def _get_max_error_bound(table_data : TableData) -> int:
+    return max([0] + [param.most_common_values_error for param in table_data.parameters.values()])
+
+def _get_distinct_values(table_data : TableData) -> dict[str, list[any]]:
+    return {
+        param_name.lower(): param.distinct_values
+        for param_name, param in table_data.parameters.items()
+        if param.distinct_values is not None
+    }
+
+def _generate_table_output(
+        cursor : sqlite3.Cursor,
+        database_name : str,
+        table_name : str,
+        schema : TableData,
+        pscollection_path : str | None,
+        approximate_capacity : int | None,
+        sink : OutputSink,
+        options : GenerationOptions,
+        lua_out : TextIO | None = None,
+        distinct_columns : set[str] | None = None
+    ) -> TableOutput:
+    """
+    Generates one table. The pscollection is streamed to its file, unless
+    no path is given; the Lua is streamed to `lua_out` if given, otherwise
+    returned in the output.
+    """
+    timer = PhaseTimer()
+    data = extract_table_data(table_name, cursor, approximate_capacity, timer, schema, distinct_columns)
+
+    pscollection_written = False
+    if pscollection_path is not None:
+        with timer.phase("xml emit"):
+            pscollection_written = _write_pscollection(sink, pscollection_path, generate_pscollection_for_table(table_name, data, options))
+
+    table_lua = ""
+    with timer.phase("lua emit"):
+        if lua_out is not None:
+            _write_lua_for_table(lua_out, database_name, table_name, data, database_name, options)
+        else:
+            table_lua = generate_lua_for_table(database_name, table_name, data, database_name, options)
+
+    return TableOutput(table_lua, pscollection_written, _get_max_error_bound(data), timer.timings, _get_distinct_values(data))
+
+class _WorkerConnections:
+    """
+    The open FDBs of one pool worker thread, by database path. A worker
+    opens every FDB only once, and closes them when its thread ends (so
+    on ThreadPoolExecutor shutdown) or, in a pool process, when the
+    process exits.
+    """
+
+    def __init__(self):
+        self.connections : dict[str, sqlite3.Connection] = {}
+
+    def get(self, database_path : str) -> sqlite3.Connection:
+        if database_path not in self.connections:
+            self.connections[database_path] = connect_fdb(database_path)
+        return self.connections[database_path]
+
+    def close(self) -> None:
+        for conn in self.connections.values():
+            conn.close()
+        self.connections.clear()
+
+    def __del__(self):
+        self.close()
+
+# Connections can't be shared between the threads of a ThreadPoolExecutor,
+# so each thread has its own.
+_worker_state = threading.local()
+
+def _get_worker_connections() -> _WorkerConnections:
+    if not hasattr(_worker_state, "connections"):
+        _worker_state.connections = _WorkerConnections()
+    return _worker_state.connections
+
+def init_generation_worker(database_paths : list[str]) -> None:
+    """
+    Pool initializer (see `ProcessPoolExecutor`) opening the FDBs a worker
+    process will generate tables of.
+    """
+    connections = _get_worker_connections()
+    for database_path in database_paths:
+        connections.get(database_path)
+
+    # Pool processes end without unwinding their thread, so the FDBs are
+    # closed by a finalizer instead.
+    multiprocessing.util.Finalize(connections, connections.close, exitpriority=0)
+
+def _generate_table_output_worker(
+        database_path : str,
+        database_name : str,
+        table_name : str,
+        schema : TableData,
+        pscollection_path : str | None,
+        approximate_capacity : int | None,
+        options : GenerationOptions,
+        distinct_columns : set[str] | None = None
+    ) -> TableOutput:
+    # Runs in a pool process, which needs its own connection.
+    cursor = _get_worker_connections().get(database_path).cursor()
+    return _generate_table_output(cursor, database_name, table_name, schema, pscollection_path, approximate_capacity, OutputSink(), options, None, distinct_columns)
 
 def generate_for_database(
         database_path : str,
         database_name : str, 
         pscollection_save_dir : str,
         lua_save_dir : str,
-        lua_namespace : str
-    ) -> None:
+        lua_namespace : str,
+        approximate_capacity : int | None = None,
+        cache_dir : str | None = None,
+        executor : Executor | None = None,
+        timer : PhaseTimer | None = None,
+        sink : OutputSink | None = None,
+        options : GenerationOptions | None = None,
+        connection : sqlite3.Connection | None = None,
+        distinct_columns : dict[str, set[str]] | None = None
+    ) -> dict[tuple[str, str], list[any]]:
+    """
+    Generates the Lua bindings and pscollections for a database.
+    If an executor (e.g. a ProcessPoolExecutor) is given, tables are
+    generated in parallel; output is identical to a serial run.
+    Time spent in each phase is added to `timer`, and files are written
+    through `sink` so unchanged files are left untouched.
+    `options` controls which statements and functions are generated.
 
-    conn = sqlite3.connect(database_path)
-    cursor = conn.cursor()
+    An open `connection` to the FDB is used instead of opening another.
+    `distinct_columns` (lowercase table to lowercase column names) asks
+    for the distinct values of columns, taken from the statistics scan.
+    They are returned by lowercase (table, column), for every table that
+    was scanned with exact statistics and has no collation.
+    """
+    timer = timer if timer is not None else PhaseTimer()
+    sink = sink if sink is not None else OutputSink()
+    options = options if options is not None else GenerationOptions()
+    distinct_columns = distinct_columns if distinct_columns is not None else {}
+    distinct_values : dict[tuple[str, str], list[any]] = {}
 
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
-    tables = [row[0] for row in cursor.fetchall()]
+    with share_fdb(database_path, connection) as conn:
+        cursor = conn.cursor()
 
-    db_lua = ""
-    pscollections : dict[str, ET.Element] = {}
+        with timer.phase("introspection"):
+            tables = get_table_names(cursor)
+            schemas = extract_database_schema(cursor, tables)
 
-    for table in tables:
-        data = extract_table_data(table, cursor)
-        pscoll, table_lua = _generate_for_table(database_name, table, data, database_name)
-        pscollections[f"{database_name}_{table}"] = pscoll
-        db_lua += table_lua
+        cache = None
+        if cache_dir is not None:
+            cache = FingerprintCache(
+                cache_dir,
+                database_name,
+                database_path,
+                get_generator_fingerprint(approximate_capacity, options)
+            )
 
-    lua_source = generate_lua_source_file(
-        database_name,
-        lua_namespace,
-        database_name,
-        list(pscollections.keys()),
-        db_lua
-    )
+        pscollection_paths : dict[str, str | None] = {}
+        if options.consolidate_pscollections:
+            # Statements only depend on the schema, so the merged collection is
+            # written up front and tables only generate their Lua.
+            pscollection_names = {table: database_name for table in tables}
+            pscollection_paths = {table: None for table in tables}
+            with timer.phase("xml emit"):
+                _write_pscollection(
+                    sink,
+                    os.path.join(pscollection_save_dir, f"{database_name}.pscollection"),
+                    [
+                        statement
+                        for table in tables
+                        for statement in generate_pscollection_for_table(table, schemas[table], options)
+                    ]
+                )
+        else:
+            pscollection_names = {table: f"{database_name}_{table}" for table in tables}
+            pscollection_paths = {
+                table: os.path.join(pscollection_save_dir, f"{name}.pscollection")
+                for table, name in pscollection_names.items()
+            }
+
+        # Start every changed table before collecting any of them,
+        # so a pool can work on all of them at once.
+        fingerprints : dict[str, str] = {}
+        reused_tables : set[str] = set()
+        outputs : dict[str, TableOutput | Future] = {}
+
+        for table in tables:
+            if cache is not None:
+                with timer.phase("fingerprint"):
+                    fingerprints[table] = cache.get_fingerprint(table, cursor)
+                    cached = cache.get(table, fingerprints[table])
+                    # The pscollection on disk is the cached copy, so it must be intact.
+                    if cached is not None and _get_pscollection_hash(pscollection_paths[table]) == cached[0]:
+                        outputs[table] = TableOutput(cached[1])
+                        reused_tables.add(table)
+                        continue
+
+            if executor is not None:
+                outputs[table] = executor.submit(
+                    _generate_table_output_worker,
+                    database_path,
+                    database_name,
+                    table,
+                    schemas[table],
+                    pscollection_paths[table],
+                    approximate_capacity,
+                    options,
+                    distinct_columns.get(table.lower())
+                )
+
+        max_error_bound = 0
+
+        # Tables are streamed into the Lua file in sqlite_master order.
+        with sink.open(os.path.join(lua_save_dir, f"{database_name}.lua")) as lua_file:
+            with timer.phase("lua emit"):
+                write_lua_source_header(
+                    lua_file,
+                    database_name,
+                    lua_namespace,
+                    database_name,
+                    pscollection_names,
+                    [] if options.lazy_binding else tables
+                )
+
+            for table in tables:
+                output = outputs.get(table)
+                if output is None:
+                    # Serial generation. The Lua only needs to be kept if it is cached.
+                    output = _generate_table_output(
+                        cursor,
+                        database_name,
+                        table,
+                        schemas[table],
+                        pscollection_paths[table],
+                        approximate_capacity,
+                        sink,
+                        options,
+                        None if cache is not None else lua_file,
+                        distinct_columns.get(table.lower())
+                    )
+                elif isinstance(output, Future):
+                    output = output.result()
+                    if pscollection_paths[table] is not None:
+                        sink.record(pscollection_paths[table], output.pscollection_written)
+                elif pscollection_paths[table] is not None:
+                    sink.record(pscollection_paths[table], False)
+
+                timer.merge(output.timings)
+                max_error_bound = max(max_error_bound, output.most_common_values_error)
+                for column, values in output.distinct_values.items():
+                    distinct_values[(table.lower(), column)] = values
+                if cache is not None and table not in reused_tables:
+                    cache.set(table, fingerprints[table], _get_pscollection_hash(pscollection_paths[table]), output.lua)
+
+                with timer.phase("file write"):
+                    lua_file.write(output.lua)
+
+            with timer.phase("lua emit"):
+                write_lua_source_footer(lua_file, database_name)
+
+    if cache is not None:
+        cache.save(tables)
+        print(f"Reused {len(reused_tables)}/{len(tables)} unchanged tables from cache.")
 
-    with open(lua_save_dir + f"\\{database_name}.lua", "w+") as file:
-        file.write(lua_source)
+    if approximate_capacity is not None:
+        print(f"Approximate statistics ({approximate_capacity} counters per column): counts are at most {max_error_bound} rows low.")
+        for table in tables:
+            if not schemas[table].binary_collation and table not in reused_tables:
+                print(f"  {table} declares a collation, so its statistics were counted exactly by SQLite (memory is not bounded).")
 
-    for name, xml in pscollections.items():
-        with open(pscollection_save_dir + f"\\{name}.pscollection", "w+") as file:
-            ET.indent(ET.ElementTree(xml))
-            file.write(ET.tostring(xml, encoding="unicode"))
+    # Whichever layout is not in use is left over from an earlier run.
+    sink.find_orphans(pscollection_save_dir, f"{database_name}_", ".pscollection")
+    sink.find_orphans(pscollection_save_dir, f"{database_name}.", ".pscollection")
 
-    conn.close()
+    return distinct_values
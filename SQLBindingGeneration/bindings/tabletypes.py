@@ -9,6 +9,9 @@ class TableParam:
     default: any
     primary_key: bool
     most_common_values : list[str] = field(default_factory=list)
+    most_common_values_error : int = 0
+    # Every value of the column in ORDER BY order, only kept when requested.
+    distinct_values : list[any] | None = None
 
     def __str__(self):
         ret_str = ""
@@ -37,6 +40,11 @@ class TableData:
     primary_keys : dict[str, TableParam] = field(default_factory=dict)
     required_parameters: dict[str, TableParam] = field(default_factory=dict)
     optional_parameters: dict[str, TableParam] = field(default_factory=dict)
+    unique_indexes: list[list[str]] = field(default_factory=list)
+    foreign_keys: list[list[str]] = field(default_factory=list)
+    # Whether no column declares a COLLATE, so values group and sort in
+    # SQLite's default (BINARY) order.
+    binary_collation: bool = True
 
     def get_insert_parameters(self):
         default = {k: v for k, v in self.parameters.items() if k in self.primary_keys.keys() or k in self.required_parameters.keys()}
@@ -58,5 +66,39 @@ class TableData:
         tupl = next(iter(self.get_insert_parameters().items()))
         return {tupl[0]: tupl[1]}
 
+    def get_lookups(self) -> dict[tuple[str, ...], bool]:
+        """
+        Columns of each unique index and foreign key, mapped to whether they
+        identify a single row. The primary key lookup is left out.
+        """
+        lookups : dict[tuple[str, ...], bool] = {}
+        for columns in self.unique_indexes:
+            lookups[tuple(columns)] = True
+        for columns in self.foreign_keys:
+            lookups.setdefault(tuple(columns), False)
+
+        lookups.pop(tuple(self.get_primary_keys().keys()), None)
+        return lookups
+
     def __str__(self):
-        return f"PKs: {self.primary_keys}, Required: {self.required_parameters}, Optional: {self.optional_parameters}"
\ No newline at end of file
+        return f"PKs: {self.primary_keys}, Required: {self.required_parameters}, Optional: {self.optional_parameters}"
+
+@dataclass
+class TableOutput:
+    """Class to hold the generated output of a single table"""
+    lua: str
+    pscollection_written: bool = False
+    most_common_values_error: int = 0
+    timings: dict[str, float] = field(default_factory=dict)
+    distinct_values: dict[str, list[any]] = field(default_factory=dict)
+
+@dataclass
+class GenerationOptions:
+    """Class to hold the options controlling what is generated for each table"""
+    generate_row_selects: bool = True
+    generate_column_getters: bool = True
+    generate_lookup_selects: bool = True
+    insert_many_batch_size: int = 16
+    generate_column_updates: bool = True
+    lazy_binding: bool = True
+    consolidate_pscollections: bool = False
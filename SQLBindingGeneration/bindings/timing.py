@@ -0,0 +1,48 @@
+import time
+from contextlib import contextmanager
+
+# Phases in the order they are reported.
+phase_order = [
+    "introspection",
+    "fingerprint",
+    "statistics",
+    "lua emit",
+    "xml emit",
+    "file write",
+    "constants"
+]
+
+class PhaseTimer:
+    """Accumulates the time spent in each named phase of generation."""
+
+    def __init__(self):
+        self.timings : dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name : str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name : str, seconds : float) -> None:
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def merge(self, timings : dict[str, float]) -> None:
+        for name, seconds in timings.items():
+            self.add(name, seconds)
+
+    def get_report(self, title : str) -> str:
+        names = [name for name in phase_order if name in self.timings]
+        names += [name for name in self.timings if name not in phase_order]
+
+        width = max([len(name) for name in names], default=0)
+        return "\n".join(
+            [f"Timings for {title}:"]
+            +
+            [
+                f"  {name.ljust(width)} {self.timings[name]:8.3f}s"
+                for name in names
+            ]
+        )
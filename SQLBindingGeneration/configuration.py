@@ -21,10 +21,52 @@ constants_lua_folder = os.path.join(
     "constants"
 )
 
+# Per-table fingerprints and generated output are cached here, so
+# regenerating skips tables that have not changed. Relative to this folder.
+fingerprint_cache_folder = ".cache"
+
 #
 # Configuration constants
 #
 
+# Number of counters kept per column when computing the "Common Values"
+# documented on generated bindings. None computes exact statistics (use
+# this for releases); a number such as 64 uses a bounded-memory
+# approximation, which is faster for development regens on huge FDBs.
+approximate_statistics_capacity = None
+
+# Whether to generate <Table>__Select, which returns a whole row as a table.
+generate_row_selects = True
+
+# Whether to generate a <Table>__SelectBy<Columns> selector for every unique
+# index and foreign key. Foreign key selectors return every matching row.
+generate_lookup_selects = True
+
+# Whether to generate a <Table>__Get__<Column> getter for every non-key
+# column, which selects just that column and returns it directly.
+generate_column_getters = True
+
+# Rows inserted per statement by the generated <Table>__InsertMany
+# functions. Capped per table to stay within SQLite's 999 bound
+# parameters; 1 disables the multi-row statements.
+insert_many_batch_size = 16
+
+# Whether to generate a <Table>__Update__<Column> statement and function for
+# every column. <Table>__UpdateRow can update any columns in one statement;
+# disabling these shrinks pscollections and bind time, but the builders
+# still use them.
+generate_column_update_statements = True
+
+# Whether generated bindings bind a table's pscollection on first use.
+# If disabled, every table is bound when the database is set up.
+lazy_prepared_statement_binding = True
+
+# Whether to write a single <Database>.pscollection holding every table's
+# statements, instead of one <Database>_<Table>.pscollection per table.
+# Fewer files to package and bind; keep the per-table layout for mods
+# that ship partial overrides.
+consolidate_pscollections = False
+
 generate_dbs = [
     "TrackedRides",
     "TrackedRideCars",
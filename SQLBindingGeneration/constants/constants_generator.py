@@ -1,34 +1,88 @@
+import os
+import re
 import sqlite3
 from .luagen import generate_lua_source_file
+from bindings.connection import share_fdb
+from bindings.output_sink import OutputSink
+
+# Constant queries of this exact shape only need a column's distinct
+# values, which the binding generator's statistics scan already has.
+distinct_query_pattern = re.compile(
+    r"^\s*SELECT\s+DISTINCT\s+(\w+)\s+FROM\s+(\w+)\s+ORDER\s+BY\s+(\w+)(\s+ASC)?\s*;?\s*$",
+    re.IGNORECASE
+)
+
+def get_distinct_query(sql_statement : str) -> tuple[str, str] | None:
+    """
+    Returns the lowercase (table, column) of a `SELECT DISTINCT col FROM
+    table ORDER BY col` query, or None for any other query.
+    """
+    match = distinct_query_pattern.match(sql_statement)
+    if match is None or match.group(1).lower() != match.group(3).lower():
+        return None
+    return (match.group(2).lower(), match.group(1).lower())
+
+def get_distinct_columns(db_constants : dict[str, str]) -> dict[str, set[str]]:
+    """
+    Returns the columns, by table, whose distinct values answer some of
+    the constant queries.
+    """
+    distinct_columns : dict[str, set[str]] = {}
+    for sql_statement in db_constants.values():
+        query = get_distinct_query(sql_statement)
+        if query is not None:
+            distinct_columns.setdefault(query[0], set()).add(query[1])
+    return distinct_columns
 
 def get_constants_for_table(
     db : sqlite3.Connection,
-    sql_statement : str
+    sql_statement : str,
+    distinct_values : dict[tuple[str, str], list[any]] | None = None
 ) -> list[any]:
+    # DISTINCT and ORDER BY follow a column's declared collation, so tables
+    # with a COLLATE have no distinct values and fall back to the query.
+    query = get_distinct_query(sql_statement)
+    if distinct_values is not None and query in distinct_values:
+        return list(distinct_values[query])
+
     cursor = db.cursor()
     cursor.execute(sql_statement)
     return [row[0] for row in cursor.fetchall()]
 
 def get_constants_for_database(
     dbPath : str,
-    db_constants : dict[str, str]
+    db_constants : dict[str, str],
+    connection : sqlite3.Connection | None = None,
+    distinct_values : dict[tuple[str, str], list[any]] | None = None
 ) -> dict[str, list[any]]:
-    conn = sqlite3.connect(dbPath)
-    return {
-        kvp[0]: get_constants_for_table(conn, kvp[1])
-        for kvp in db_constants.items()
-    }
+    with share_fdb(dbPath, connection) as conn:
+        return {
+            kvp[0]: get_constants_for_table(conn, kvp[1], distinct_values)
+            for kvp in db_constants.items()
+        }
 
 def generate_constants_for_database(
     dbPath : str,
     name : str,
     db_constants : dict[str, str],
     export_constants_lua_folder : str,
-    constants_lua_namespace : str
+    constants_lua_namespace : str,
+    sink : OutputSink | None = None,
+    connection : sqlite3.Connection | None = None,
+    distinct_values : dict[tuple[str, str], list[any]] | None = None
 ):
+    """
+    Generates the Lua constants for a database. An open `connection` is
+    used instead of opening the FDB again, and queries found in
+    `distinct_values` (from `generate_for_database`) are not run at all.
+    """
+    sink = sink if sink is not None else OutputSink()
+
     constants = get_constants_for_database(
         dbPath,
-        db_constants
+        db_constants,
+        connection,
+        distinct_values
     )
 
     lua_source = generate_lua_source_file(
@@ -38,6 +92,4 @@ def generate_constants_for_database(
         constants
     )
 
-    with open(export_constants_lua_folder + f"\\{name}.lua", "w+") as file:
-        file.write(lua_source)
-    
+    sink.write(os.path.join(export_constants_lua_folder, f"{name}.lua"), lua_source)
@@ -26,6 +26,20 @@ db_constant_collection_file = """---
 
 db_constant_entry_file = "{0}.{1}_{2} = {3}"
 
+# Every group also gets a set (for O(1) membership checks), its values
+# in query order and their count. These hold the values exactly as they
+# are in the database, so they can be checked against data read from it.
+db_constant_lookups_file = """{0}.{1}_Set = {{
+{2}
+}}
+{0}.{1}_Values = {{
+{3}
+}}
+{0}.{1}_Count = {4}"""
+
+db_constant_set_entry_file = "    [{0}] = true,"
+db_constant_value_entry_file = "    {0},"
+
 def convert_constant_to_lua_value(constant : any) -> str:
     match constant:
 
@@ -44,6 +58,40 @@ def convert_constant_to_lua_value(constant : any) -> str:
         case _:
             raise NotImplementedError(f"Type of constant {type(constant)} is not supported when converting to lua. Add support!")
 
+def convert_constant_to_lua_literal(constant : any) -> str:
+    """
+    Converts a constant to Lua like `convert_constant_to_lua_value`, but
+    keeps every character of strings.
+    """
+    if isinstance(constant, str):
+        escaped = (
+            constant
+                .replace("\\", "\\\\")
+                .replace("\"", "\\\"")
+                .replace("\n", "\\n")
+                .replace("\r", "\\r")
+        )
+        return f"\"{escaped}\""
+    return convert_constant_to_lua_value(constant)
+
+def generate_lua_lookups(
+    class_name : str,
+    constant_name : str,
+    constants : list[any]
+) -> str:
+    values = list(dict.fromkeys(
+        convert_constant_to_lua_literal(constant)
+        for constant in constants
+    ))
+
+    return db_constant_lookups_file.format(
+        class_name,
+        constant_name,
+        "\n".join([db_constant_set_entry_file.format(value) for value in values]),
+        "\n".join([db_constant_value_entry_file.format(value) for value in values]),
+        len(values)
+    )
+
 def generate_lua_source_file(
     class_name : str,
     lua_namespace : str, 
@@ -60,6 +108,9 @@ def generate_lua_source_file(
                 convert_constant_to_lua_value(constant),
             )
             for constant in constants
+        ] + [
+            "",
+            generate_lua_lookups(class_name, constantName, constants)
         ])
         for constantName, constants in constants.items()
     }
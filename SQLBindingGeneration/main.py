@@ -1,13 +1,19 @@
-
+import argparse
+import multiprocessing
 import os
-import tkinter as tk
-from tkinter import filedialog
-from bindings.table_generator import generate_for_database
-from constants.constants_generator import generate_constants_for_database
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from bindings.connection import open_fdb
+from bindings.output_sink import OutputSink
+from bindings.tabletypes import GenerationOptions
+from bindings.table_generator import generate_for_database, init_generation_worker
+from bindings.timing import PhaseTimer
+from constants.constants_generator import generate_constants_for_database, get_distinct_columns
 from configuration import (
     # Folders
-    base_lua_folder, 
+    base_lua_folder,
     constants_lua_folder,
+    fingerprint_cache_folder,
 
     # Namespaces
     base_lua_namespace,
@@ -15,15 +21,21 @@ from configuration import (
 
     # Configuration
     generate_dbs,
-    generate_db_constants
+    generate_db_constants,
+    approximate_statistics_capacity,
+    generate_row_selects,
+    generate_lookup_selects,
+    generate_column_getters,
+    insert_many_batch_size,
+    generate_column_update_statements,
+    lazy_prepared_statement_binding,
+    consolidate_pscollections
 )
 
-tk.Tk().withdraw()
-
 this_path = os.path.dirname(os.path.realpath(__file__))
 base_path = os.path.join(
-    this_path, 
-    "..\\", 
+    this_path,
+    "..",
 )
 
 export_database_lua_folder = os.path.join(
@@ -31,45 +43,194 @@ export_database_lua_folder = os.path.join(
     base_lua_folder
 )
 export_constants_lua_folder = os.path.join(
-    base_path, 
+    base_path,
     constants_lua_folder
 )
 
+cache_folder = os.path.join(
+    this_path,
+    fingerprint_cache_folder
+)
+
 init_folder = os.path.join(
-    this_path, 
-    "../", 
+    this_path,
+    "..",
     "Init"
 )
 
-database_folder = filedialog.askdirectory(title="Select folder containing game FDBs to regenerate!")
-found_dbs : dict[str, str] = {}
+def ask_database_folder() -> str:
+    # tkinter is only needed (and only available) on desktop machines.
+    import tkinter as tk
+    from tkinter import filedialog
 
-for file in os.listdir(database_folder):
-    if file.endswith(".fdb"):
-        file_name = file.split("/")[-1].split(".")[0]
-        for db in generate_dbs:
-            if (file_name.lower() == db.lower()):
-                found_dbs[db] = os.path.join(database_folder, file)
+    tk.Tk().withdraw()
+    return filedialog.askdirectory(title="Select folder containing game FDBs to regenerate!")
 
-for name, path in found_dbs.items():
-    print(f"Regenerating {name}...")
-    generate_for_database(
-        path,
-        name,
-        init_folder,
-        export_database_lua_folder,
-        base_lua_namespace
+def find_databases(database_folder : str, database_names : list[str]) -> dict[str, str]:
+    found_dbs : dict[str, str] = {}
+
+    for file in os.listdir(database_folder):
+        if file.endswith(".fdb"):
+            file_name = file.split("/")[-1].split(".")[0]
+            for db in database_names:
+                if (file_name.lower() == db.lower()):
+                    found_dbs[db] = os.path.join(database_folder, file)
+
+    return found_dbs
+
+def get_generation_options() -> GenerationOptions:
+    return GenerationOptions(
+        generate_row_selects=generate_row_selects,
+        generate_lookup_selects=generate_lookup_selects,
+        generate_column_getters=generate_column_getters,
+        insert_many_batch_size=insert_many_batch_size,
+        generate_column_updates=generate_column_update_statements,
+        lazy_binding=lazy_prepared_statement_binding,
+        consolidate_pscollections=consolidate_pscollections
     )
 
-    print("Looking for constants...")
-    if name in generate_db_constants:
-        generate_constants_for_database(
+def regenerate_database(
+        name : str,
+        path : str,
+        args : argparse.Namespace,
+        sink : OutputSink,
+        executor : ProcessPoolExecutor | None = None
+    ) -> None:
+    print(f"Regenerating {name}...")
+    start = time.perf_counter()
+    timer = PhaseTimer()
+    db_constants = generate_db_constants.get(name, {})
+
+    # The FDB is opened once for every phase, so the constants reuse the
+    # page cache warmed by the statistics scan, and simple DISTINCT
+    # constants come straight out of those statistics.
+    with open_fdb(path) as conn:
+        distinct_values = generate_for_database(
             path,
             name,
-            generate_db_constants[name],
-            export_constants_lua_folder,
-            constants_lua_namespace
+            args.init_folder,
+            args.lua_folder,
+            base_lua_namespace,
+            args.approximate_stats,
+            None if args.no_cache else args.cache_folder,
+            executor,
+            timer,
+            sink,
+            get_generation_options(),
+            conn,
+            get_distinct_columns(db_constants)
         )
-    print("Done!")
 
-print("Finished generation")
+        if name in generate_db_constants:
+            print(f"Looking for constants for {name}...")
+            with timer.phase("constants"):
+                generate_constants_for_database(
+                    path,
+                    name,
+                    db_constants,
+                    args.constants_folder,
+                    constants_lua_namespace,
+                    sink,
+                    conn,
+                    distinct_values
+                )
+
+    print(timer.get_report(name))
+    print(f"  {name} finished in {time.perf_counter() - start:.3f}s")
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Regenerate the Lua bindings, pscollections and constants from the game FDBs"
+    )
+    parser.add_argument(
+        "fdb_folder",
+        nargs="?",
+        help="Folder containing the game FDBs. If omitted, a folder picker is shown."
+    )
+    parser.add_argument(
+        "--databases",
+        nargs="+",
+        choices=generate_dbs,
+        default=generate_dbs,
+        metavar="NAME",
+        help=f"Databases to regenerate. Defaults to all of: {", ".join(generate_dbs)}"
+    )
+    parser.add_argument(
+        "--init-folder",
+        default=init_folder,
+        help="Folder to write pscollections to"
+    )
+    parser.add_argument(
+        "--lua-folder",
+        default=export_database_lua_folder,
+        help="Folder to write the Lua bindings to"
+    )
+    parser.add_argument(
+        "--constants-folder",
+        default=export_constants_lua_folder,
+        help="Folder to write the Lua constants to"
+    )
+    parser.add_argument(
+        "--cache-folder",
+        default=cache_folder,
+        help="Folder holding the per-table fingerprint cache"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="If present, every table is regenerated and the cache is left untouched"
+    )
+    parser.add_argument(
+        "--approximate-stats",
+        type=int,
+        default=approximate_statistics_capacity,
+        metavar="COUNTERS",
+        help="Compute common values approximately with this many counters per column. Exact if omitted."
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes to generate tables with. 0 uses every core. Defaults to 1 (serial)."
+    )
+    args = parser.parse_args()
+
+    database_folder = args.fdb_folder if args.fdb_folder else ask_database_folder()
+    if not database_folder or not os.path.isdir(database_folder):
+        parser.error(f"FDB folder not found: {database_folder}")
+
+    found_dbs = find_databases(database_folder, args.databases)
+    sink = OutputSink()
+    start = time.perf_counter()
+
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count()
+
+    if jobs == 1:
+        for name, path in found_dbs.items():
+            regenerate_database(name, path, args, sink)
+    else:
+        # Tables of every database share the process pool; each database is
+        # driven from its own thread so they can all be in flight at once.
+        # Workers are spawned rather than forked, as forking while other
+        # threads hold open FDBs (and their locks) can deadlock the worker.
+        # Each worker opens every FDB once, when it starts.
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_generation_worker,
+            initargs=(list(found_dbs.values()),)
+        ) as executor, ThreadPoolExecutor(max_workers=max(1, len(found_dbs))) as database_executor:
+            futures = [
+                database_executor.submit(regenerate_database, name, path, args, sink, executor)
+                for name, path in found_dbs.items()
+            ]
+            for future in futures:
+                future.result()
+
+        print("Note: with --jobs, phase timings are summed across worker processes.")
+
+    print(sink.get_report())
+    print(f"Finished generation in {time.perf_counter() - start:.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+import argparse
+import hashlib
+import re
+import sqlite3
+import sys
+import time
+from bindings.connection import open_fdb
+from bindings.introspection import extract_database_schema
+from bindings.tabletypes import TableData, TableParam, GenerationOptions
+from bindings.table_generator import generate_pscollection_for_table, generate_lua_for_table
+from constants.constants_generator import get_constants_for_table
+from main import find_databases, get_generation_options
+from configuration import (
+    generate_dbs,
+    generate_db_constants
+)
+
+# Compares the schemas of two sets of game FDBs (e.g. before and after a
+# game patch) without scanning any table data, and reports which generated
+# bindings and constants a regeneration would change.
+
+column_fields = [
+    ("type", "sql_type"),
+    ("not null", "not_null"),
+    ("default", "default"),
+    ("primary key", "primary_key")
+]
+
+# Generated Lua is split into functions at the luadoc line each starts
+# with. The database name only has to be the same for both schemas.
+lua_function_marker = "--- Note: Autogenerated."
+lua_function_pattern = re.compile(r"^function \w+\.(\w+)\(", re.MULTILINE)
+lua_database_name = "Diff"
+
+def get_table_snapshot(table_data : TableData) -> tuple:
+    """
+    Everything about a table's schema that generation depends on.
+    """
+    return (
+        [
+            (name, param.sql_type, param.not_null, param.default, param.primary_key)
+            for name, param in table_data.parameters.items()
+        ],
+        list(table_data.get_primary_keys().keys()),
+        table_data.unique_indexes,
+        table_data.foreign_keys
+    )
+
+def get_snapshot_hash(table_data : TableData) -> str:
+    return hashlib.sha256(repr(get_table_snapshot(table_data)).encode("utf-8")).hexdigest()
+
+def _get_lua_functions(lua : str) -> dict[str, str]:
+    functions = {}
+    for block in lua.split(lua_function_marker):
+        match = lua_function_pattern.search(block)
+        if match is not None:
+            functions[match.group(1)] = block.strip()
+    return functions
+
+def _get_binding_signatures(table : str, table_data : TableData | None, options : GenerationOptions) -> dict[str, tuple]:
+    # The SQL and argument types of each prepared statement, and the Lua
+    # function of the same name. Without statistics the Lua only depends
+    # on the schema; it maps the columns of `SELECT *` rows by position,
+    # so it also changes when the SQL doesn't.
+    if table_data is None:
+        return {}
+
+    statements = {
+        statement.statement_name: (statement.sql_query, [str(arg) for arg in statement.args])
+        for statement in generate_pscollection_for_table(table, table_data, options)
+    }
+    functions = _get_lua_functions(
+        generate_lua_for_table(lua_database_name, table, table_data, lua_database_name, options)
+    )
+
+    return {
+        name: (statements.get(name), functions.get(name))
+        for name in list(statements.keys()) + [name for name in functions.keys() if name not in statements]
+    }
+
+def diff_names(old : list[str], new : list[str]) -> tuple[list[str], list[str]]:
+    """
+    Returns what was added to and removed from a list, in list order.
+    """
+    old_set = set(old)
+    new_set = set(new)
+    return [name for name in new if name not in old_set], [name for name in old if name not in new_set]
+
+def diff_columns(old_param : TableParam, new_param : TableParam) -> list[str]:
+    return [
+        f"{label} {getattr(old_param, field)!r} -> {getattr(new_param, field)!r}"
+        for label, field in column_fields
+        if getattr(old_param, field) != getattr(new_param, field)
+    ]
+
+def diff_table(old : TableData, new : TableData) -> list[str]:
+    """
+    Describes the schema changes of a table, one change per line.
+    """
+    lines = []
+
+    added, removed = diff_names(list(old.parameters.keys()), list(new.parameters.keys()))
+    lines += [f"+ column {name} {new.parameters[name]}" for name in added]
+    lines += [f"- column {name}" for name in removed]
+
+    common = [name for name in old.parameters.keys() if name in new.parameters]
+    for name in common:
+        changes = diff_columns(old.parameters[name], new.parameters[name])
+        if changes:
+            lines.append(f"~ column {name}: {', '.join(changes)}")
+
+    if common != [name for name in new.parameters.keys() if name in old.parameters]:
+        lines.append("~ column order changed")
+
+    old_keys = list(old.get_primary_keys().keys())
+    new_keys = list(new.get_primary_keys().keys())
+    if old_keys != new_keys:
+        lines.append(f"~ keys ({', '.join(old_keys)}) -> ({', '.join(new_keys)})")
+
+    for label, old_groups, new_groups in [
+        ("unique index", old.unique_indexes, new.unique_indexes),
+        ("foreign key", old.foreign_keys, new.foreign_keys)
+    ]:
+        added, removed = diff_names(
+            [", ".join(columns) for columns in old_groups],
+            [", ".join(columns) for columns in new_groups]
+        )
+        lines += [f"+ {label} ({columns})" for columns in added]
+        lines += [f"- {label} ({columns})" for columns in removed]
+
+    return lines
+
+def diff_statements(table : str, old : TableData | None, new : TableData | None, options : GenerationOptions) -> list[str]:
+    """
+    Lists the generated statements (and Lua functions) of a table that
+    would be added, removed or changed.
+    """
+    old_statements = _get_binding_signatures(table, old, options)
+    new_statements = _get_binding_signatures(table, new, options)
+
+    added, removed = diff_names(list(old_statements.keys()), list(new_statements.keys()))
+    changed = [
+        name
+        for name in old_statements.keys()
+        if name in new_statements and old_statements[name] != new_statements[name]
+    ]
+
+    return (
+        [f"+ {name}" for name in added] +
+        [f"- {name}" for name in removed] +
+        [f"~ {name}" for name in changed]
+    )
+
+def _get_constants(conn : sqlite3.Connection, sql_statement : str) -> list[any] | str:
+    try:
+        return get_constants_for_table(conn, sql_statement)
+    except sqlite3.Error as e:
+        return f"query failed: {e}"
+
+def diff_constants(old_conn : sqlite3.Connection, new_conn : sqlite3.Connection, db_constants : dict[str, str]) -> list[str]:
+    """
+    Runs each constant query against both databases and lists the values
+    that would be added to or removed from the generated constants.
+    """
+    lines = []
+    for name, sql_statement in db_constants.items():
+        old_values = _get_constants(old_conn, sql_statement)
+        new_values = _get_constants(new_conn, sql_statement)
+
+        if isinstance(old_values, str) or isinstance(new_values, str):
+            if old_values != new_values:
+                lines.append(f"! {name}: {old_values if isinstance(old_values, str) else 'ok'} -> {new_values if isinstance(new_values, str) else 'ok'}")
+            continue
+
+        added, removed = diff_names(old_values, new_values)
+        lines += [f"+ {name}_{value}" for value in added]
+        lines += [f"- {name}_{value}" for value in removed]
+        if not added and not removed and old_values != new_values:
+            lines.append(f"~ {name} order changed")
+
+    return lines
+
+def diff_database(name : str, old_path : str, new_path : str, options : GenerationOptions) -> list[str]:
+    """
+    Builds the report for one database. Returns no lines if nothing that
+    is generated from it would change.
+    """
+    lines = []
+
+    with open_fdb(old_path) as old_conn, open_fdb(new_path) as new_conn:
+        old_schema = extract_database_schema(old_conn.cursor())
+        new_schema = extract_database_schema(new_conn.cursor())
+
+        added, removed = diff_names(list(old_schema.keys()), list(new_schema.keys()))
+        for table in added:
+            lines.append(f"+ table {table} ({len(new_schema[table].parameters)} columns)")
+        for table in removed:
+            lines.append(f"- table {table}")
+
+        changed = [
+            table
+            for table in old_schema.keys()
+            if table in new_schema and get_snapshot_hash(old_schema[table]) != get_snapshot_hash(new_schema[table])
+        ]
+        for table in changed:
+            lines.append(f"~ table {table}")
+            lines += [f"    {line}" for line in diff_table(old_schema[table], new_schema[table])]
+
+        binding_lines = []
+        for table in added + removed + changed:
+            statements = diff_statements(table, old_schema.get(table), new_schema.get(table), options)
+            binding_lines += [f"    {line}" for line in statements]
+        if binding_lines:
+            lines.append("bindings:")
+            lines += binding_lines
+
+        if name in generate_db_constants:
+            constant_lines = diff_constants(old_conn, new_conn, generate_db_constants[name])
+            if constant_lines:
+                lines.append("constants:")
+                lines += [f"    {line}" for line in constant_lines]
+
+    return lines
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report the schema changes between two folders of game FDBs, and the generated bindings and constants they affect"
+    )
+    parser.add_argument(
+        "old_fdb_folder",
+        help="Folder containing the FDBs before the change"
+    )
+    parser.add_argument(
+        "new_fdb_folder",
+        help="Folder containing the FDBs after the change"
+    )
+    parser.add_argument(
+        "--databases",
+        nargs="+",
+        choices=generate_dbs,
+        default=generate_dbs,
+        metavar="NAME",
+        help=f"Databases to compare. Defaults to all of: {", ".join(generate_dbs)}"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    old_dbs = find_databases(args.old_fdb_folder, args.databases)
+    new_dbs = find_databases(args.new_fdb_folder, args.databases)
+    options = get_generation_options()
+    changed = False
+
+    for name in args.databases:
+        if name not in old_dbs or name not in new_dbs:
+            if name in old_dbs or name in new_dbs:
+                print(f"{name}: only in {args.old_fdb_folder if name in old_dbs else args.new_fdb_folder}")
+                changed = True
+            continue
+
+        lines = diff_database(name, old_dbs[name], new_dbs[name], options)
+        if lines:
+            print(f"{name}:")
+            print("\n".join([f"  {line}" for line in lines]))
+            changed = True
+
+    if not changed:
+        print("No changes to the generated bindings or constants.")
+    print(f"Compared in {time.perf_counter() - start:.3f}s")
+
+    # Exits with 1 when something changed, like diff.
+    sys.exit(1 if changed else 0)
+
+if __name__ == "__main__":
+    main()
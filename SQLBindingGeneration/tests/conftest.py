@@ -0,0 +1,107 @@
+"""
+Tests for the SQL binding generator, run against a small synthetic FDB.
+Needs pytest, but not the game:
+
+    python -m pytest SQLBindingGeneration/tests
+
+Generated output is compared with the files in `golden`. After an
+intended change to the output, review it and rewrite them with
+`--update-golden`.
+"""
+
+import os
+import sqlite3
+import sys
+import pytest
+
+tests_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, os.path.join(tests_path, ".."))
+sys.path.insert(0, os.path.join(tests_path, "..", "benchmarks"))
+
+from synthetic_fdb import read_tables, write_fdb
+
+golden_folder = os.path.join(tests_path, "golden")
+
+# Name the synthetic database is generated under.
+golden_database = "Synthetic"
+
+# Tables shaped like TrackedRideCars, filled with generated rows, and
+# their row count. Defined here so game patches don't change the output.
+synthetic_tables_sql = """
+CREATE TABLE Cars (
+    TrainID TEXT NOT NULL,
+    CarID TEXT NOT NULL,
+    Mass REAL NOT NULL,
+    WhichCar TEXT,
+    CarOrder INTEGER,
+    Prefab TEXT,
+    PlatformPrefab TEXT,
+    IsPowered INTEGER,
+    PRIMARY KEY (TrainID, CarID)
+);
+CREATE TABLE WhichCar (
+    ID TEXT NOT NULL,
+    PRIMARY KEY (ID)
+);
+"""
+synthetic_row_count = 40
+
+# Tables with the foreign keys, unique indexes, defaults and nullable
+# columns that the tables above don't have.
+lookup_tables_sql = [
+    """CREATE TABLE Parks (
+        ParkID INTEGER PRIMARY KEY,
+        Name TEXT NOT NULL UNIQUE,
+        Rating REAL DEFAULT 0
+    );""",
+    """CREATE TABLE Rides (
+        RideID INTEGER NOT NULL,
+        ParkID INTEGER NOT NULL REFERENCES Parks(ParkID),
+        Name TEXT NOT NULL,
+        Speed REAL,
+        Tag TEXT,
+        Enabled BOOLEAN NOT NULL DEFAULT 1,
+        PRIMARY KEY (RideID)
+    );""",
+    "CREATE UNIQUE INDEX Rides_ParkName ON Rides (ParkID, Name);"
+]
+
+def _get_lookup_rows() -> dict[str, list[tuple]]:
+    parks = [(park, f"Park <{park}> & \"co\"", park / 2) for park in range(1, 6)]
+    rides = [
+        (ride, 1 + ride % 5, f"Ride{ride}", None if ride % 3 == 0 else ride * 1.5, ["Family", "Thrill", None][ride % 3], ride % 2)
+        for ride in range(1, 31)
+    ]
+    return {"Parks": parks, "Rides": rides}
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-golden",
+        action="store_true",
+        help="Rewrite the golden files from the generator's current output"
+    )
+
+@pytest.fixture(scope="session")
+def update_golden(request) -> bool:
+    return request.config.getoption("--update-golden")
+
+@pytest.fixture(scope="session")
+def synthetic_fdb(tmp_path_factory) -> str:
+    """
+    Builds an FDB with the synthetic tables and the lookup tables.
+    """
+    path = str(tmp_path_factory.mktemp("fdb") / f"{golden_database}.fdb")
+    write_fdb(path, read_tables(synthetic_tables_sql), synthetic_row_count)
+
+    conn = sqlite3.connect(path)
+    try:
+        for sql in lookup_tables_sql:
+            conn.execute(sql)
+        for table_name, rows in _get_lookup_rows().items():
+            placeholders = ", ".join(["?"] * len(rows[0]))
+            conn.executemany(f"INSERT INTO {table_name} VALUES ({placeholders});", rows)
+        conn.commit()
+    finally:
+        conn.close()
+
+    return path
@@ -0,0 +1,690 @@
+---
+--- NOTE: THIS FILE IS AUTOGENERATED.
+--- PLEASE NOTE THAT THIS IS SUBJECT TO CHANGE
+--- BETWEEN EACH VERSION. IF BROKEN BY AN UPDATE,
+--- REGENERATE VIA THE SCRIPT IN SQLBINDINGFOLDER.
+--- 
+local global = _G
+local ipairs = global.ipairs
+local DatabaseUtils = require("forgeutils.internal.database.databaseutils")
+
+local logger = require("forgeutils.logger").Get("Synthetic")
+
+---@class forgeutils.internal.database.Synthetic
+--- Note: Autogenerated!
+--- This is a generated lua binding layer for the Synthetic database.
+local Synthetic = {}
+
+---@private
+--- This method is called after data is merged
+Synthetic.InsertToDBs = function()
+    -- The databases are merged again, so every table has to be bound again.
+    Synthetic.tBoundPreparedStatements = {}
+    Synthetic.BindPreparedStatements()
+end
+
+--- The pscollection holding each table's prepared statements.
+Synthetic.tPreparedStatements = {
+    Cars = "Synthetic_Cars", 
+    WhichCar = "Synthetic_WhichCar", 
+    Parks = "Synthetic_Parks", 
+    Rides = "Synthetic_Rides"
+}
+
+--- Tables whose prepared statements are bound in InsertToDBs. Every other
+--- table is bound on the first call to one of its functions. Add tables
+--- here (before InsertToDBs) to bind them eagerly.
+---@type string[]
+Synthetic.tPrewarmTables = {
+
+}
+
+---@private
+--- The pscollections bound since the last InsertToDBs. Failed binds are
+--- not kept, so they are tried again on the next call.
+---@type table<string, boolean>
+Synthetic.tBoundPreparedStatements = {}
+
+---@private
+function Synthetic.BindPreparedStatements()
+    logger:DebugQuery("BindPreparedStatements()")
+    for _, tableName in ipairs(Synthetic.tPrewarmTables) do
+        Synthetic.EnsureBound(tableName)
+    end
+end
+
+--- Binds the prepared statements of a table, unless they already are.
+--- Generated functions call this themselves.
+---@param tableName string
+---@return boolean result
+function Synthetic.EnsureBound(tableName)
+    local filename = Synthetic.tPreparedStatements[tableName]
+    if Synthetic.tBoundPreparedStatements[filename] then
+        return true
+    end
+
+    local bBound = DatabaseUtils.BindPreparedStatement("Synthetic", filename)
+    if bBound then
+        Synthetic.tBoundPreparedStatements[filename] = true
+    end
+    return bBound
+end
+
+--- Runs fn with the Synthetic database writable once for all of its queries.
+--- See DatabaseUtils.WithWriteScope.
+---@param fn function
+---@return any ...
+function Synthetic.WithWriteScope(fn)
+    return DatabaseUtils.WithWriteScope("Synthetic", fn)
+end
+
+
+--- Note: Autogenerated.
+--- Selector for table Cars.
+---@param TrainID string Common Values = "TrainID0", "TrainID1", "TrainID10", "TrainID11", "TrainID12". 
+---@param CarID string Common Values = "CarID0", "CarID1", "CarID10", "CarID11", "CarID12". 
+---@return table|nil data
+function Synthetic.Cars__Select(TrainID, CarID)
+    Synthetic.EnsureBound("Cars")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Cars__Select", {TrainID, CarID}, 2)
+    if results == nil then
+        return nil
+    end
+    local result = results[1]
+    if result == nil then
+        return nil
+    end
+    return {
+        TrainID = result[1] or nil,
+        CarID = result[2] or nil,
+        Mass = result[3] or nil,
+        WhichCar = result[4] or nil,
+        CarOrder = result[5] or nil,
+        Prefab = result[6] or nil,
+        PlatformPrefab = result[7] or nil,
+        IsPowered = result[8] or nil,
+    }
+end
+
+--- Note: Autogenerated.
+--- Gets field "Mass" from Cars. Common Values = 0.0, 0.75, 1.5, 2.25, 3.0. 
+---@param TrainID string Common Values = "TrainID0", "TrainID1", "TrainID10", "TrainID11", "TrainID12". 
+---@param CarID string Common Values = "CarID0", "CarID1", "CarID10", "CarID11", "CarID12". 
+---@return number|nil Mass
+function Synthetic.Cars__Get__Mass(TrainID, CarID)
+    Synthetic.EnsureBound("Cars")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Cars__Get__Mass", {TrainID, CarID}, 2)
+    if results == nil or results[1] == nil then
+        return nil
+    end
+    return results[1][1]
+end
+
+--- Note: Autogenerated.
+--- Gets field "WhichCar" from Cars. Common Values = "WhichCar_0", "WhichCar_12", "WhichCar_4", "WhichCar_8", "WhichCar_16". 
+---@param TrainID string Common Values = "TrainID0", "TrainID1", "TrainID10", "TrainID11", "TrainID12". 
+---@param CarID string Common Values = "CarID0", "CarID1", "CarID10", "CarID11", "CarID12". 
+---@return string|nil WhichCar
+function Synthetic.Cars__Get__WhichCar(TrainID, CarID)
+    Synthetic.EnsureBound("Cars")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Cars__Get__WhichCar", {TrainID, CarID}, 2)
+    if results == nil or results[1] == nil then
+        return nil
+    end
+    return results[1][1]
+end
+
+--- Note: Autogenerated.
+--- Gets field "CarOrder" from Cars. Common Values = 0, 4, 5, 9, 10. 
+---@param TrainID string Common Values = "TrainID0", "TrainID1", "TrainID10", "TrainID11", "TrainID12". 
+---@param CarID string Common Values = "CarID0", "CarID1", "CarID10", "CarID11", "CarID12". 
+---@return integer|nil CarOrder
+function Synthetic.Cars__Get__CarOrder(TrainID, CarID)
+    Synthetic.EnsureBound("Cars")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Cars__Get__CarOrder", {TrainID, CarID}, 2)
+    if results == nil or results[1] == nil then
+        return nil
+    end
+    return results[1][1]
+end
+
+--- Note: Autogenerated.
+--- Gets field "Prefab" from Cars. Common Values = "Prefab_0", "Prefab_6", "Prefab_10", "Prefab_12", "Prefab_14". 
+---@param TrainID string Common Values = "TrainID0", "TrainID1", "TrainID10", "TrainID11", "TrainID12". 
+---@param CarID string Common Values = "CarID0", "CarID1", "CarID10", "CarID11", "CarID12". 
+---@return string|nil Prefab
+function Synthetic.Cars__Get__Prefab(TrainID, CarID)
+    Synthetic.EnsureBound("Cars")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Cars__Get__Prefab", {TrainID, CarID}, 2)
+    if results == nil or results[1] == nil then
+        return nil
+    end
+    return results[1][1]
+end
+
+--- Note: Autogenerated.
+--- Gets field "PlatformPrefab" from Cars. Common Values = "PlatformPrefab_0", "PlatformPrefab_1", "PlatformPrefab_11", "PlatformPrefab_12", "PlatformPrefab_13". 
+---@param TrainID string Common Values = "TrainID0", "TrainID1", "TrainID10", "TrainID11", "TrainID12". 
+---@param CarID string Common Values = "CarID0", "CarID1", "CarID10", "CarID11", "CarID12". 
+---@return string|nil PlatformPrefab
+function Synthetic.Cars__Get__PlatformPrefab(TrainID, CarID)
+    Synthetic.EnsureBound("Cars")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Cars__Get__PlatformPrefab", {TrainID, CarID}, 2)
+    if results == nil or results[1] == nil then
+        return nil
+    end
+    return results[1][1]
+end
+
+--- Note: Autogenerated.
+--- Gets field "IsPowered" from Cars. Common Values = 0, 4, 8, 12, 16. 
+---@param TrainID string Common Values = "TrainID0", "TrainID1", "TrainID10", "TrainID11", "TrainID12". 
+---@param CarID string Common Values = "CarID0", "CarID1", "CarID10", "CarID11", "CarID12". 
+---@return integer|nil IsPowered
+function Synthetic.Cars__Get__IsPowered(TrainID, CarID)
+    Synthetic.EnsureBound("Cars")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Cars__Get__IsPowered", {TrainID, CarID}, 2)
+    if results == nil or results[1] == nil then
+        return nil
+    end
+    return results[1][1]
+end
+
+--- Note: Autogenerated.
+--- Inserter for table Cars.
+---@param TrainID string Common Values = "TrainID0", "TrainID1", "TrainID10", "TrainID11", "TrainID12". 
+---@param CarID string Common Values = "CarID0", "CarID1", "CarID10", "CarID11", "CarID12". 
+---@param Mass number Common Values = 0.0, 0.75, 1.5, 2.25, 3.0. 
+---@return nil
+function Synthetic.Cars__Insert(TrainID, CarID, Mass)
+    Synthetic.EnsureBound("Cars")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Cars__Insert", {TrainID, CarID, Mass}, 3)
+end
+
+--- Note: Autogenerated.
+--- Bulk inserter for table Cars. Each row is a table keyed by column name,
+--- see Cars__Insert for the columns. Rows are inserted in one write scope, 16 at a time.
+---@param rows table[]
+---@return nil
+function Synthetic.Cars__InsertMany(rows)
+    Synthetic.EnsureBound("Cars")
+    DatabaseUtils.WithWriteScope("Synthetic", function()
+        local count = #rows
+        local first = 1
+        while count - first + 1 >= 16 do
+            local args = {}
+            for i = 0, 16 - 1 do
+                local row = rows[first + i]
+                local offset = i * 3
+                args[offset + 1] = row.TrainID
+                args[offset + 2] = row.CarID
+                args[offset + 3] = row.Mass
+            end
+            DatabaseUtils.ExecuteQuery("Synthetic", "Cars__InsertMany", args, 48)
+            first = first + 16
+        end
+        for i = first, count do
+            local row = rows[i]
+            Synthetic.Cars__Insert(row.TrainID, row.CarID, row.Mass)
+        end
+    end)
+end
+
+--- Note: Autogenerated.
+--- Updates any fields of a row in Cars in one query. Both tables are keyed by column name.
+--- Fields missing from (or nil in) `changes` are left unchanged, so this can't set a field to nil.
+---@param keys table Lookup keys: TrainID, CarID
+---@param changes table Fields to change: Mass, WhichCar, CarOrder, Prefab, PlatformPrefab, IsPowered
+---@return nil
+function Synthetic.Cars__UpdateRow(keys, changes)
+    Synthetic.EnsureBound("Cars")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Cars__UpdateRow", {keys.TrainID, keys.CarID, changes.Mass, changes.WhichCar, changes.CarOrder, changes.Prefab, changes.PlatformPrefab, changes.IsPowered}, 8)
+end
+
+--- Note: Autogenerated.
+--- Updates field "Mass" in Cars. Common Values = 0.0, 0.75, 1.5, 2.25, 3.0. 
+---@param TrainID string Common Values = "TrainID0", "TrainID1", "TrainID10", "TrainID11", "TrainID12".  (Lookup Key)
+---@param CarID string Common Values = "CarID0", "CarID1", "CarID10", "CarID11", "CarID12".  (Lookup Key)
+---@param Mass number Common Values = 0.0, 0.75, 1.5, 2.25, 3.0. 
+---@return nil
+function Synthetic.Cars__Update__Mass(TrainID, CarID, Mass)
+    Synthetic.EnsureBound("Cars")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Cars__Update__Mass", {TrainID, CarID, Mass}, 3)
+end
+
+--- Note: Autogenerated.
+--- Updates field "WhichCar" in Cars. Common Values = "WhichCar_0", "WhichCar_12", "WhichCar_4", "WhichCar_8", "WhichCar_16". 
+---@param TrainID string Common Values = "TrainID0", "TrainID1", "TrainID10", "TrainID11", "TrainID12".  (Lookup Key)
+---@param CarID string Common Values = "CarID0", "CarID1", "CarID10", "CarID11", "CarID12".  (Lookup Key)
+---@param WhichCar string|nil Common Values = "WhichCar_0", "WhichCar_12", "WhichCar_4", "WhichCar_8", "WhichCar_16". 
+---@return nil
+function Synthetic.Cars__Update__WhichCar(TrainID, CarID, WhichCar)
+    Synthetic.EnsureBound("Cars")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Cars__Update__WhichCar", {TrainID, CarID, WhichCar}, 3)
+end
+
+--- Note: Autogenerated.
+--- Updates field "CarOrder" in Cars. Common Values = 0, 4, 5, 9, 10. 
+---@param TrainID string Common Values = "TrainID0", "TrainID1", "TrainID10", "TrainID11", "TrainID12".  (Lookup Key)
+---@param CarID string Common Values = "CarID0", "CarID1", "CarID10", "CarID11", "CarID12".  (Lookup Key)
+---@param CarOrder integer|nil Common Values = 0, 4, 5, 9, 10. 
+---@return nil
+function Synthetic.Cars__Update__CarOrder(TrainID, CarID, CarOrder)
+    Synthetic.EnsureBound("Cars")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Cars__Update__CarOrder", {TrainID, CarID, CarOrder}, 3)
+end
+
+--- Note: Autogenerated.
+--- Updates field "Prefab" in Cars. Common Values = "Prefab_0", "Prefab_6", "Prefab_10", "Prefab_12", "Prefab_14". 
+---@param TrainID string Common Values = "TrainID0", "TrainID1", "TrainID10", "TrainID11", "TrainID12".  (Lookup Key)
+---@param CarID string Common Values = "CarID0", "CarID1", "CarID10", "CarID11", "CarID12".  (Lookup Key)
+---@param Prefab string|nil Common Values = "Prefab_0", "Prefab_6", "Prefab_10", "Prefab_12", "Prefab_14". 
+---@return nil
+function Synthetic.Cars__Update__Prefab(TrainID, CarID, Prefab)
+    Synthetic.EnsureBound("Cars")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Cars__Update__Prefab", {TrainID, CarID, Prefab}, 3)
+end
+
+--- Note: Autogenerated.
+--- Updates field "PlatformPrefab" in Cars. Common Values = "PlatformPrefab_0", "PlatformPrefab_1", "PlatformPrefab_11", "PlatformPrefab_12", "PlatformPrefab_13". 
+---@param TrainID string Common Values = "TrainID0", "TrainID1", "TrainID10", "TrainID11", "TrainID12".  (Lookup Key)
+---@param CarID string Common Values = "CarID0", "CarID1", "CarID10", "CarID11", "CarID12".  (Lookup Key)
+---@param PlatformPrefab string|nil Common Values = "PlatformPrefab_0", "PlatformPrefab_1", "PlatformPrefab_11", "PlatformPrefab_12", "PlatformPrefab_13". 
+---@return nil
+function Synthetic.Cars__Update__PlatformPrefab(TrainID, CarID, PlatformPrefab)
+    Synthetic.EnsureBound("Cars")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Cars__Update__PlatformPrefab", {TrainID, CarID, PlatformPrefab}, 3)
+end
+
+--- Note: Autogenerated.
+--- Updates field "IsPowered" in Cars. Common Values = 0, 4, 8, 12, 16. 
+---@param TrainID string Common Values = "TrainID0", "TrainID1", "TrainID10", "TrainID11", "TrainID12".  (Lookup Key)
+---@param CarID string Common Values = "CarID0", "CarID1", "CarID10", "CarID11", "CarID12".  (Lookup Key)
+---@param IsPowered integer|nil Common Values = 0, 4, 8, 12, 16. 
+---@return nil
+function Synthetic.Cars__Update__IsPowered(TrainID, CarID, IsPowered)
+    Synthetic.EnsureBound("Cars")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Cars__Update__IsPowered", {TrainID, CarID, IsPowered}, 3)
+end
+
+--- Note: Autogenerated.
+--- Selector for table WhichCar.
+---@param ID string Common Values = "ID0", "ID1", "ID10", "ID11", "ID12". 
+---@return table|nil data
+function Synthetic.WhichCar__Select(ID)
+    Synthetic.EnsureBound("WhichCar")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "WhichCar__Select", {ID}, 1)
+    if results == nil then
+        return nil
+    end
+    local result = results[1]
+    if result == nil then
+        return nil
+    end
+    return {
+        ID = result[1] or nil,
+    }
+end
+
+--- Note: Autogenerated.
+--- Inserter for table WhichCar.
+---@param ID string Common Values = "ID0", "ID1", "ID10", "ID11", "ID12". 
+---@return nil
+function Synthetic.WhichCar__Insert(ID)
+    Synthetic.EnsureBound("WhichCar")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "WhichCar__Insert", {ID}, 1)
+end
+
+--- Note: Autogenerated.
+--- Bulk inserter for table WhichCar. Each row is a table keyed by column name,
+--- see WhichCar__Insert for the columns. Rows are inserted in one write scope, 16 at a time.
+---@param rows table[]
+---@return nil
+function Synthetic.WhichCar__InsertMany(rows)
+    Synthetic.EnsureBound("WhichCar")
+    DatabaseUtils.WithWriteScope("Synthetic", function()
+        local count = #rows
+        local first = 1
+        while count - first + 1 >= 16 do
+            local args = {}
+            for i = 0, 16 - 1 do
+                local row = rows[first + i]
+                local offset = i * 1
+                args[offset + 1] = row.ID
+            end
+            DatabaseUtils.ExecuteQuery("Synthetic", "WhichCar__InsertMany", args, 16)
+            first = first + 16
+        end
+        for i = first, count do
+            local row = rows[i]
+            Synthetic.WhichCar__Insert(row.ID)
+        end
+    end)
+end
+
+--- Note: Autogenerated.
+--- Selector for table Parks.
+---@param ParkID integer|nil Common Values = 1, 2, 3, 4, 5. 
+---@param Name string Common Values = "Park <1> & "co"", "Park <2> & "co"", "Park <3> & "co"", "Park <4> & "co"", "Park <5> & "co"". 
+---@return table|nil data
+function Synthetic.Parks__Select(ParkID, Name)
+    Synthetic.EnsureBound("Parks")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Parks__Select", {ParkID, Name}, 2)
+    if results == nil then
+        return nil
+    end
+    local result = results[1]
+    if result == nil then
+        return nil
+    end
+    return {
+        ParkID = result[1] or nil,
+        Name = result[2] or nil,
+        Rating = result[3] or nil,
+    }
+end
+
+--- Note: Autogenerated.
+--- Selects the row of table Parks by Name.
+---@param Name string Common Values = "Park <1> & "co"", "Park <2> & "co"", "Park <3> & "co"", "Park <4> & "co"", "Park <5> & "co"". 
+---@return table|nil data
+function Synthetic.Parks__SelectByName(Name)
+    Synthetic.EnsureBound("Parks")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Parks__SelectByName", {Name}, 1)
+    if results == nil then
+        return nil
+    end
+    local result = results[1]
+    if result == nil then
+        return nil
+    end
+    return {
+        ParkID = result[1] or nil,
+        Name = result[2] or nil,
+        Rating = result[3] or nil,
+    }
+end
+
+--- Note: Autogenerated.
+--- Gets field "Rating" from Parks. Default = "0". Common Values = 0.5, 1.0, 1.5, 2.0, 2.5. 
+---@param ParkID integer|nil Common Values = 1, 2, 3, 4, 5. 
+---@param Name string Common Values = "Park <1> & "co"", "Park <2> & "co"", "Park <3> & "co"", "Park <4> & "co"", "Park <5> & "co"". 
+---@return number|nil Rating
+function Synthetic.Parks__Get__Rating(ParkID, Name)
+    Synthetic.EnsureBound("Parks")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Parks__Get__Rating", {ParkID, Name}, 2)
+    if results == nil or results[1] == nil then
+        return nil
+    end
+    return results[1][1]
+end
+
+--- Note: Autogenerated.
+--- Inserter for table Parks.
+---@param ParkID integer|nil Common Values = 1, 2, 3, 4, 5. 
+---@param Name string Common Values = "Park <1> & "co"", "Park <2> & "co"", "Park <3> & "co"", "Park <4> & "co"", "Park <5> & "co"". 
+---@return nil
+function Synthetic.Parks__Insert(ParkID, Name)
+    Synthetic.EnsureBound("Parks")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Parks__Insert", {ParkID, Name}, 2)
+end
+
+--- Note: Autogenerated.
+--- Bulk inserter for table Parks. Each row is a table keyed by column name,
+--- see Parks__Insert for the columns. Rows are inserted in one write scope, 16 at a time.
+---@param rows table[]
+---@return nil
+function Synthetic.Parks__InsertMany(rows)
+    Synthetic.EnsureBound("Parks")
+    DatabaseUtils.WithWriteScope("Synthetic", function()
+        local count = #rows
+        local first = 1
+        while count - first + 1 >= 16 do
+            local args = {}
+            for i = 0, 16 - 1 do
+                local row = rows[first + i]
+                local offset = i * 2
+                args[offset + 1] = row.ParkID
+                args[offset + 2] = row.Name
+            end
+            DatabaseUtils.ExecuteQuery("Synthetic", "Parks__InsertMany", args, 32)
+            first = first + 16
+        end
+        for i = first, count do
+            local row = rows[i]
+            Synthetic.Parks__Insert(row.ParkID, row.Name)
+        end
+    end)
+end
+
+--- Note: Autogenerated.
+--- Updates any fields of a row in Parks in one query. Both tables are keyed by column name.
+--- Fields missing from (or nil in) `changes` are left unchanged, so this can't set a field to nil.
+---@param keys table Lookup keys: ParkID, Name
+---@param changes table Fields to change: Rating
+---@return nil
+function Synthetic.Parks__UpdateRow(keys, changes)
+    Synthetic.EnsureBound("Parks")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Parks__UpdateRow", {keys.ParkID, keys.Name, changes.Rating}, 3)
+end
+
+--- Note: Autogenerated.
+--- Updates field "Rating" in Parks. Default = "0". Common Values = 0.5, 1.0, 1.5, 2.0, 2.5. 
+---@param ParkID integer|nil Common Values = 1, 2, 3, 4, 5.  (Lookup Key)
+---@param Name string Common Values = "Park <1> & "co"", "Park <2> & "co"", "Park <3> & "co"", "Park <4> & "co"", "Park <5> & "co"".  (Lookup Key)
+---@param Rating number|nil Default = "0". Common Values = 0.5, 1.0, 1.5, 2.0, 2.5. 
+---@return nil
+function Synthetic.Parks__Update__Rating(ParkID, Name, Rating)
+    Synthetic.EnsureBound("Parks")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Parks__Update__Rating", {ParkID, Name, Rating}, 3)
+end
+
+--- Note: Autogenerated.
+--- Selector for table Rides.
+---@param RideID integer Common Values = 1, 2, 3, 4, 5. 
+---@param ParkID integer Common Values = 1, 2, 3, 4, 5. 
+---@param Name string Common Values = "Ride1", "Ride10", "Ride11", "Ride12", "Ride13". 
+---@return table|nil data
+function Synthetic.Rides__Select(RideID, ParkID, Name)
+    Synthetic.EnsureBound("Rides")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Rides__Select", {RideID, ParkID, Name}, 3)
+    if results == nil then
+        return nil
+    end
+    local result = results[1]
+    if result == nil then
+        return nil
+    end
+    return {
+        RideID = result[1] or nil,
+        ParkID = result[2] or nil,
+        Name = result[3] or nil,
+        Speed = result[4] or nil,
+        Tag = result[5] or nil,
+        Enabled = result[6] or nil,
+    }
+end
+
+--- Note: Autogenerated.
+--- Selects the row of table Rides by ParkID, Name.
+---@param ParkID integer Common Values = 1, 2, 3, 4, 5. 
+---@param Name string Common Values = "Ride1", "Ride10", "Ride11", "Ride12", "Ride13". 
+---@return table|nil data
+function Synthetic.Rides__SelectByParkID_Name(ParkID, Name)
+    Synthetic.EnsureBound("Rides")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Rides__SelectByParkID_Name", {ParkID, Name}, 2)
+    if results == nil then
+        return nil
+    end
+    local result = results[1]
+    if result == nil then
+        return nil
+    end
+    return {
+        RideID = result[1] or nil,
+        ParkID = result[2] or nil,
+        Name = result[3] or nil,
+        Speed = result[4] or nil,
+        Tag = result[5] or nil,
+        Enabled = result[6] or nil,
+    }
+end
+
+--- Note: Autogenerated.
+--- Selects the rows of table Rides by ParkID.
+---@param ParkID integer Common Values = 1, 2, 3, 4, 5. 
+---@return table[] rows
+function Synthetic.Rides__SelectByParkID(ParkID)
+    Synthetic.EnsureBound("Rides")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Rides__SelectByParkID", {ParkID}, 1)
+    local rows = {}
+    if results == nil then
+        return rows
+    end
+    for i, result in ipairs(results) do
+        rows[i] = {
+            RideID = result[1] or nil,
+            ParkID = result[2] or nil,
+            Name = result[3] or nil,
+            Speed = result[4] or nil,
+            Tag = result[5] or nil,
+            Enabled = result[6] or nil,
+        }
+    end
+    return rows
+end
+
+--- Note: Autogenerated.
+--- Gets field "Speed" from Rides. Common Values = nil, 1.5, 3.0, 6.0, 7.5. 
+---@param RideID integer Common Values = 1, 2, 3, 4, 5. 
+---@param ParkID integer Common Values = 1, 2, 3, 4, 5. 
+---@param Name string Common Values = "Ride1", "Ride10", "Ride11", "Ride12", "Ride13". 
+---@return number|nil Speed
+function Synthetic.Rides__Get__Speed(RideID, ParkID, Name)
+    Synthetic.EnsureBound("Rides")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Rides__Get__Speed", {RideID, ParkID, Name}, 3)
+    if results == nil or results[1] == nil then
+        return nil
+    end
+    return results[1][1]
+end
+
+--- Note: Autogenerated.
+--- Gets field "Tag" from Rides. Common Values = nil, "Family", "Thrill". 
+---@param RideID integer Common Values = 1, 2, 3, 4, 5. 
+---@param ParkID integer Common Values = 1, 2, 3, 4, 5. 
+---@param Name string Common Values = "Ride1", "Ride10", "Ride11", "Ride12", "Ride13". 
+---@return string|nil Tag
+function Synthetic.Rides__Get__Tag(RideID, ParkID, Name)
+    Synthetic.EnsureBound("Rides")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Rides__Get__Tag", {RideID, ParkID, Name}, 3)
+    if results == nil or results[1] == nil then
+        return nil
+    end
+    return results[1][1]
+end
+
+--- Note: Autogenerated.
+--- Gets field "Enabled" from Rides. Default = "1". Common Values = 0, 1. 
+---@param RideID integer Common Values = 1, 2, 3, 4, 5. 
+---@param ParkID integer Common Values = 1, 2, 3, 4, 5. 
+---@param Name string Common Values = "Ride1", "Ride10", "Ride11", "Ride12", "Ride13". 
+---@return boolean|nil Enabled
+function Synthetic.Rides__Get__Enabled(RideID, ParkID, Name)
+    Synthetic.EnsureBound("Rides")
+    local results = DatabaseUtils.ExecuteQuery("Synthetic", "Rides__Get__Enabled", {RideID, ParkID, Name}, 3)
+    if results == nil or results[1] == nil then
+        return nil
+    end
+    return results[1][1]
+end
+
+--- Note: Autogenerated.
+--- Inserter for table Rides.
+---@param RideID integer Common Values = 1, 2, 3, 4, 5. 
+---@param ParkID integer Common Values = 1, 2, 3, 4, 5. 
+---@param Name string Common Values = "Ride1", "Ride10", "Ride11", "Ride12", "Ride13". 
+---@return nil
+function Synthetic.Rides__Insert(RideID, ParkID, Name)
+    Synthetic.EnsureBound("Rides")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Rides__Insert", {RideID, ParkID, Name}, 3)
+end
+
+--- Note: Autogenerated.
+--- Bulk inserter for table Rides. Each row is a table keyed by column name,
+--- see Rides__Insert for the columns. Rows are inserted in one write scope, 16 at a time.
+---@param rows table[]
+---@return nil
+function Synthetic.Rides__InsertMany(rows)
+    Synthetic.EnsureBound("Rides")
+    DatabaseUtils.WithWriteScope("Synthetic", function()
+        local count = #rows
+        local first = 1
+        while count - first + 1 >= 16 do
+            local args = {}
+            for i = 0, 16 - 1 do
+                local row = rows[first + i]
+                local offset = i * 3
+                args[offset + 1] = row.RideID
+                args[offset + 2] = row.ParkID
+                args[offset + 3] = row.Name
+            end
+            DatabaseUtils.ExecuteQuery("Synthetic", "Rides__InsertMany", args, 48)
+            first = first + 16
+        end
+        for i = first, count do
+            local row = rows[i]
+            Synthetic.Rides__Insert(row.RideID, row.ParkID, row.Name)
+        end
+    end)
+end
+
+--- Note: Autogenerated.
+--- Updates any fields of a row in Rides in one query. Both tables are keyed by column name.
+--- Fields missing from (or nil in) `changes` are left unchanged, so this can't set a field to nil.
+---@param keys table Lookup keys: RideID, ParkID, Name
+---@param changes table Fields to change: Speed, Tag, Enabled
+---@return nil
+function Synthetic.Rides__UpdateRow(keys, changes)
+    Synthetic.EnsureBound("Rides")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Rides__UpdateRow", {keys.RideID, keys.ParkID, keys.Name, changes.Speed, changes.Tag, changes.Enabled}, 6)
+end
+
+--- Note: Autogenerated.
+--- Updates field "Speed" in Rides. Common Values = nil, 1.5, 3.0, 6.0, 7.5. 
+---@param RideID integer Common Values = 1, 2, 3, 4, 5.  (Lookup Key)
+---@param ParkID integer Common Values = 1, 2, 3, 4, 5.  (Lookup Key)
+---@param Name string Common Values = "Ride1", "Ride10", "Ride11", "Ride12", "Ride13".  (Lookup Key)
+---@param Speed number|nil Common Values = nil, 1.5, 3.0, 6.0, 7.5. 
+---@return nil
+function Synthetic.Rides__Update__Speed(RideID, ParkID, Name, Speed)
+    Synthetic.EnsureBound("Rides")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Rides__Update__Speed", {RideID, ParkID, Name, Speed}, 4)
+end
+
+--- Note: Autogenerated.
+--- Updates field "Tag" in Rides. Common Values = nil, "Family", "Thrill". 
+---@param RideID integer Common Values = 1, 2, 3, 4, 5.  (Lookup Key)
+---@param ParkID integer Common Values = 1, 2, 3, 4, 5.  (Lookup Key)
+---@param Name string Common Values = "Ride1", "Ride10", "Ride11", "Ride12", "Ride13".  (Lookup Key)
+---@param Tag string|nil Common Values = nil, "Family", "Thrill". 
+---@return nil
+function Synthetic.Rides__Update__Tag(RideID, ParkID, Name, Tag)
+    Synthetic.EnsureBound("Rides")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Rides__Update__Tag", {RideID, ParkID, Name, Tag}, 4)
+end
+
+--- Note: Autogenerated.
+--- Updates field "Enabled" in Rides. Default = "1". Common Values = 0, 1. 
+---@param RideID integer Common Values = 1, 2, 3, 4, 5.  (Lookup Key)
+---@param ParkID integer Common Values = 1, 2, 3, 4, 5.  (Lookup Key)
+---@param Name string Common Values = "Ride1", "Ride10", "Ride11", "Ride12", "Ride13".  (Lookup Key)
+---@param Enabled boolean Default = "1". Common Values = 0, 1. 
+---@return nil
+function Synthetic.Rides__Update__Enabled(RideID, ParkID, Name, Enabled)
+    Synthetic.EnsureBound("Rides")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Rides__Update__Enabled", {RideID, ParkID, Name, Enabled}, 4)
+end
+
+
+return Synthetic
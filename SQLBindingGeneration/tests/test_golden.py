@@ -0,0 +1,226 @@
+import os
+import shutil
+import sqlite3
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+import pytest
+from conftest import golden_database, golden_folder
+from bindings.introspection import extract_database_schema, get_table_names
+from bindings.pscolgen import PreparedStatement, map_sqltype_to_pscollection_type, write_root_file
+from bindings import table_generator
+from bindings.table_generator import generate_lua_for_table, generate_pscollection_for_table, _write_lua_for_table, extract_table_data, generate_for_database
+from bindings.tabletypes import TableParam
+
+lua_namespace = "forgeutils.internal.database"
+
+def _generate(fdb_path : str, out_folder : str, **kwargs) -> dict[str, bytes]:
+    """
+    Generates the bindings of an FDB and returns every output file by
+    path relative to `out_folder`.
+    """
+    init_folder = os.path.join(out_folder, "init")
+    lua_folder = os.path.join(out_folder, "lua")
+    os.makedirs(init_folder, exist_ok=True)
+    os.makedirs(lua_folder, exist_ok=True)
+
+    generate_for_database(fdb_path, golden_database, init_folder, lua_folder, lua_namespace, **kwargs)
+    return _read_folder(out_folder)
+
+def _read_folder(folder : str) -> dict[str, bytes]:
+    files = {}
+    for sub_folder in ["init", "lua"]:
+        for file_name in sorted(os.listdir(os.path.join(folder, sub_folder))):
+            with open(os.path.join(folder, sub_folder, file_name), "rb") as file:
+                files[f"{sub_folder}/{file_name}"] = file.read()
+    return files
+
+def _write_golden(files : dict[str, bytes]) -> None:
+    shutil.rmtree(golden_folder, ignore_errors=True)
+    for name, content in files.items():
+        path = os.path.join(golden_folder, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(content)
+
+def _get_element_tree_pscollection(statements : list[PreparedStatement]) -> str:
+    # How pscollections were written before PscollectionWriter.
+    root = ET.Element("PscollectionRoot", {"count": str(len(statements)), "game": "Planet Coaster 2"})
+    elem = ET.SubElement(root, "prepared_statements", {"pool_type": "4"})
+    for statement in statements:
+        ps_statement = ET.SubElement(elem, "prepared_statement", {"arg_count": str(len(statement.args))})
+        args_elem = ET.SubElement(ps_statement, "args", {"pool_type": "4"})
+        for index, arg in enumerate(statement.args, start=1):
+            ET.SubElement(args_elem, "arg", {"arg_type": map_sqltype_to_pscollection_type(arg.sql_type), "arg_index": str(index)})
+        ET.SubElement(ps_statement, "statement_name").text = statement.statement_name
+        ET.SubElement(ps_statement, "sql_query").text = statement.sql_query
+
+    ET.indent(ET.ElementTree(root))
+    return ET.tostring(root, encoding="unicode")
+
+def _get_pragma_schema(cursor : sqlite3.Cursor, table_name : str) -> tuple:
+    # How tables were introspected before the batched queries: a PRAGMA
+    # round-trip per table and per index.
+    cursor.execute(f"PRAGMA table_info({table_name});")
+    params = {col[1]: (col[2], bool(col[3]), col[4], bool(col[5])) for col in cursor.fetchall()}
+
+    cursor.execute(f"PRAGMA foreign_key_list({table_name});")
+    foreign_key_columns = {fk[3] for fk in cursor.fetchall()}
+
+    cursor.execute(f"PRAGMA index_list({table_name});")
+    unique_columns = []
+    for _, index_name, unique, _, partial in cursor.fetchall():
+        if unique and not partial:
+            cursor.execute(f"PRAGMA index_info({index_name});")
+            unique_columns += [col[2] for col in cursor.fetchall()]
+
+    primary_keys, required, optional = [], [], []
+    for name, (_, not_null, default, primary_key) in params.items():
+        if primary_key or name in foreign_key_columns or name in unique_columns:
+            primary_keys.append(name)
+        elif not (default is not None or not not_null):
+            required.append(name)
+        else:
+            optional.append(name)
+
+    return params, primary_keys, required, optional
+
+def test_output_matches_golden(synthetic_fdb, tmp_path, update_golden):
+    files = _generate(synthetic_fdb, str(tmp_path))
+
+    if update_golden:
+        _write_golden(files)
+        pytest.skip("Golden files updated")
+
+    golden = _read_folder(golden_folder)
+    assert list(files.keys()) == list(golden.keys())
+    for name, content in files.items():
+        assert content == golden[name], f"{name} differs from its golden file"
+
+@pytest.mark.parametrize("mode", ["cold cache", "warm cache", "executor"])
+def test_output_is_the_same_every_way(synthetic_fdb, tmp_path, mode):
+    # The cached and pooled paths keep each table's Lua as a string, the
+    # serial path streams it straight into the file.
+    expected = _generate(synthetic_fdb, str(tmp_path / "serial"))
+
+    out_folder = str(tmp_path / "out")
+    if mode == "executor":
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            files = _generate(synthetic_fdb, out_folder, executor=executor)
+    else:
+        cache_folder = str(tmp_path / "cache")
+        files = _generate(synthetic_fdb, out_folder, cache_dir=cache_folder)
+        if mode == "warm cache":
+            files = _generate(synthetic_fdb, out_folder, cache_dir=cache_folder)
+
+    assert files == expected
+
+def test_executor_connections_close_on_shutdown(synthetic_fdb, tmp_path, monkeypatch):
+    opened = []
+
+    class TrackedConnection(sqlite3.Connection):
+        closed = False
+
+        def close(self):
+            self.closed = True
+            super().close()
+
+    def connect(database_path):
+        opened.append(sqlite3.connect(database_path, factory=TrackedConnection))
+        return opened[-1]
+
+    monkeypatch.setattr(table_generator, "connect_fdb", connect)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        _generate(synthetic_fdb, str(tmp_path), executor=executor)
+        assert opened and not any(conn.closed for conn in opened)
+
+    assert all(conn.closed for conn in opened)
+
+def test_cache_notices_edited_rows(synthetic_fdb, tmp_path):
+    fdb_path = str(tmp_path / f"{golden_database}.fdb")
+    shutil.copy(synthetic_fdb, fdb_path)
+    cache_folder = str(tmp_path / "cache")
+    _generate(fdb_path, str(tmp_path / "out"), cache_dir=cache_folder)
+
+    # Same row count and rowids, only the values change.
+    conn = sqlite3.connect(fdb_path)
+    try:
+        conn.execute("UPDATE Rides SET Tag = 'Patched';")
+        conn.commit()
+    finally:
+        conn.close()
+
+    files = _generate(fdb_path, str(tmp_path / "out"), cache_dir=cache_folder)
+    assert files == _generate(fdb_path, str(tmp_path / "clean"))
+    assert b"\"Patched\"" in files[f"lua/{golden_database}.lua"]
+
+def test_approximate_statistics_report_collated_tables(tmp_path, capsys):
+    fdb_path = str(tmp_path / f"{golden_database}.fdb")
+    conn = sqlite3.connect(fdb_path)
+    try:
+        conn.execute("CREATE TABLE Plain (ID INTEGER PRIMARY KEY, Name TEXT NOT NULL);")
+        conn.execute("CREATE TABLE Collated (ID INTEGER PRIMARY KEY, Name TEXT NOT NULL COLLATE NOCASE);")
+        conn.commit()
+    finally:
+        conn.close()
+
+    _generate(fdb_path, str(tmp_path / "out"), approximate_capacity=4)
+    report = capsys.readouterr().out
+    assert "Collated declares a collation" in report
+    assert "Plain declares a collation" not in report
+
+def test_streamed_lua_matches_string_lua(synthetic_fdb):
+    conn = sqlite3.connect(synthetic_fdb)
+    try:
+        cursor = conn.cursor()
+        for table_name, schema in extract_database_schema(cursor).items():
+            table_data = extract_table_data(table_name, cursor, schema=schema)
+            out = StringIO()
+            _write_lua_for_table(out, golden_database, table_name, table_data, golden_database)
+            assert out.getvalue() == generate_lua_for_table(golden_database, table_name, table_data, golden_database)
+    finally:
+        conn.close()
+
+def test_pscollection_writer_matches_element_tree(synthetic_fdb):
+    conn = sqlite3.connect(synthetic_fdb)
+    try:
+        schema = extract_database_schema(conn.cursor())
+    finally:
+        conn.close()
+
+    text_param = TableParam("TEXT", True, None, False)
+    statement_lists = [
+        generate_pscollection_for_table(table_name, table_data)
+        for table_name, table_data in schema.items()
+    ] + [
+        [],
+        [PreparedStatement("NoArgs", "SELECT 1;", [])],
+        [PreparedStatement("Empty", "", [text_param])],
+        [PreparedStatement("Escaped <&> \"'", "SELECT * FROM T WHERE A = '<&>\"\n\t' AND B = ?1;", [text_param])]
+    ]
+
+    for statements in statement_lists:
+        out = StringIO()
+        write_root_file(out, statements)
+        assert out.getvalue() == _get_element_tree_pscollection(statements)
+
+def test_introspection_matches_pragmas(synthetic_fdb):
+    conn = sqlite3.connect(synthetic_fdb)
+    try:
+        cursor = conn.cursor()
+        table_names = get_table_names(cursor)
+        schema = extract_database_schema(cursor)
+        assert list(schema.keys()) == table_names
+
+        for table_name, table_data in schema.items():
+            params, primary_keys, required, optional = _get_pragma_schema(cursor, table_name)
+            assert {
+                name: (param.sql_type, param.not_null, param.default, param.primary_key)
+                for name, param in table_data.parameters.items()
+            } == params
+            assert list(table_data.parameters.keys()) == list(params.keys())
+            assert list(table_data.primary_keys.keys()) == primary_keys
+            assert list(table_data.required_parameters.keys()) == required
+            assert list(table_data.optional_parameters.keys()) == optional
+    finally:
+        conn.close()
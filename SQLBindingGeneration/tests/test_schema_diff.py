@@ -0,0 +1,36 @@
+import sqlite3
+from bindings.introspection import extract_database_schema
+from bindings.tabletypes import GenerationOptions
+from schema_diff import diff_statements
+
+def _get_schema(create_sql : str):
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute(create_sql)
+        return extract_database_schema(conn.cursor())["Foo"]
+    finally:
+        conn.close()
+
+old_sql = "CREATE TABLE Foo (FooID INTEGER PRIMARY KEY, Name TEXT NOT NULL, Speed REAL);"
+
+def test_unchanged_table_has_no_binding_changes():
+    assert diff_statements("Foo", _get_schema(old_sql), _get_schema(old_sql), GenerationOptions()) == []
+
+def test_reordered_columns_change_the_row_selects():
+    # SELECT * is the same SQL, but its Lua reads the columns by position.
+    new = _get_schema("CREATE TABLE Foo (FooID INTEGER PRIMARY KEY, Speed REAL, Name TEXT NOT NULL);")
+    lines = diff_statements("Foo", _get_schema(old_sql), new, GenerationOptions())
+
+    assert "~ Foo__Select" in lines
+    assert "~ Foo__UpdateRow" in lines
+    assert "~ Foo__Get__Name" not in lines
+
+def test_added_column():
+    new = _get_schema("CREATE TABLE Foo (FooID INTEGER PRIMARY KEY, Name TEXT NOT NULL, Speed REAL, Tag TEXT);")
+    lines = diff_statements("Foo", _get_schema(old_sql), new, GenerationOptions())
+
+    assert "+ Foo__Get__Tag" in lines
+    assert "+ Foo__Update__Tag" in lines
+    assert "~ Foo__Select" in lines
+    # Was the table's last function, and no longer is.
+    assert "~ Foo__Update__Speed" not in lines
@@ -0,0 +1,164 @@
+import re
+import sqlite3
+import pytest
+from conftest import golden_database
+from bindings.introspection import extract_database_schema, get_table_data
+from bindings.shared_gen import get_insert_many_batch_size, max_statement_parameters
+from bindings.table_generator import generate_lua_for_table, generate_pscollection_for_table
+from bindings.tabletypes import GenerationOptions, TableData, TableParam
+
+placeholder_pattern = re.compile(r"\?(\d+)")
+
+@pytest.fixture(scope="module")
+def rides(synthetic_fdb) -> TableData:
+    conn = sqlite3.connect(synthetic_fdb)
+    try:
+        return extract_database_schema(conn.cursor(), ["Rides"])["Rides"]
+    finally:
+        conn.close()
+
+def _get_statements(table_name : str, table_data : TableData, options : GenerationOptions | None = None) -> dict[str, tuple[str, list[str]]]:
+    return {
+        statement.statement_name: (statement.sql_query, [arg.sql_type for arg in statement.args])
+        for statement in generate_pscollection_for_table(table_name, table_data, options)
+    }
+
+def _get_wide_table(column_count : int) -> TableData:
+    # Every column is required, so every column is an insert parameter.
+    return get_table_data(
+        {f"Col{index}": TableParam("INTEGER", True, None, False) for index in range(column_count)},
+        [],
+        []
+    )
+
+def test_select_by_statements(rides):
+    statements = _get_statements("Rides", rides)
+
+    assert statements["Rides__SelectByParkID_Name"] == (
+        "SELECT * FROM Rides WHERE ParkID = ?1 AND Name = ?2;",
+        ["INTEGER", "TEXT"]
+    )
+    assert statements["Rides__SelectByParkID"] == (
+        "SELECT * FROM Rides WHERE ParkID = ?1;",
+        ["INTEGER"]
+    )
+
+def test_expression_and_partial_indexes_have_no_lookup():
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE TABLE Signs (SignID INTEGER PRIMARY KEY, ParkID INTEGER NOT NULL, Name TEXT NOT NULL, Code TEXT);")
+        conn.execute("CREATE UNIQUE INDEX Signs_LowerName ON Signs (lower(Name));")
+        conn.execute("CREATE UNIQUE INDEX Signs_ParkLowerName ON Signs (ParkID, lower(Name));")
+        conn.execute("CREATE UNIQUE INDEX Signs_Code ON Signs (Code) WHERE Code IS NOT NULL;")
+        signs = extract_database_schema(conn.cursor())["Signs"]
+    finally:
+        conn.close()
+
+    assert signs.get_lookups() == {}
+    # Plain columns of an expression index still identify rows.
+    assert list(signs.primary_keys.keys()) == ["SignID", "ParkID"]
+    statements = _get_statements("Signs", signs)
+    assert not [name for name in statements if "SelectBy" in name]
+    assert "SelectBy" not in generate_lua_for_table(golden_database, "Signs", signs, golden_database)
+
+def test_getter_statement(rides):
+    assert _get_statements("Rides", rides)["Rides__Get__Speed"] == (
+        "SELECT Speed FROM Rides WHERE RideID = ?1 AND ParkID = ?2 AND Name = ?3 LIMIT 1;",
+        ["INTEGER", "INTEGER", "TEXT"]
+    )
+
+def test_update_row_statement(rides):
+    assert _get_statements("Rides", rides)["Rides__UpdateRow"] == (
+        "UPDATE Rides SET Speed = COALESCE(?4, Speed), Tag = COALESCE(?5, Tag), Enabled = COALESCE(?6, Enabled) "
+        "WHERE RideID = ?1 AND ParkID = ?2 AND Name = ?3;",
+        ["INTEGER", "INTEGER", "TEXT", "REAL", "TEXT", "BOOLEAN"]
+    )
+
+def test_update_row_lua(rides):
+    lua = generate_lua_for_table(golden_database, "Rides", rides, golden_database)
+    assert """
+function Synthetic.Rides__UpdateRow(keys, changes)
+    Synthetic.EnsureBound("Rides")
+    return DatabaseUtils.ExecuteQuery("Synthetic", "Rides__UpdateRow", {keys.RideID, keys.ParkID, keys.Name, changes.Speed, changes.Tag, changes.Enabled}, 6)
+end
+""" in lua
+
+def test_insert_many_statement(rides):
+    sql, arg_types = _get_statements("Rides", rides, GenerationOptions(insert_many_batch_size=2))["Rides__InsertMany"]
+
+    assert sql == "INSERT OR REPLACE INTO Rides (RideID, ParkID, Name) VALUES (?1, ?2, ?3), (?4, ?5, ?6);"
+    assert arg_types == ["INTEGER", "INTEGER", "TEXT"] * 2
+
+@pytest.mark.parametrize("param_count, batch_size", [
+    (0, 0),
+    (1, 16),
+    (62, 16),
+    (63, 15),
+    (333, 3),
+    (334, 2),
+    (499, 2),
+    (500, 1),
+    (999, 1),
+    (1000, 0)
+])
+def test_insert_many_batch_size(param_count, batch_size):
+    assert get_insert_many_batch_size(param_count, 16) == batch_size
+
+@pytest.mark.parametrize("column_count", [62, 63, 333])
+def test_insert_many_statement_stays_within_parameter_limit(column_count):
+    table_data = _get_wide_table(column_count)
+    batch_size = get_insert_many_batch_size(column_count, 16)
+    sql, arg_types = _get_statements("Wide", table_data)["Wide__InsertMany"]
+
+    placeholders = [int(index) for index in placeholder_pattern.findall(sql)]
+    assert placeholders == list(range(1, column_count * batch_size + 1))
+    assert len(arg_types) == column_count * batch_size <= max_statement_parameters
+
+    # The statement inserts one row per batch entry.
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute(f"CREATE TABLE Wide ({", ".join(table_data.parameters.keys())});")
+        conn.execute(sql, {str(index): index for index in placeholders})
+        assert conn.execute("SELECT COUNT(*) FROM Wide;").fetchone()[0] == batch_size
+    finally:
+        conn.close()
+
+def test_insert_many_falls_back_above_parameter_limit():
+    # 500 columns leave room for a single row, which __Insert already does.
+    table_data = _get_wide_table(500)
+    assert "Wide__InsertMany" not in _get_statements("Wide", table_data)
+
+    lua = generate_lua_for_table(golden_database, "Wide", table_data, golden_database)
+    assert "function Synthetic.Wide__InsertMany(rows)" in lua
+    assert "\"Wide__InsertMany\"" not in lua
+
+def test_insert_many_lua_chunks_rows(rides):
+    # Runs the generated function against a stub DatabaseUtils.
+    lupa = pytest.importorskip("lupa")
+    lua = lupa.LuaRuntime()
+    table_lua = generate_lua_for_table(golden_database, "Rides", rides, golden_database, GenerationOptions(insert_many_batch_size=4))
+    insert_many = lua.execute("""
+        local calls = {}
+        local Synthetic = { EnsureBound = function() return true end }
+        local DatabaseUtils = {
+            WithWriteScope = function(_, fn) return fn() end,
+            ExecuteQuery = function(_, name, args, count)
+                calls[#calls + 1] = name .. ":" .. count .. ":" .. args[1] .. "-" .. args[count - 2]
+            end
+        }
+        local ipairs = ipairs
+    """ + table_lua + """
+        return function(rowCount)
+            local rows = {}
+            for i = 1, rowCount do
+                rows[i] = { RideID = i, ParkID = 1, Name = "Ride" .. i }
+            end
+            calls = {}
+            Synthetic.Rides__InsertMany(rows)
+            return table.concat(calls, " ")
+        end
+    """)
+
+    assert insert_many(0) == ""
+    assert insert_many(4) == "Rides__InsertMany:12:1-4"
+    assert insert_many(10) == "Rides__InsertMany:12:1-4 Rides__InsertMany:12:5-8 Rides__Insert:3:9-9 Rides__Insert:3:10-10"
@@ -0,0 +1,250 @@
+-- Tests for forgeutils.internal.database.databaseutils, run outside the game
+-- against a stub api.database. Needs only a Lua interpreter; from the
+-- repository root:
+--
+--     lua Tests/lua/databaseutils_test.lua
+
+package.path = "Main/?.lua;" .. package.path
+
+local moduleName = "forgeutils.internal.database.databaseutils"
+
+--- Stub of api.database recording every call.
+local StubDatabase = {}
+StubDatabase.__index = StubDatabase
+
+function StubDatabase.New()
+    local self = setmetatable({}, StubDatabase)
+    self.calls = {}
+    self.instanceCount = 0
+    self.bindResult = true
+    return self
+end
+
+function StubDatabase:Record(call)
+    self.calls[#self.calls + 1] = call
+end
+
+function StubDatabase:Count(call)
+    local count = 0
+    for _, recorded in ipairs(self.calls) do
+        if recorded == call then
+            count = count + 1
+        end
+    end
+    return count
+end
+
+function StubDatabase:Install()
+    local stub = self
+    return {
+        SetReadOnly = function(databaseName, bReadOnly)
+            stub:Record("SetReadOnly " .. databaseName .. " " .. tostring(bReadOnly))
+        end,
+        GetPreparedStatementInstance = function(databaseName, queryName)
+            stub.instanceCount = stub.instanceCount + 1
+            stub:Record("GetInstance " .. databaseName .. " " .. queryName)
+            return { queryName = queryName, id = stub.instanceCount }
+        end,
+        BindParameter = function(instance, index, value)
+            stub:Record("Bind " .. instance.id .. " " .. index .. " " .. tostring(value))
+        end,
+        BindComplete = function(instance) end,
+        Step = function(instance)
+            stub:Record("Step " .. instance.id)
+        end,
+        GetAllResults = function(instance, bReturnAsArray)
+            return { instance.id }
+        end,
+        BindPreparedStatementCollection = function(databaseName, pscollectionName)
+            stub:Record("BindCollection " .. databaseName .. " " .. pscollectionName)
+            return stub.bindResult
+        end
+    }
+end
+
+--- Loads a fresh copy of DatabaseUtils (so no write scope is left open)
+--- bound to a new stub database.
+local function Load()
+    local stub = StubDatabase.New()
+    _G.api = {
+        database = stub:Install(),
+        debug = { Trace = function() end }
+    }
+    package.loaded[moduleName] = nil
+    package.loaded["forgeutils.logger"] = nil
+    package.preload["forgeutils.prefabs.train"] = function() return {} end
+    return require(moduleName), stub
+end
+
+local function AssertEqual(actual, expected, message)
+    if actual ~= expected then
+        error((message or "values differ") .. ": expected " .. tostring(expected) .. ", got " .. tostring(actual), 2)
+    end
+end
+
+local tests = {}
+
+tests["queries outside a scope toggle read-only and get a new instance each time"] = function()
+    local DatabaseUtils, stub = Load()
+
+    DatabaseUtils.ExecuteQuery("TrackedRides", "Cars__Insert", { 1, "A" }, 2)
+    DatabaseUtils.ExecuteQuery("TrackedRides", "Cars__Insert", { 2, "B" }, 2)
+
+    AssertEqual(stub:Count("SetReadOnly TrackedRides false"), 2)
+    AssertEqual(stub:Count("SetReadOnly TrackedRides true"), 2)
+    AssertEqual(stub.instanceCount, 2)
+end
+
+tests["a scope makes the database writable once and reuses instances"] = function()
+    local DatabaseUtils, stub = Load()
+
+    DatabaseUtils.WithWriteScope("TrackedRides", function()
+        DatabaseUtils.ExecuteQuery("TrackedRides", "Cars__Insert", { 1, "A" }, 2)
+        DatabaseUtils.ExecuteQuery("TrackedRides", "Cars__Insert", { 2, "B" }, 2)
+        DatabaseUtils.ExecuteQuery("TrackedRides", "Cars__Insert", { 3, "C" }, 2)
+        DatabaseUtils.ExecuteQuery("TrackedRides", "Trains__Insert", { 1 }, 1)
+    end)
+
+    AssertEqual(stub:Count("SetReadOnly TrackedRides false"), 1)
+    AssertEqual(stub:Count("SetReadOnly TrackedRides true"), 1)
+    AssertEqual(stub.calls[#stub.calls], "SetReadOnly TrackedRides true", "read-only is restored last")
+    AssertEqual(stub:Count("GetInstance TrackedRides Cars__Insert"), 1)
+    AssertEqual(stub:Count("GetInstance TrackedRides Trains__Insert"), 1)
+    AssertEqual(stub:Count("Step 1"), 3)
+end
+
+tests["a nil argument gets a fresh instance inside a scope"] = function()
+    local DatabaseUtils, stub = Load()
+
+    DatabaseUtils.WithWriteScope("TrackedRides", function()
+        DatabaseUtils.ExecuteQuery("TrackedRides", "Cars__Insert", { 1, "A" }, 2)
+        -- The reused instance would still have "A" bound to parameter 2.
+        DatabaseUtils.ExecuteQuery("TrackedRides", "Cars__Insert", { 2, nil }, 2)
+        DatabaseUtils.ExecuteQuery("TrackedRides", "Cars__Insert", { 3, "C" }, 2)
+    end)
+
+    AssertEqual(stub:Count("GetInstance TrackedRides Cars__Insert"), 2)
+    AssertEqual(stub:Count("Step 1"), 1)
+    AssertEqual(stub:Count("Step 2"), 2)
+    AssertEqual(stub:Count("Bind 2 2 nil"), 0, "nil arguments are not bound")
+end
+
+tests["scopes return the results of fn"] = function()
+    local DatabaseUtils = Load()
+
+    local a, b, c = DatabaseUtils.WithWriteScope("TrackedRides", function()
+        return 1, nil, "three"
+    end)
+
+    AssertEqual(a, 1)
+    AssertEqual(b, nil)
+    AssertEqual(c, "three")
+end
+
+tests["nested scopes only open and close the outer one"] = function()
+    local DatabaseUtils, stub = Load()
+
+    local result = DatabaseUtils.WithWriteScope("TrackedRides", function()
+        DatabaseUtils.ExecuteQuery("TrackedRides", "Cars__Insert", { 1, "A" }, 2)
+        local inner = DatabaseUtils.WithWriteScope("TrackedRides", function()
+            DatabaseUtils.ExecuteQuery("TrackedRides", "Cars__Insert", { 2, "B" }, 2)
+            return "inner"
+        end)
+        AssertEqual(stub:Count("SetReadOnly TrackedRides true"), 0, "still writable after the inner scope")
+        DatabaseUtils.ExecuteQuery("TrackedRides", "Cars__Insert", { 3, "C" }, 2)
+        return inner
+    end)
+
+    AssertEqual(result, "inner")
+    AssertEqual(stub:Count("SetReadOnly TrackedRides false"), 1)
+    AssertEqual(stub:Count("SetReadOnly TrackedRides true"), 1)
+    AssertEqual(stub:Count("GetInstance TrackedRides Cars__Insert"), 1)
+end
+
+tests["scopes on different databases are independent"] = function()
+    local DatabaseUtils, stub = Load()
+
+    DatabaseUtils.WithWriteScope("TrackedRides", function()
+        DatabaseUtils.ExecuteQuery("TrackedRideCars", "Cars__Insert", { 1 }, 1)
+        DatabaseUtils.ExecuteQuery("TrackedRideCars", "Cars__Insert", { 2 }, 1)
+    end)
+
+    AssertEqual(stub:Count("SetReadOnly TrackedRideCars false"), 2)
+    AssertEqual(stub:Count("SetReadOnly TrackedRideCars true"), 2)
+    AssertEqual(stub:Count("GetInstance TrackedRideCars Cars__Insert"), 2)
+end
+
+tests["an error in fn is re-raised after restoring read-only"] = function()
+    local DatabaseUtils, stub = Load()
+
+    local bSuccess, message = pcall(DatabaseUtils.WithWriteScope, "TrackedRides", function()
+        DatabaseUtils.ExecuteQuery("TrackedRides", "Cars__Insert", { 1, "A" }, 2)
+        error("insert failed", 0)
+    end)
+
+    AssertEqual(bSuccess, false)
+    AssertEqual(message, "insert failed")
+    AssertEqual(stub:Count("SetReadOnly TrackedRides true"), 1)
+
+    -- The scope is closed, so the next query toggles read-only and gets
+    -- a new instance again.
+    DatabaseUtils.ExecuteQuery("TrackedRides", "Cars__Insert", { 2, "B" }, 2)
+    AssertEqual(stub:Count("SetReadOnly TrackedRides false"), 2)
+    AssertEqual(stub:Count("GetInstance TrackedRides Cars__Insert"), 2)
+end
+
+tests["an error in a nested scope unwinds the outer scope once"] = function()
+    local DatabaseUtils, stub = Load()
+
+    local bSuccess, message = pcall(DatabaseUtils.WithWriteScope, "TrackedRides", function()
+        DatabaseUtils.WithWriteScope("TrackedRides", function()
+            error({ code = 7 })
+        end)
+    end)
+
+    AssertEqual(bSuccess, false)
+    AssertEqual(type(message), "table", "error values are passed through")
+    AssertEqual(message.code, 7)
+    AssertEqual(stub:Count("SetReadOnly TrackedRides false"), 1)
+    AssertEqual(stub:Count("SetReadOnly TrackedRides true"), 1)
+
+    -- A new scope can be opened afterwards.
+    DatabaseUtils.WithWriteScope("TrackedRides", function() end)
+    AssertEqual(stub:Count("SetReadOnly TrackedRides false"), 2)
+end
+
+tests["binding inside a scope leaves the database writable"] = function()
+    local DatabaseUtils, stub = Load()
+
+    DatabaseUtils.WithWriteScope("TrackedRides", function()
+        AssertEqual(DatabaseUtils.BindPreparedStatement("TrackedRides", "TrackedRides_Cars"), true)
+    end)
+    AssertEqual(stub:Count("SetReadOnly TrackedRides false"), 1)
+
+    stub.bindResult = false
+    AssertEqual(DatabaseUtils.BindPreparedStatement("TrackedRides", "TrackedRides_Cars"), false)
+    AssertEqual(stub:Count("SetReadOnly TrackedRides false"), 2)
+    AssertEqual(stub:Count("SetReadOnly TrackedRides true"), 2)
+end
+
+local names = {}
+for name, _ in pairs(tests) do
+    names[#names + 1] = name
+end
+table.sort(names)
+
+local failures = 0
+for _, name in ipairs(names) do
+    local bSuccess, message = pcall(tests[name])
+    if bSuccess then
+        print("ok   " .. name)
+    else
+        failures = failures + 1
+        print("FAIL " .. name .. ": " .. tostring(message))
+    end
+end
+
+print(#names - failures .. "/" .. #names .. " passed")
+if failures > 0 then
+    os.exit(1)
+end